@@ -1,3 +1,4 @@
+import json
 import os
 
 from dotenv import load_dotenv
@@ -7,6 +8,53 @@ from app.core.exceptions.exceptions import AppConfigError
 # .env 파일에서 환경 변수를 로드합니다.
 load_dotenv()
 
+
+def _get_int_env(name: str, default: int) -> int:
+    """정수형 환경 변수를 읽습니다. 형식이 잘못되면 AppConfigError로 앱 시작을 중단합니다."""
+    raw = os.getenv(name)
+    if raw is None or raw.strip() == "":
+        return default
+    try:
+        return int(raw)
+    except ValueError:
+        raise AppConfigError(f"환경 변수 '{name}'는 정수여야 합니다. 예: {default}")
+
+
+def _get_bool_env(name: str, default: bool) -> bool:
+    """불리언 환경 변수를 읽습니다. (true/false, 1/0, yes/no 허용)"""
+    raw = os.getenv(name)
+    if raw is None or raw.strip() == "":
+        return default
+    value = raw.strip().lower()
+    if value in ("1", "true", "yes", "on"):
+        return True
+    if value in ("0", "false", "no", "off"):
+        return False
+    raise AppConfigError(f"환경 변수 '{name}'는 true/false 값이어야 합니다.")
+
+
+def _get_json_env(name: str, default: dict) -> dict:
+    """JSON 객체 형식의 환경 변수를 읽습니다."""
+    raw = os.getenv(name)
+    if raw is None or raw.strip() == "":
+        return default
+    try:
+        value = json.loads(raw)
+    except json.JSONDecodeError:
+        raise AppConfigError(f"환경 변수 '{name}'는 JSON 객체여야 합니다.")
+    if not isinstance(value, dict):
+        raise AppConfigError(f"환경 변수 '{name}'는 JSON 객체여야 합니다.")
+    return value
+
+
+def _get_list_env(name: str, default: list) -> list:
+    """쉼표로 구분된 문자열 목록 환경 변수를 읽습니다. (빈 항목은 무시)"""
+    raw = os.getenv(name)
+    if raw is None or raw.strip() == "":
+        return default
+    return [item.strip() for item in raw.split(",") if item.strip()]
+
+
 # Firebase 설정
 FIREBASE_KEY_PATH = os.getenv("FIREBASE_SERVICE_ACCOUNT_KEY")
 
@@ -27,4 +75,195 @@ except ValueError:
 
 # LLM(Gemini) 설정
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
-GEMINI_MODEL_NAME = os.getenv("GEMINI_MODEL_NAME", "gemini-1.5-flash")
\ No newline at end of file
+GEMINI_MODEL_NAME = os.getenv("GEMINI_MODEL_NAME", "gemini-1.5-flash")
+
+# LLM 응답 캐시 설정
+LLM_CACHE_ENABLED = _get_bool_env("LLM_CACHE_ENABLED", True)
+LLM_CACHE_TTL_SECONDS = _get_int_env("LLM_CACHE_TTL_SECONDS", 600)
+LLM_CACHE_MAX_ENTRIES = _get_int_env("LLM_CACHE_MAX_ENTRIES", 1024)
+LLM_CACHE_MAX_BYTES = _get_int_env("LLM_CACHE_MAX_BYTES", 32 * 1024 * 1024)
+
+# Gemini 동시 요청 제한 설정
+GEMINI_MAX_CONCURRENCY = _get_int_env("GEMINI_MAX_CONCURRENCY", 16)
+GEMINI_MAX_QUEUE = _get_int_env("GEMINI_MAX_QUEUE", 64)
+GEMINI_MODEL_POOL_SIZE = _get_int_env("GEMINI_MODEL_POOL_SIZE", 32)
+
+# LLM 배치 요청 설정
+LLM_BATCH_MAX_ITEMS = _get_int_env("LLM_BATCH_MAX_ITEMS", 20)
+LLM_BATCH_CONCURRENCY = _get_int_env("LLM_BATCH_CONCURRENCY", 4)
+
+# LLM 이미지 전처리 설정
+LLM_IMAGE_PREPROCESS_ENABLED = _get_bool_env("LLM_IMAGE_PREPROCESS_ENABLED", True)
+LLM_IMAGE_MAX_DIMENSION = _get_int_env("LLM_IMAGE_MAX_DIMENSION", 1568)
+LLM_IMAGE_OUTPUT_FORMAT = os.getenv("LLM_IMAGE_OUTPUT_FORMAT", "JPEG").upper()
+LLM_IMAGE_QUALITY = _get_int_env("LLM_IMAGE_QUALITY", 85)
+LLM_IMAGE_WORKERS = _get_int_env("LLM_IMAGE_WORKERS", 2)
+
+if LLM_IMAGE_OUTPUT_FORMAT not in ("JPEG", "WEBP"):
+    raise AppConfigError("환경 변수 'LLM_IMAGE_OUTPUT_FORMAT'는 JPEG 또는 WEBP여야 합니다.")
+
+# LLM 프롬프트 토큰 예산 설정 (0이면 문맥을 자르지 않습니다)
+LLM_PROMPT_TOKEN_BUDGET = _get_int_env("LLM_PROMPT_TOKEN_BUDGET", 8000)
+
+# Gemini 타임아웃/재시도/헤징/서킷 브레이커 설정
+GEMINI_TIMEOUT_MS = _get_int_env("GEMINI_TIMEOUT_MS", 30000)
+GEMINI_MAX_RETRIES = _get_int_env("GEMINI_MAX_RETRIES", 2)
+GEMINI_RETRY_BASE_DELAY_MS = _get_int_env("GEMINI_RETRY_BASE_DELAY_MS", 200)
+GEMINI_HEDGE_PERCENTILE = _get_int_env("GEMINI_HEDGE_PERCENTILE", 0)  # 0이면 헤징 비활성화
+GEMINI_CIRCUIT_FAILURE_THRESHOLD = _get_int_env("GEMINI_CIRCUIT_FAILURE_THRESHOLD", 5)
+GEMINI_CIRCUIT_RECOVERY_SECONDS = _get_int_env("GEMINI_CIRCUIT_RECOVERY_SECONDS", 30)
+
+# LLM 모델 라우팅 설정
+# 티어 이름 -> 모델명. 예: {"fast": "gemini-1.5-flash-8b", "standard": "gemini-1.5-flash"}
+# 기본값은 비활성화(항상 standard = GEMINI_MODEL_NAME)이며, 켜면 비용/지연이 달라지므로 명시적으로 설정합니다.
+LLM_ROUTING_ENABLED = _get_bool_env("LLM_ROUTING_ENABLED", False)
+LLM_MODEL_TIERS = _get_json_env(
+    "LLM_MODEL_TIERS",
+    {
+        "fast": "gemini-1.5-flash-8b",
+        "standard": GEMINI_MODEL_NAME,
+        "advanced": "gemini-1.5-pro",
+    },
+)
+LLM_ROUTING_FAST_MAX_TOKENS = _get_int_env("LLM_ROUTING_FAST_MAX_TOKENS", 400)
+LLM_ROUTING_ADVANCED_MIN_IMAGES = _get_int_env("LLM_ROUTING_ADVANCED_MIN_IMAGES", 2)
+# 클라이언트가 model_tier 힌트로 고를 수 있는 티어 (가장 비싼 advanced는 기본적으로 제외)
+LLM_ROUTING_CLIENT_TIERS = _get_list_env("LLM_ROUTING_CLIENT_TIERS", ["fast", "standard"])
+
+if "standard" not in LLM_MODEL_TIERS:
+    raise AppConfigError("환경 변수 'LLM_MODEL_TIERS'에는 'standard' 티어가 반드시 필요합니다.")
+
+# LLM 유사 프롬프트(SimHash) 캐시 설정
+LLM_SEMANTIC_CACHE_ENABLED = _get_bool_env("LLM_SEMANTIC_CACHE_ENABLED", True)
+LLM_SEMANTIC_CACHE_MAX_DISTANCE = _get_int_env("LLM_SEMANTIC_CACHE_MAX_DISTANCE", 3)
+LLM_SEMANTIC_CACHE_MAX_ENTRIES = _get_int_env("LLM_SEMANTIC_CACHE_MAX_ENTRIES", 100000)
+LLM_SEMANTIC_CACHE_TTL_SECONDS = _get_int_env("LLM_SEMANTIC_CACHE_TTL_SECONDS", 3600)
+
+# LLM 비동기 작업(job) 설정
+LLM_JOB_WORKERS = _get_int_env("LLM_JOB_WORKERS", 4)
+LLM_JOB_QUEUE_SIZE = _get_int_env("LLM_JOB_QUEUE_SIZE", 100)
+LLM_JOB_RESULT_TTL_SECONDS = _get_int_env("LLM_JOB_RESULT_TTL_SECONDS", 600)
+
+# LLM 백엔드 설정 (부하 테스트용 기록/재생)
+# - gemini: 실제 Gemini 호출
+# - record: 실제 Gemini를 호출하면서 프롬프트 해시/응답/지연 시간을 LLM_RECORDING_PATH에 기록
+# - replay: LLM_RECORDING_PATH의 기록으로 오프라인 응답 (GEMINI_API_KEY 불필요)
+LLM_BACKEND = os.getenv("LLM_BACKEND", "gemini").lower()
+LLM_RECORDING_PATH = os.getenv("LLM_RECORDING_PATH", "llm_recording.jsonl.gz")
+# recorded: 같은 프롬프트의 기록된 지연 시간 / synthetic: 기록 전체에 맞춘 로그정규 분포에서 추출 / none: 지연 없음
+LLM_REPLAY_LATENCY = os.getenv("LLM_REPLAY_LATENCY", "recorded").lower()
+# 기록에 없는 프롬프트도 기록된 응답 중 하나로 대신 응답할지 여부 (false면 오류)
+LLM_REPLAY_ALLOW_MISS = _get_bool_env("LLM_REPLAY_ALLOW_MISS", True)
+LLM_REPLAY_SEED = _get_int_env("LLM_REPLAY_SEED", 0)
+
+if LLM_BACKEND not in ("gemini", "record", "replay"):
+    raise AppConfigError("환경 변수 'LLM_BACKEND'는 gemini, record, replay 중 하나여야 합니다.")
+
+if LLM_REPLAY_LATENCY not in ("recorded", "synthetic", "none"):
+    raise AppConfigError("환경 변수 'LLM_REPLAY_LATENCY'는 recorded, synthetic, none 중 하나여야 합니다.")
+
+# LLM 이미지 URL 수집 및 Gemini Files API 업로드 설정
+# URL 이미지는 서버가 직접 받아 한 번만 업로드하고, 파일 핸들을 콘텐츠 해시 기준으로 재사용합니다.
+LLM_IMAGE_UPLOAD_ENABLED = _get_bool_env("LLM_IMAGE_UPLOAD_ENABLED", True)
+LLM_IMAGE_FETCH_MAX_BYTES = _get_int_env("LLM_IMAGE_FETCH_MAX_BYTES", 20 * 1024 * 1024)
+LLM_IMAGE_FETCH_TIMEOUT_MS = _get_int_env("LLM_IMAGE_FETCH_TIMEOUT_MS", 10000)
+LLM_IMAGE_FETCH_MAX_CONNECTIONS = _get_int_env("LLM_IMAGE_FETCH_MAX_CONNECTIONS", 20)
+# URL 이미지를 받아올 수 있는 호스트 (쉼표 구분, "*.example.com" 형식 허용)
+# 비어 있으면 호스트 제한은 없지만, 어느 경우든 내부/예약 IP로 해석되는 주소는 받지 않습니다.
+LLM_IMAGE_FETCH_ALLOWED_HOSTS = [host.lower() for host in _get_list_env("LLM_IMAGE_FETCH_ALLOWED_HOSTS", [])]
+# 따라갈 최대 리다이렉트 횟수 (매 단계 같은 규칙으로 다시 검사합니다)
+LLM_IMAGE_FETCH_MAX_REDIRECTS = _get_int_env("LLM_IMAGE_FETCH_MAX_REDIRECTS", 3)
+# Base64 이미지도 이 크기(바이트) 이상이면 업로드 후 핸들로 참조합니다. (0이면 Base64는 항상 인라인)
+LLM_IMAGE_UPLOAD_MIN_BYTES = _get_int_env("LLM_IMAGE_UPLOAD_MIN_BYTES", 512 * 1024)
+# Files API 파일은 48시간 후 만료되므로 여유를 두고 재사용합니다.
+LLM_FILE_HANDLE_TTL_SECONDS = _get_int_env("LLM_FILE_HANDLE_TTL_SECONDS", 47 * 3600)
+LLM_FILE_HANDLE_CACHE_MAX_ENTRIES = _get_int_env("LLM_FILE_HANDLE_CACHE_MAX_ENTRIES", 4096)
+# URL -> 콘텐츠 해시 캐시 (사전 서명 URL의 유효 기간보다 짧게)
+LLM_IMAGE_URL_CACHE_TTL_SECONDS = _get_int_env("LLM_IMAGE_URL_CACHE_TTL_SECONDS", 900)
+
+# 외부 API 호출용 공유 HTTP 클라이언트 기본 설정 (클라이언트별로 덮어쓸 수 있습니다)
+HTTP_CLIENT_CONNECT_TIMEOUT_MS = _get_int_env("HTTP_CLIENT_CONNECT_TIMEOUT_MS", 3000)
+HTTP_CLIENT_READ_TIMEOUT_MS = _get_int_env("HTTP_CLIENT_READ_TIMEOUT_MS", 10000)
+HTTP_CLIENT_MAX_CONNECTIONS = _get_int_env("HTTP_CLIENT_MAX_CONNECTIONS", 50)
+HTTP_CLIENT_MAX_KEEPALIVE = _get_int_env("HTTP_CLIENT_MAX_KEEPALIVE", 20)
+HTTP_CLIENT_KEEPALIVE_EXPIRY_SECONDS = _get_int_env("HTTP_CLIENT_KEEPALIVE_EXPIRY_SECONDS", 60)
+# h2 패키지가 설치되어 있을 때만 HTTP/2를 사용합니다.
+HTTP_CLIENT_HTTP2_ENABLED = _get_bool_env("HTTP_CLIENT_HTTP2_ENABLED", True)
+
+# Kakao 토큰 검증 결과 캐시 설정
+# 유효한 토큰은 min(KAKAO_TOKEN_CACHE_TTL_SECONDS, 토큰 남은 수명) 동안,
+# 남은 수명을 모르면(토큰 정보 조회를 끄거나 실패한 경우) KAKAO_TOKEN_UNKNOWN_EXPIRY_TTL_SECONDS 동안,
+# Kakao가 거절한 토큰(400/401)은 KAKAO_TOKEN_NEGATIVE_TTL_SECONDS 동안 재사용합니다.
+KAKAO_TOKEN_CACHE_ENABLED = _get_bool_env("KAKAO_TOKEN_CACHE_ENABLED", True)
+KAKAO_TOKEN_CACHE_TTL_SECONDS = _get_int_env("KAKAO_TOKEN_CACHE_TTL_SECONDS", 300)
+KAKAO_TOKEN_NEGATIVE_TTL_SECONDS = _get_int_env("KAKAO_TOKEN_NEGATIVE_TTL_SECONDS", 30)
+KAKAO_TOKEN_UNKNOWN_EXPIRY_TTL_SECONDS = _get_int_env("KAKAO_TOKEN_UNKNOWN_EXPIRY_TTL_SECONDS", 30)
+KAKAO_TOKEN_CACHE_MAX_ENTRIES = _get_int_env("KAKAO_TOKEN_CACHE_MAX_ENTRIES", 10000)
+# 캐시 TTL을 토큰 남은 수명으로 줄이기 위해 /v1/user/access_token_info도 함께 호출할지 여부
+# (로그인마다 Kakao 호출이 2배가 되므로 기본값은 끄고, 대신 짧은 KAKAO_TOKEN_UNKNOWN_EXPIRY_TTL_SECONDS를 사용합니다.)
+KAKAO_TOKEN_INFO_ENABLED = _get_bool_env("KAKAO_TOKEN_INFO_ENABLED", False)
+
+# Firebase ID 토큰 자체 검증 설정
+# 프로젝트 ID가 없으면 서비스 계정 키 파일의 project_id를 사용합니다.
+FIREBASE_PROJECT_ID = os.getenv("FIREBASE_PROJECT_ID")
+FIREBASE_NATIVE_VERIFY_ENABLED = _get_bool_env("FIREBASE_NATIVE_VERIFY_ENABLED", True)
+# 이미 검증한 토큰(해시)의 결과를 재사용하는 시간. 토큰 만료 시각을 넘지 않습니다.
+FIREBASE_VERIFIED_TOKEN_TTL_SECONDS = _get_int_env("FIREBASE_VERIFIED_TOKEN_TTL_SECONDS", 60)
+FIREBASE_VERIFIED_TOKEN_CACHE_MAX_ENTRIES = _get_int_env("FIREBASE_VERIFIED_TOKEN_CACHE_MAX_ENTRIES", 10000)
+
+# 로그인 시각(last_login_at) 지연 쓰기(write-behind) 설정
+# 켜져 있으면 프로필 캐시에 같은 프로필로 올라 있는 사용자의 재로그인은 Firestore에 바로 쓰지 않고
+# 메모리에 모았다가 주기적으로(그리고 종료 시) 일괄 기록합니다.
+LOGIN_WRITE_BEHIND_ENABLED = _get_bool_env("LOGIN_WRITE_BEHIND_ENABLED", False)
+LOGIN_WRITE_BEHIND_FLUSH_SECONDS = _get_int_env("LOGIN_WRITE_BEHIND_FLUSH_SECONDS", 10)
+LOGIN_WRITE_BEHIND_MAX_PENDING = _get_int_env("LOGIN_WRITE_BEHIND_MAX_PENDING", 5000)
+
+# 사용자 프로필(UserInDB) 읽기 캐시 설정 (uid 기준, 프로세스 내)
+USER_PROFILE_CACHE_ENABLED = _get_bool_env("USER_PROFILE_CACHE_ENABLED", True)
+USER_PROFILE_CACHE_TTL_SECONDS = _get_int_env("USER_PROFILE_CACHE_TTL_SECONDS", 300)
+USER_PROFILE_CACHE_MAX_ENTRIES = _get_int_env("USER_PROFILE_CACHE_MAX_ENTRIES", 10000)
+
+# Kakao 사용자 ID -> Firebase UID 인덱스 (프로세스 내 캐시)
+# 연결은 거의 바뀌지 않으므로 길게 보관하고, 사용자가 삭제된 경우에만 다시 찾습니다.
+KAKAO_UID_INDEX_TTL_SECONDS = _get_int_env("KAKAO_UID_INDEX_TTL_SECONDS", 86400)
+KAKAO_UID_INDEX_MAX_ENTRIES = _get_int_env("KAKAO_UID_INDEX_MAX_ENTRIES", 100000)
+
+# API Access Token 검증 결과 캐시 및 폐기 목록 설정 (get_current_user 의존성)
+ACCESS_TOKEN_CACHE_TTL_SECONDS = _get_int_env("ACCESS_TOKEN_CACHE_TTL_SECONDS", 300)
+ACCESS_TOKEN_CACHE_MAX_ENTRIES = _get_int_env("ACCESS_TOKEN_CACHE_MAX_ENTRIES", 10000)
+# 폐기 목록은 만료 전에 축출하지 않으며, 가득 차면 로그아웃이 429로 거절됩니다.
+ACCESS_TOKEN_REVOCATION_MAX_ENTRIES = _get_int_env("ACCESS_TOKEN_REVOCATION_MAX_ENTRIES", 100000)
+
+# Refresh Token 설정 (회전 방식: 사용할 때마다 새 토큰으로 교체, 이전 토큰 재사용 시 계열 전체 폐기)
+REFRESH_TOKEN_EXPIRE_DAYS = _get_int_env("REFRESH_TOKEN_EXPIRE_DAYS", 30)
+# 응답을 받지 못한 클라이언트의 재시도처럼, 직전 토큰이 이 시간 안에 다시 오면 재사용으로 보지 않습니다.
+REFRESH_TOKEN_REUSE_GRACE_SECONDS = _get_int_env("REFRESH_TOKEN_REUSE_GRACE_SECONDS", 10)
+
+# 이메일/비밀번호 로그인 설정
+# BCRYPT_ROUNDS를 바꾸면 기존 해시는 다음 로그인 때 새 비용으로 다시 해시됩니다.
+BCRYPT_ROUNDS = _get_int_env("BCRYPT_ROUNDS", 12)
+# 비밀번호 해시 전용 프로세스 수 (이벤트 루프와 다른 요청에 영향을 주지 않도록 별도 프로세스에서 실행)
+PASSWORD_HASH_WORKERS = _get_int_env("PASSWORD_HASH_WORKERS", min(4, os.cpu_count() or 1))
+# 모든 프로세스가 바쁠 때 기다릴 수 있는 요청 수. 넘치면 즉시 429로 거절합니다.
+PASSWORD_HASH_MAX_QUEUE = _get_int_env("PASSWORD_HASH_MAX_QUEUE", 32)
+
+if not 4 <= BCRYPT_ROUNDS <= 31:
+    raise AppConfigError("환경 변수 'BCRYPT_ROUNDS'는 4~31 사이의 정수여야 합니다.")
+
+# 요청 빈도 제한(rate limit) 설정
+# "메서드 경로패턴"(메서드 생략 가능, * 와일드카드) -> {"requests": 기간당 요청 수, "period_seconds": 기간, "burst": 순간 허용량}
+# 인증된 요청은 uid, 그 외에는 클라이언트 IP 기준으로 정책별 토큰 버킷을 둡니다. 먼저 일치하는 정책 하나만 적용됩니다.
+RATE_LIMIT_ENABLED = _get_bool_env("RATE_LIMIT_ENABLED", True)
+RATE_LIMIT_POLICIES = _get_json_env(
+    "RATE_LIMIT_POLICIES",
+    {
+        "POST /llm/chat*": {"requests": 30, "period_seconds": 60, "burst": 10},
+        "POST /auth/*/login": {"requests": 10, "period_seconds": 60, "burst": 5},
+        "POST /auth/email/signup": {"requests": 5, "period_seconds": 600, "burst": 3},
+        "POST /auth/refresh": {"requests": 30, "period_seconds": 60, "burst": 10},
+    },
+)
+RATE_LIMIT_SHARDS = _get_int_env("RATE_LIMIT_SHARDS", 16)
+RATE_LIMIT_MAX_KEYS = _get_int_env("RATE_LIMIT_MAX_KEYS", 100000)
+# 프록시/로드밸런서 뒤에서만 켜세요. 켜면 X-Forwarded-For의 첫 주소를 클라이언트 IP로 사용합니다.
+RATE_LIMIT_TRUST_FORWARDED_FOR = _get_bool_env("RATE_LIMIT_TRUST_FORWARDED_FOR", False)
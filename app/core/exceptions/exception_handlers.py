@@ -24,4 +24,5 @@ async def custom_exception_handler(request: Request, exc: CustomException):
             error_code=exc.error_code,
             message=exc.message,
         ).model_dump(),
+        headers=exc.headers,
     )
\ No newline at end of file
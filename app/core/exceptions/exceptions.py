@@ -12,6 +12,9 @@
      일관된 JSON 형식의 HTTP 응답으로 변환됩니다.
 """
 
+import math
+from typing import Dict, Optional
+
 
 # --- 1. Startup Configuration Error ---
 
@@ -44,10 +47,12 @@ class CustomException(Exception):
             status_code: int = 500,
             error_code: str = "INTERNAL_SERVER_ERROR",
             message: str = "서버 내부 오류가 발생했습니다.",
+            headers: Optional[Dict[str, str]] = None,
     ):
         self.status_code = status_code
         self.error_code = error_code  # 프론트엔드와 규약할 수 있는 문자열 코드
         self.message = message
+        self.headers = headers  # 응답에 함께 보낼 HTTP 헤더 (예: Retry-After)
         super().__init__(self.message)
 
 
@@ -80,6 +85,46 @@ class InvalidTokenError(CustomException):
         )
 
 
+class TokenRevokedError(CustomException):
+    """
+    로그아웃 등으로 폐기된 우리 API 토큰이 사용되었을 때 발생하는 예외.
+    """
+
+    def __init__(self, message: str = "로그아웃된 토큰입니다. 다시 로그인하세요."):
+        super().__init__(
+            status_code=401,
+            error_code="TOKEN_REVOKED",
+            message=message
+        )
+
+
+class InvalidCredentialsError(CustomException):
+    """
+    이메일/비밀번호 로그인에서 계정이 없거나 비밀번호가 틀렸을 때 발생하는 예외.
+    (어느 쪽인지는 응답에 드러내지 않습니다.)
+    """
+
+    def __init__(self, message: str = "이메일 또는 비밀번호가 올바르지 않습니다."):
+        super().__init__(
+            status_code=401,
+            error_code="INVALID_CREDENTIALS",
+            message=message
+        )
+
+
+class AccountAlreadyExistsError(CustomException):
+    """
+    이미 가입된 이메일로 회원가입을 시도했을 때 발생하는 예외.
+    """
+
+    def __init__(self, message: str = "이미 가입된 이메일입니다."):
+        super().__init__(
+            status_code=409,
+            error_code="ACCOUNT_ALREADY_EXISTS",
+            message=message
+        )
+
+
 class TokenVerificationError(CustomException):
     """
     토큰 검증 중 Firebase/Google 서버 통신 오류 등
@@ -96,8 +141,8 @@ class TokenVerificationError(CustomException):
 
 class AuthInitError(CustomException):
     """
-    (런타임) Firebase Auth가 초기화되지 않았는데
-    auth_client를 사용하려고 할 때.
+    (런타임) Firebase Auth를 초기화할 수 없는 상태에서
+    Firebase Auth를 사용하려고 할 때.
     """
 
     def __init__(self, message: str = "Firebase Auth가 초기화되지 않았습니다. 서버 설정을 확인하세요."):
@@ -149,4 +194,92 @@ class ExternalApiError(CustomException):
             status_code=502,  # 502 Bad Gateway
             error_code="EXTERNAL_API_FAILED",
             message=message
-        )
\ No newline at end of file
+        )
+
+class UpstreamTimeoutError(CustomException):
+    """
+    외부 API(Gemini 등)가 요청 기한(deadline) 안에 응답하지 않았을 때.
+    """
+
+    def __init__(self, message: str = "외부 API 응답 시간이 초과되었습니다. 잠시 후 다시 시도하세요."):
+        super().__init__(
+            status_code=504,  # 504 Gateway Timeout
+            error_code="UPSTREAM_TIMEOUT",
+            message=message
+        )
+
+
+# --- 6. Specific Runtime Exceptions (Overload) ---
+
+class TooManyRequestsError(CustomException):
+    """
+    서버가 처리할 수 있는 동시 요청 한도(대기열 포함)를 초과했을 때.
+    클라이언트는 잠시 후 재시도해야 합니다.
+    """
+
+    def __init__(self, message: str = "요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도하세요."):
+        super().__init__(
+            status_code=429,  # 429 Too Many Requests
+            error_code="TOO_MANY_REQUESTS",
+            message=message
+        )
+
+
+# --- 7. Specific Runtime Exceptions (LLM Input) ---
+
+class RateLimitExceededError(CustomException):
+    """
+    클라이언트(사용자 또는 IP)가 라우트별 요청 빈도 한도를 넘었을 때.
+    Retry-After 헤더로 다시 시도할 수 있는 시점(초)을 알려줍니다.
+    """
+
+    def __init__(
+            self,
+            retry_after_seconds: float,
+            message: str = "요청이 너무 잦습니다. 잠시 후 다시 시도하세요.",
+    ):
+        super().__init__(
+            status_code=429,  # 429 Too Many Requests
+            error_code="RATE_LIMITED",
+            message=message,
+            headers={"Retry-After": str(max(1, math.ceil(retry_after_seconds)))}
+        )
+
+
+class InvalidImageError(CustomException):
+    """
+    전달된 이미지 데이터를 디코딩할 수 없을 때. (잘못된 Base64, 지원하지 않는 형식 등)
+    """
+
+    def __init__(self, message: str = "이미지 데이터를 읽을 수 없습니다. 형식을 확인하세요."):
+        super().__init__(
+            status_code=400,
+            error_code="INVALID_IMAGE",
+            message=message
+        )
+
+
+class InvalidBoardingPassError(CustomException):
+    """
+    IATA BCBP(Bar Coded Boarding Pass) 문자열 형식이 올바르지 않을 때.
+    """
+
+    def __init__(self, message: str = "탑승권 바코드(BCBP) 형식이 올바르지 않습니다."):
+        super().__init__(
+            status_code=400,
+            error_code="INVALID_BOARDING_PASS",
+            message=message
+        )
+
+
+class JobNotFoundError(CustomException):
+    """
+    요청한 비동기 작업(job)이 없거나 결과 보관 기간이 지나 만료되었을 때.
+    """
+
+    def __init__(self, message: str = "작업을 찾을 수 없습니다. 만료되었을 수 있습니다."):
+        super().__init__(
+            status_code=404,
+            error_code="JOB_NOT_FOUND",
+            message=message
+        )
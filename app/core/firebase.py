@@ -1,45 +1,146 @@
-import firebase_admin
-from firebase_admin import auth, credentials, firestore
+import asyncio
+import importlib
+import threading
 
 from app.core.config import FIREBASE_KEY_PATH
 from app.core.exceptions.exceptions import AppConfigError
 
-# 모듈 레벨에서 변수를 선언합니다.
-# 초기화에 실패하면 이 변수들은 None으로 남겠지만,
-# 그 전에 예외가 발생하여 앱 시작이 중단될 것입니다.
-db = None
-auth_client = None
-
-# 1. .env 설정 확인 (Fail Fast 1)
-if not FIREBASE_KEY_PATH:
-    raise AppConfigError(
-        "환경 변수 'FIREBASE_SERVICE_ACCOUNT_KEY'가 설정되지 않았습니다. .env 파일을 확인하세요."
-    )
-
-try:
-    # 2. 서비스 키 파일 유효성 검사 (Fail Fast 2)
-    # FileNotFoundError, ValueError 등을 발생시킬 수 있습니다.
-    cred = credentials.Certificate(FIREBASE_KEY_PATH)
-
-    # 3. Firebase Admin SDK 초기화 (Fail Fast 3)
-    # 이미 초기화되었으면 에러가 발생할 수 있습니다. (지금 구조에선 괜찮음)
-    firebase_admin.initialize_app(cred)
-
-    # 4. 클라이언트 생성
-    # 성공적으로 초기화된 경우에만 클라이언트를 할당합니다.
-    db = firestore.client()
-    auth_client = auth
-
-    print("Firebase Admin SDK가 성공적으로 초기화되었습니다. (Firestore, Auth)")
-
-except ValueError as e:
-    # credentials.Certificate()가 실패한 경우 (e.g., 파일은 있으나 JSON 형식이 아님)
-    raise AppConfigError(f"Firebase 서비스 키 파일이 유효하지 않습니다: {e}")
-except FileNotFoundError:
-    # credentials.Certificate()가 실패한 경우 (파일 경로가 잘못됨)
-    raise AppConfigError(
-        f"Firebase 서비스 키 파일을 찾을 수 없습니다. 경로를 확인하세요: {FIREBASE_KEY_PATH}"
-    )
-except Exception as e:
-    # initialize_app() 실패 등 기타 알 수 없는 오류
-    raise AppConfigError(f"Firebase 초기화 중 알 수 없는 오류 발생: {e}")
\ No newline at end of file
+# firebase_admin / Firestore(gRPC) 모듈은 import 비용이 커서 모듈 import 시점에 초기화하지 않습니다.
+# 앱은 lifespan 시작 단계에서 init_firebase_async()로 (Gemini 준비와 동시에) 초기화하며,
+# 그 밖의 경로(스크립트, 테스트 등)에서는 처음 사용할 때 초기화됩니다.
+_init_lock = threading.Lock()
+_initialized = False
+_db = None
+
+
+def init_firebase() -> None:
+    """
+    Firebase Admin SDK를 초기화하고 Firestore 클라이언트를 만듭니다. (여러 번 호출해도 한 번만 수행)
+    설정이 잘못되었으면 AppConfigError를 발생시킵니다. (Fail Fast)
+    """
+    global _initialized, _db
+    if _initialized:
+        return
+
+    with _init_lock:
+        if _initialized:
+            return
+
+        # 1. .env 설정 확인 (Fail Fast 1)
+        if not FIREBASE_KEY_PATH:
+            raise AppConfigError(
+                "환경 변수 'FIREBASE_SERVICE_ACCOUNT_KEY'가 설정되지 않았습니다. .env 파일을 확인하세요."
+            )
+
+        try:
+            firebase_admin = importlib.import_module("firebase_admin")
+            credentials = importlib.import_module("firebase_admin.credentials")
+            firestore = importlib.import_module("firebase_admin.firestore")
+
+            # 2. 서비스 키 파일 유효성 검사 (Fail Fast 2)
+            # FileNotFoundError, ValueError 등을 발생시킬 수 있습니다.
+            cred = credentials.Certificate(FIREBASE_KEY_PATH)
+
+            # 3. Firebase Admin SDK 초기화 (Fail Fast 3)
+            try:
+                firebase_admin.get_app()
+            except ValueError:
+                firebase_admin.initialize_app(cred)
+
+            # 4. 클라이언트 생성
+            _db = firestore.client()
+
+            print("Firebase Admin SDK가 성공적으로 초기화되었습니다. (Firestore, Auth)")
+
+        except ModuleNotFoundError as e:
+            raise AppConfigError(f"필수 패키지 'firebase-admin'이 설치되지 않았습니다: {e}")
+        except ValueError as e:
+            # credentials.Certificate()가 실패한 경우 (e.g., 파일은 있으나 JSON 형식이 아님)
+            raise AppConfigError(f"Firebase 서비스 키 파일이 유효하지 않습니다: {e}")
+        except FileNotFoundError:
+            # credentials.Certificate()가 실패한 경우 (파일 경로가 잘못됨)
+            raise AppConfigError(
+                f"Firebase 서비스 키 파일을 찾을 수 없습니다. 경로를 확인하세요: {FIREBASE_KEY_PATH}"
+            )
+        except Exception as e:
+            # initialize_app() 실패 등 기타 알 수 없는 오류
+            raise AppConfigError(f"Firebase 초기화 중 알 수 없는 오류 발생: {e}")
+
+        _initialized = True
+
+
+async def init_firebase_async() -> None:
+    """init_firebase()를 스레드에서 실행합니다. (SDK import/키 파싱 동안 이벤트 루프를 막지 않도록)"""
+    await asyncio.to_thread(init_firebase)
+
+
+def get_db():
+    """Firestore 클라이언트를 반환합니다. 초기화 전이면 먼저 초기화합니다."""
+    init_firebase()
+    return _db
+
+
+class LazyModule:
+    """
+    첫 속성 접근 시점에 모듈을 import 하는 프록시.
+    requires_firebase=True이면 import 전에 Firebase를 초기화합니다. (firebase_admin.auth 호출용)
+    """
+
+    def __init__(self, module_name: str, requires_firebase: bool = False) -> None:
+        self._module_name = module_name
+        self._requires_firebase = requires_firebase
+        self._module = None
+
+    def __getattr__(self, name: str):
+        if self._module is None:
+            if self._requires_firebase:
+                init_firebase()
+            self._module = importlib.import_module(self._module_name)
+        return getattr(self._module, name)
+
+
+class LazyCollection:
+    """첫 사용 시점에 Firestore 컬렉션 참조를 만드는 프록시."""
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+        self._ref = None
+
+    def __getattr__(self, name: str):
+        if self._ref is None:
+            self._ref = get_db().collection(self._name)
+        return getattr(self._ref, name)
+
+
+def collection(name: str) -> LazyCollection:
+    return LazyCollection(name)
+
+
+class LazyClient:
+    """첫 사용 시점에 Firebase를 초기화하는 Firestore 클라이언트 프록시. (batch(), transaction() 등)"""
+
+    def __getattr__(self, name: str):
+        return getattr(get_db(), name)
+
+
+# Firestore 클라이언트
+db = LazyClient()
+
+
+# Firebase Auth (사용자 조회/생성, ID 토큰 검증)
+firebase_auth = LazyModule("firebase_admin.auth", requires_firebase=True)
+# Firestore 필드 변환(Minimum 등), 트랜잭션(transactional)
+firestore = LazyModule("firebase_admin.firestore")
+# Firestore 오류 타입(AlreadyExists 등)
+google_api_exceptions = LazyModule("google.api_core.exceptions")
+
+__all__ = [
+    "collection",
+    "db",
+    "firebase_auth",
+    "firestore",
+    "get_db",
+    "google_api_exceptions",
+    "init_firebase",
+    "init_firebase_async",
+]
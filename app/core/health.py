@@ -0,0 +1,55 @@
+import time
+from typing import Awaitable, Callable, Dict, Tuple
+
+from app.core.exceptions.exceptions import AppConfigError
+
+# 컴포넌트 이름 -> 상태 정보
+# status: "pending" | "ready" | "failed"
+_components: Dict[str, dict] = {}
+
+
+def mark_pending(name: str) -> None:
+    _components[name] = {"status": "pending"}
+
+
+def mark_ready(name: str, **details) -> None:
+    _components[name] = {"status": "ready", **details}
+
+
+def mark_failed(name: str, error: str, **details) -> None:
+    _components[name] = {"status": "failed", "error": error, **details}
+
+
+def readiness_snapshot() -> Tuple[bool, Dict[str, dict]]:
+    """
+    등록된 모든 컴포넌트가 ready 상태인지와 컴포넌트별 상태를 반환합니다.
+    """
+    snapshot = {name: dict(state) for name, state in _components.items()}
+    ready = all(state["status"] == "ready" for state in snapshot.values())
+    return ready, snapshot
+
+
+async def run_startup_check(name: str, step: Callable[[], Awaitable[object]]) -> None:
+    """
+    시작 단계(warm-up 등)를 실행하고 결과를 readiness 상태에 기록합니다.
+
+    - AppConfigError: 설정 오류이므로 그대로 발생시켜 앱 시작을 중단합니다. (Fail Fast)
+    - 그 외 예외: 앱은 계속 기동하되, readiness probe에서 실패로 보고합니다.
+    """
+    mark_pending(name)
+    started = time.perf_counter()
+    try:
+        await step()
+    except AppConfigError as e:
+        mark_failed(name, e.message, elapsed_ms=_elapsed_ms(started))
+        raise
+    except Exception as e:
+        mark_failed(name, f"{type(e).__name__}: {e}", elapsed_ms=_elapsed_ms(started))
+        print(f"[startup] {name} 준비 실패: {e}")
+        return
+
+    mark_ready(name, elapsed_ms=_elapsed_ms(started))
+
+
+def _elapsed_ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000, 1)
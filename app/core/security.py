@@ -1,5 +1,6 @@
+import secrets
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Optional, Tuple
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 
@@ -7,7 +8,8 @@ from passlib.context import CryptContext
 from app.core.config import (
     API_SECRET_KEY,
     API_TOKEN_ALGORITHM,
-    API_TOKEN_EXPIRE_MINUTES
+    API_TOKEN_EXPIRE_MINUTES,
+    BCRYPT_ROUNDS
 )
 # AppConfigError (시작 오류) 및 런타임 예외 임포트
 from app.core.exceptions.exceptions import (
@@ -17,7 +19,9 @@ from app.core.exceptions.exceptions import (
 )
 
 # 비밀번호 해싱을 위한 설정
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# bcrypt는 호출당 수백 ms의 CPU 작업이므로 async 경로에서 직접 호출하지 말고
+# app.feature.auth.password_hasher(프로세스 풀)를 통해 사용합니다.
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=BCRYPT_ROUNDS)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -30,6 +34,14 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+def verify_and_update_password(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """
+    비밀번호를 확인하고, 해시의 비용(rounds)이 현재 설정과 다르면 새 해시도 함께 반환합니다.
+    :return: (일치 여부, 새 해시 또는 None)
+    """
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """
     API Access Token (JWT)을 생성합니다.
@@ -47,10 +59,11 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
         # .env에서 설정한 기본 만료 시간을 사용
         expire = datetime.now(timezone.utc) + timedelta(minutes=API_TOKEN_EXPIRE_MINUTES)
 
-    # 토큰 발급 시간(iat)과 만료 시간(exp)을 payload에 추가
+    # 토큰 발급 시간(iat), 만료 시간(exp), 토큰 식별자(jti: 로그아웃 시 폐기 대상)를 payload에 추가
     to_encode.update({
         "exp": expire,
-        "iat": datetime.now(timezone.utc)
+        "iat": datetime.now(timezone.utc),
+        "jti": secrets.token_urlsafe(16)
     })
 
     # .env 파일에 키가 설정되었는지 확인
@@ -0,0 +1,128 @@
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import List, Optional
+
+from app.core.exceptions.exceptions import InvalidBoardingPassError
+from app.feature.LLM.llm_schemas import FlightInfo
+
+# IATA Resolution 792 (BCBP) 필수 항목 길이
+_HEADER_LENGTH = 23  # 포맷 코드(1) + 구간 수(1) + 승객명(20) + 전자항공권 여부(1)
+_LEG_LENGTH = 37  # 구간별 필수 항목 + 가변 영역 길이(2, 16진수)
+
+# 좌석 등급(Compartment code) -> 사람이 읽을 수 있는 등급명
+_COMPARTMENT_CLASSES = {
+    **dict.fromkeys("FAP", "First"),
+    **dict.fromkeys("JCDIZR", "Business"),
+    **dict.fromkeys("WEO", "Premium Economy"),
+    **dict.fromkeys("YBHKLMNQSTUVGX", "Economy"),
+}
+
+
+@dataclass
+class BoardingPass:
+    """BCBP에서 추출한 탑승권 정보."""
+
+    passenger_name: str
+    electronic_ticket: bool
+    legs: List[FlightInfo] = field(default_factory=list)
+
+
+def parse_bcbp(data: str, reference_date: Optional[date] = None) -> BoardingPass:
+    """
+    IATA BCBP 문자열(탑승권 바코드 원문)을 파싱합니다. (다구간 포함)
+
+    LLM 호출 없이 항공사, 편명, 출발/도착 공항, 날짜, 좌석 정보를 추출합니다.
+    BCBP 날짜는 연도 없이 일련번호(Julian day)만 담고 있으므로,
+    reference_date(기본값: 오늘)에 가장 가까운 연도로 해석합니다.
+
+    :raises InvalidBoardingPassError: 형식이 올바르지 않을 때
+    """
+    if not data or len(data) < _HEADER_LENGTH + _LEG_LENGTH or data[0] != "M":
+        raise InvalidBoardingPassError()
+
+    leg_count_raw = data[1]
+    if not leg_count_raw.isdigit() or leg_count_raw == "0":
+        raise InvalidBoardingPassError(message="BCBP 구간 수가 올바르지 않습니다.")
+    leg_count = int(leg_count_raw)
+
+    reference = reference_date or date.today()
+    legs: List[FlightInfo] = []
+    offset = _HEADER_LENGTH
+
+    for _ in range(leg_count):
+        leg_end = offset + _LEG_LENGTH
+        if len(data) < leg_end:
+            raise InvalidBoardingPassError(message="BCBP 구간 데이터가 잘렸습니다.")
+
+        legs.append(_parse_leg(data, offset, reference))
+
+        try:
+            variable_size = int(data[leg_end - 2:leg_end], 16)
+        except ValueError:
+            raise InvalidBoardingPassError(message="BCBP 가변 영역 길이가 올바르지 않습니다.")
+        offset = leg_end + variable_size
+
+    return BoardingPass(
+        passenger_name=data[2:22].strip(),
+        electronic_ticket=data[22] == "E",
+        legs=legs,
+    )
+
+
+def _parse_leg(data: str, offset: int, reference: date) -> FlightInfo:
+    # 필수 항목 위치 (구간 시작 기준):
+    # PNR(7) 출발(3) 도착(3) 항공사(3) 편명(5) 날짜(3) 등급(1) 좌석(4) 탑승순번(5) 상태(1) 가변길이(2)
+    departure = data[offset + 7:offset + 10].strip()
+    arrival = data[offset + 10:offset + 13].strip()
+    carrier = data[offset + 13:offset + 16].strip()
+    flight_number = data[offset + 16:offset + 21].strip()
+    julian_day = data[offset + 21:offset + 24].strip()
+    compartment = data[offset + 24]
+    seat = data[offset + 25:offset + 29].strip().lstrip("0")
+
+    return FlightInfo(
+        airline=carrier or None,
+        flight_number=_format_flight_number(carrier, flight_number),
+        departure_airport=departure or None,
+        arrival_airport=arrival or None,
+        departure_date=_resolve_julian_date(julian_day, reference),
+        seat_class=_COMPARTMENT_CLASSES.get(compartment),
+        seat_number=seat or None,
+    )
+
+
+def _format_flight_number(carrier: str, number: str) -> Optional[str]:
+    """'KE' + '0081 ' -> 'KE081' (숫자는 최소 3자리, 운항 접미사 문자는 유지)"""
+    if not number:
+        return None
+    digits = number.rstrip("ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+    suffix = number[len(digits):]
+    if digits.isdigit():
+        number = f"{int(digits):03d}{suffix}"
+    return f"{carrier}{number}"
+
+
+def _resolve_julian_date(julian_day: str, reference: date) -> Optional[str]:
+    if not julian_day.isdigit():
+        return None
+    return _julian_to_iso(int(julian_day), reference)
+
+
+@lru_cache(maxsize=1024)
+def _julian_to_iso(day_of_year: int, reference: date) -> Optional[str]:
+    if not 1 <= day_of_year <= 366:
+        return None
+
+    candidates = []
+    for year in (reference.year - 1, reference.year, reference.year + 1):
+        candidate = date(year, 1, 1) + timedelta(days=day_of_year - 1)
+        if candidate.year == year:  # 평년의 366일차는 제외
+            candidates.append(candidate)
+    if not candidates:
+        return None
+
+    return min(candidates, key=lambda d: abs((d - reference).days)).isoformat()
+
+
+__all__ = ["BoardingPass", "parse_bcbp"]
@@ -0,0 +1,165 @@
+import asyncio
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+from app.core.config import (
+    LLM_JOB_QUEUE_SIZE,
+    LLM_JOB_RESULT_TTL_SECONDS,
+    LLM_JOB_WORKERS,
+)
+from app.core.exceptions.exception_handlers import ErrorResponse
+from app.core.exceptions.exceptions import (
+    CustomException,
+    JobNotFoundError,
+    TooManyRequestsError,
+)
+from app.feature.LLM import llm_service
+from app.feature.LLM.llm_schemas import LLMChatJobResponse, LLMChatRequest, LLMChatResponse
+
+
+@dataclass
+class ChatJob:
+    """인프로세스 작업 상태."""
+
+    job_id: str
+    request: Optional[LLMChatRequest]
+    status: str = "queued"
+    created_at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    finished_at: Optional[str] = None
+    expires_at: Optional[float] = None  # 완료 후 결과 만료 시각 (monotonic)
+    result: Optional[LLMChatResponse] = None
+    error: Optional[ErrorResponse] = None
+
+    def to_response(self) -> LLMChatJobResponse:
+        return LLMChatJobResponse(
+            job_id=self.job_id,
+            status=self.status,
+            created_at=self.created_at,
+            finished_at=self.finished_at,
+            result=self.result,
+            error=self.error,
+        )
+
+
+class ChatJobManager:
+    """
+    오래 걸리는 채팅 요청을 제한된 대기열과 워커 풀에서 처리합니다.
+
+    - submit: 대기열에 넣고 즉시 job_id 반환. 대기열이 가득 차면 TooManyRequestsError(429)
+    - get: 상태/결과 조회. 완료된 작업은 result_ttl_seconds 후 만료되어 JobNotFoundError(404)
+    """
+
+    def __init__(
+        self,
+        workers: int = LLM_JOB_WORKERS,
+        queue_size: int = LLM_JOB_QUEUE_SIZE,
+        result_ttl_seconds: int = LLM_JOB_RESULT_TTL_SECONDS,
+    ) -> None:
+        self.worker_count = max(1, workers)
+        self.queue_size = max(1, queue_size)
+        self.result_ttl_seconds = result_ttl_seconds
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        self._jobs: Dict[str, ChatJob] = {}
+
+    def start(self) -> None:
+        """워커를 시작합니다. (앱 시작 시 호출, 이미 실행 중이면 무시)"""
+        if self._workers:
+            return
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._workers = [
+            asyncio.create_task(self._worker(), name=f"llm-job-worker-{index}")
+            for index in range(self.worker_count)
+        ]
+
+    async def stop(self) -> None:
+        """워커를 종료합니다. 처리되지 못한 작업은 실패로 기록됩니다. (앱 종료 시 호출)"""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+        for job in self._jobs.values():
+            if job.status in ("queued", "running"):
+                self._finish(job, error=ErrorResponse(
+                    error_code="JOB_CANCELLED",
+                    message="서버 종료로 작업이 취소되었습니다.",
+                ))
+
+    def submit(self, request: LLMChatRequest) -> ChatJob:
+        self.start()
+        self._purge_expired()
+
+        job = ChatJob(job_id=uuid.uuid4().hex, request=request)
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            raise TooManyRequestsError(message="대기 중인 작업이 너무 많습니다. 잠시 후 다시 시도하세요.")
+
+        self._jobs[job.job_id] = job
+        return job
+
+    def get(self, job_id: str) -> ChatJob:
+        job = self._jobs.get(job_id)
+        if job is None or self._is_expired(job):
+            self._jobs.pop(job_id, None)
+            raise JobNotFoundError()
+        return job
+
+    async def _worker(self) -> None:
+        while True:
+            job: ChatJob = await self._queue.get()
+            try:
+                await self._run(job)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job: ChatJob) -> None:
+        job.status = "running"
+        try:
+            result = await llm_service.generate_chat_completion(job.request)
+        except CustomException as exc:
+            self._finish(job, error=ErrorResponse(error_code=exc.error_code, message=exc.message))
+        except Exception as exc:
+            self._finish(job, error=ErrorResponse(
+                error_code="INTERNAL_SERVER_ERROR",
+                message=f"작업 처리 중 오류가 발생했습니다: {exc}",
+            ))
+        else:
+            self._finish(job, result=result)
+
+    def _finish(
+        self,
+        job: ChatJob,
+        result: Optional[LLMChatResponse] = None,
+        error: Optional[ErrorResponse] = None,
+    ) -> None:
+        job.status = "succeeded" if error is None else "failed"
+        job.result = result
+        job.error = error
+        job.request = None  # 이미지 등 요청 본문은 결과 보관 기간 동안 들고 있지 않습니다.
+        job.finished_at = datetime.now(timezone.utc).isoformat()
+        job.expires_at = time.monotonic() + self.result_ttl_seconds
+
+    def _is_expired(self, job: ChatJob) -> bool:
+        return job.expires_at is not None and job.expires_at <= time.monotonic()
+
+    def _purge_expired(self) -> None:
+        expired = [job_id for job_id, job in self._jobs.items() if self._is_expired(job)]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+    def stats(self) -> dict:
+        return {
+            "jobs": len(self._jobs),
+            "queued": self._queue.qsize() if self._queue else 0,
+            "workers": len(self._workers),
+        }
+
+
+chat_job_manager = ChatJobManager()
+
+__all__ = ["ChatJob", "ChatJobManager", "chat_job_manager"]
@@ -1,69 +1,323 @@
-import importlib
-from typing import List
+import asyncio
+import time
+from typing import AsyncIterator, List
 
-from fastapi.concurrency import run_in_threadpool
-
-from app.core.config import GEMINI_API_KEY, GEMINI_MODEL_NAME
-from app.core.exceptions.exceptions import AppConfigError, ExternalApiError
+from app.core.config import (
+    GEMINI_CIRCUIT_FAILURE_THRESHOLD,
+    GEMINI_CIRCUIT_RECOVERY_SECONDS,
+    GEMINI_HEDGE_PERCENTILE,
+    GEMINI_MAX_CONCURRENCY,
+    GEMINI_MAX_QUEUE,
+    GEMINI_MAX_RETRIES,
+    GEMINI_MODEL_NAME,
+    GEMINI_RETRY_BASE_DELAY_MS,
+    GEMINI_TIMEOUT_MS,
+)
+from app.core.exceptions.exceptions import (
+    AppConfigError,
+    CustomException,
+    ExternalApiError,
+    UpstreamTimeoutError,
+)
+from app.feature.LLM.llm_backends import LLMBackend, UploadedFile, create_backend
+from app.shared.concurrency import ConcurrencyLimiter
+from app.shared.resilience import CircuitBreaker, LatencyTracker, backoff_delay
 
 
 class GeminiClient:
     """
-    google-generativeai SDK 초기화 및 요청 실행을 담당하는 어댑터.
+    Gemini 요청 실행을 담당하는 어댑터.
+
+    실제 호출은 LLM_BACKEND 설정에 따른 백엔드(gemini/record/replay)가 수행하고,
+    이 클래스는 동시성 제한, 타임아웃, 재시도, 헤징, 서킷 브레이커를 담당합니다.
     """
 
     def __init__(
         self,
-        api_key: str | None = GEMINI_API_KEY,
+        backend: LLMBackend | None = None,
         model_name: str | None = GEMINI_MODEL_NAME,
+        max_concurrency: int = GEMINI_MAX_CONCURRENCY,
+        max_queue: int = GEMINI_MAX_QUEUE,
     ) -> None:
-        self._genai = self._import_sdk()
-        self._configure(api_key)
+        self.backend = backend or create_backend()
         self.model_name = model_name or "gemini-1.5-flash"
+        self._limiter = ConcurrencyLimiter(
+            max_concurrency=max_concurrency,
+            max_queue=max_queue,
+            name="gemini",
+        )
 
-    @staticmethod
-    def _import_sdk():
+        self._timeout_seconds = GEMINI_TIMEOUT_MS / 1000
+        self._max_retries = max(0, GEMINI_MAX_RETRIES)
+        self._retry_base_delay = GEMINI_RETRY_BASE_DELAY_MS / 1000
+        self._hedge_percentile = GEMINI_HEDGE_PERCENTILE
+        self._latency = LatencyTracker()
+        self._breaker = CircuitBreaker(
+            failure_threshold=GEMINI_CIRCUIT_FAILURE_THRESHOLD,
+            recovery_seconds=GEMINI_CIRCUIT_RECOVERY_SECONDS,
+        )
+
+    async def warm_up(self, system_instruction: str) -> None:
+        """
+        기본 모델을 미리 생성하고 가벼운 count_tokens 호출로 연결을 수립해 둡니다.
+        (replay 백엔드는 기록 파일을 미리 읽습니다.)
+        배포 직후 첫 요청이 초기화 비용을 떠안지 않도록 lifespan에서 호출합니다.
+        """
         try:
-            return importlib.import_module("google.generativeai")
-        except ModuleNotFoundError as exc:
-            raise AppConfigError(
-                "필수 패키지 'google-generativeai'가 설치되지 않았습니다. "
-                "pip install google-generativeai 로 설치하세요."
-            ) from exc
-
-    def _configure(self, api_key: str | None) -> None:
-        if not api_key:
-            raise AppConfigError(
-                "환경 변수 'GEMINI_API_KEY'가 설정되지 않았습니다. .env를 확인하세요."
+            await self.backend.warm_up(system_instruction, self.model_name)
+        except AppConfigError:
+            raise
+        except Exception as exc:
+            raise ExternalApiError(
+                message=f"Gemini warm-up 호출에 실패했습니다: {exc}"
             )
 
-        self._genai.configure(api_key=api_key)
-
     async def generate(
         self,
         prompt_segments: List[object],
         system_instruction: str,
+        deadline: float | None = None,
+        model_name: str | None = None,
+    ) -> str:
+        """
+        백엔드의 비동기 API로 응답을 생성합니다.
+        스레드 풀을 점유하지 않으며, 동시 요청 수는 limiter로 제한됩니다.
+
+        - deadline(time.monotonic 기준 시각)을 넘기면 UpstreamTimeoutError(504)
+        - 일시적 오류는 기한 안에서 지터를 적용해 재시도
+        - 지연이 설정한 백분위수를 넘으면 두 번째 요청을 헤징으로 발송 (선택)
+        - 서킷이 열려 있으면 업스트림 호출 없이 즉시 ExternalApiError
+        model_name을 지정하지 않으면 기본 모델(GEMINI_MODEL_NAME)을 사용합니다.
+        """
+        model_name = model_name or self.model_name
+        deadline = deadline or time.monotonic() + self._timeout_seconds
+        is_probe = self._check_circuit()
+        return await self._generate(prompt_segments, system_instruction, deadline, model_name, is_probe)
+
+    async def _generate(
+        self,
+        prompt_segments: List[object],
+        system_instruction: str,
+        deadline: float,
+        model_name: str,
+        is_probe: bool,
+    ) -> str:
+        attempt = 0
+        try:
+            while True:
+                if attempt:
+                    # 재시도 사이에 (이 요청이나 다른 요청의 실패로) 서킷이 열렸으면 업스트림을 더 호출하지 않습니다.
+                    is_probe = self._check_circuit() or is_probe
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise UpstreamTimeoutError(message="Gemini 응답 기한이 초과되었습니다.")
+
+                try:
+                    text = await asyncio.wait_for(
+                        self._call_hedged(prompt_segments, system_instruction, model_name),
+                        timeout=remaining,
+                    )
+                except asyncio.TimeoutError:
+                    self._breaker.record_failure()
+                    raise UpstreamTimeoutError(message="Gemini 응답 기한이 초과되었습니다.")
+                except CustomException:
+                    # limiter의 429 등 우리 쪽에서 발생한 오류는 그대로 전달합니다.
+                    raise
+                except Exception as exc:
+                    if not _is_transient(exc):
+                        # 업스트림은 응답했으므로(예: 잘못된 요청) 서킷 관점에서는 정상입니다.
+                        self._breaker.record_success()
+                        raise ExternalApiError(
+                            message=f"Gemini 요청 중 오류가 발생했습니다: {exc}"
+                        )
+
+                    self._breaker.record_failure()
+                    delay = backoff_delay(attempt, self._retry_base_delay)
+                    if attempt >= self._max_retries or time.monotonic() + delay >= deadline:
+                        raise ExternalApiError(
+                            message=f"Gemini 요청 중 오류가 발생했습니다: {exc}"
+                        )
+                    attempt += 1
+                    await asyncio.sleep(delay)
+                    continue
+
+                self._breaker.record_success()
+                break
+
+            if not text or not text.strip():
+                raise ExternalApiError(message="Gemini 응답이 비어 있습니다.")
+
+            return text.strip()
+        finally:
+            if is_probe:
+                # 429/취소 등으로 시험 호출 결과가 기록되지 않았으면 다음 요청이 시험하도록 넘깁니다.
+                self._breaker.release_probe()
+
+    async def _call_once(
+        self,
+        prompt_segments: List[object],
+        system_instruction: str,
+        model_name: str,
     ) -> str:
-        model = self._genai.GenerativeModel(
-            model_name=self.model_name,
-            system_instruction=system_instruction,
+        async with self._limiter.acquire():
+            started = time.monotonic()
+            text = await self.backend.generate(prompt_segments, system_instruction, model_name)
+        self._latency.record(time.monotonic() - started)
+        return text
+
+    async def _call_hedged(
+        self,
+        prompt_segments: List[object],
+        system_instruction: str,
+        model_name: str,
+    ) -> str:
+        """
+        첫 요청이 최근 지연 분포의 hedge 백분위수 안에 끝나지 않으면 같은 요청을 한 번 더 보내고,
+        먼저 성공한 응답을 사용합니다. 나머지 요청은 취소됩니다.
+        """
+        call_args = (prompt_segments, system_instruction, model_name)
+        hedge_delay = (
+            self._latency.percentile(self._hedge_percentile)
+            if self._hedge_percentile
+            else None
         )
+        if hedge_delay is None:
+            return await self._call_once(*call_args)
 
+        tasks = {asyncio.ensure_future(self._call_once(*call_args))}
         try:
-            response = await run_in_threadpool(
-                model.generate_content,
-                prompt_segments,
-            )
-        except Exception as exc:
+            done, _ = await asyncio.wait(tasks, timeout=hedge_delay)
+            if not done:
+                tasks.add(asyncio.ensure_future(self._call_once(*call_args)))
+
+            error: BaseException | None = None
+            while tasks:
+                done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    # 헤지 요청이 limiter에서 거절된 경우 등은 남은 요청 결과를 기다립니다.
+                    error = error or task.exception()
+            raise error
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def _check_circuit(self) -> bool:
+        """서킷이 열려 있으면 ExternalApiError. 이번 요청이 half_open 시험 호출이면 True를 반환합니다."""
+        if not self._breaker.allow_request():
             raise ExternalApiError(
-                message=f"Gemini 요청 중 오류가 발생했습니다: {exc}"
+                message="Gemini 서비스가 일시적으로 불안정합니다. 잠시 후 다시 시도하세요."
+            )
+        return self._breaker.state == "half_open"
+
+    async def generate_stream(
+        self,
+        prompt_segments: List[object],
+        system_instruction: str,
+        deadline: float | None = None,
+        model_name: str | None = None,
+    ) -> AsyncIterator[str]:
+        """
+        백엔드의 스트리밍 모드로 응답을 생성하고, 텍스트 청크를 도착하는 즉시 반환합니다.
+        스트림이 끝날 때까지 limiter 슬롯을 점유하며, deadline은 스트림 연결 수립까지 적용됩니다.
+        """
+        model_name = model_name or self.model_name
+        deadline = deadline or time.monotonic() + self._timeout_seconds
+        is_probe = self._check_circuit()
+        try:
+            async with self._limiter.acquire():
+                try:
+                    chunks = await asyncio.wait_for(
+                        self.backend.open_stream(prompt_segments, system_instruction, model_name),
+                        timeout=max(0.0, deadline - time.monotonic()),
+                    )
+                except asyncio.TimeoutError:
+                    self._breaker.record_failure()
+                    raise UpstreamTimeoutError(message="Gemini 응답 기한이 초과되었습니다.")
+                except Exception as exc:
+                    if _is_transient(exc):
+                        self._breaker.record_failure()
+                    else:
+                        self._breaker.record_success()
+                    raise ExternalApiError(
+                        message=f"Gemini 스트리밍 요청 중 오류가 발생했습니다: {exc}"
+                    )
+
+                # 스트림이 열린 뒤의 오류도 업스트림 실패이므로, 성공은 스트림을 끝까지 받은 뒤에 기록합니다.
+                # (연결 직후에 성공을 기록하면 "열리고 중간에 끊기는" 장애에서 연속 실패 수가 계속 초기화됩니다.)
+                has_content = False
+                try:
+                    async for text in chunks:
+                        has_content = True
+                        yield text
+                except Exception as exc:
+                    self._breaker.record_failure()
+                    raise ExternalApiError(
+                        message=f"Gemini 스트리밍 응답 수신 중 오류가 발생했습니다: {exc}"
+                    )
+                self._breaker.record_success()
+
+            if not has_content:
+                raise ExternalApiError(message="Gemini 응답이 비어 있습니다.")
+        finally:
+            if is_probe:
+                # limiter 429, 클라이언트 연결 종료(취소) 등으로 결과가 기록되지 않은 시험 호출 정리
+                self._breaker.release_probe()
+
+    async def upload_file(self, data: bytes, mime_type: str, digest: str) -> UploadedFile:
+        """
+        Files API로 파일을 업로드합니다. 업로드 실패는 ExternalApiError로 변환됩니다.
+        (생성 호출이 아니므로 limiter/서킷 브레이커를 거치지 않습니다.)
+        """
+        try:
+            return await asyncio.wait_for(
+                self.backend.upload_file(data, mime_type, digest),
+                timeout=self._timeout_seconds,
             )
+        except AppConfigError:
+            raise
+        except asyncio.TimeoutError:
+            raise UpstreamTimeoutError(message="Gemini 파일 업로드 기한이 초과되었습니다.")
+        except Exception as exc:
+            raise ExternalApiError(message=f"Gemini 파일 업로드 중 오류가 발생했습니다: {exc}")
+
+    def limiter_stats(self) -> dict:
+        return self._limiter.stats()
+
+    def backend_stats(self) -> dict:
+        return {"backend": self.backend.name, **self.backend.stats()}
+
+    def circuit_state(self) -> str:
+        return self._breaker.state
+
+    def close(self) -> None:
+        """백엔드 자원(기록 파일 등)을 정리합니다. (앱 종료 시 호출)"""
+        self.backend.close()
+
+
+# google.api_core 예외 중 재시도할 가치가 있는 일시적 오류들
+_TRANSIENT_ERROR_NAMES = {
+    "ServiceUnavailable",
+    "DeadlineExceeded",
+    "InternalServerError",
+    "TooManyRequests",
+    "ResourceExhausted",
+    "GatewayTimeout",
+    "BadGateway",
+    "Aborted",
+}
+_TRANSIENT_STATUS_CODES = {429, 500, 502, 503, 504}
 
-        text = getattr(response, "text", "")
-        if not text or not text.strip():
-            raise ExternalApiError(message="Gemini 응답이 비어 있습니다.")
 
-        return text.strip()
+def _is_transient(exc: BaseException) -> bool:
+    """SDK를 import하지 않고 예외 클래스 이름/HTTP 코드로 일시적 오류 여부를 판단합니다."""
+    if isinstance(exc, (ConnectionError, asyncio.TimeoutError)):
+        return True
+    if any(cls.__name__ in _TRANSIENT_ERROR_NAMES for cls in type(exc).__mro__):
+        return True
+    return getattr(exc, "code", None) in _TRANSIENT_STATUS_CODES
 
 
 gemini_client = GeminiClient()
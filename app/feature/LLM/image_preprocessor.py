@@ -0,0 +1,207 @@
+import asyncio
+import base64
+import binascii
+import hashlib
+import importlib
+import io
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+from app.core.config import (
+    LLM_IMAGE_MAX_DIMENSION,
+    LLM_IMAGE_OUTPUT_FORMAT,
+    LLM_IMAGE_PREPROCESS_ENABLED,
+    LLM_IMAGE_QUALITY,
+    LLM_IMAGE_WORKERS,
+)
+from app.core.exceptions.exceptions import InvalidImageError
+from app.feature.LLM.llm_schemas import ImageAttachment
+
+_OUTPUT_MIME_TYPES = {
+    "JPEG": "image/jpeg",
+    "WEBP": "image/webp",
+}
+
+_executor: Optional[ThreadPoolExecutor] = None
+_pil = None
+_pil_checked = False
+
+
+@dataclass
+class ProcessedImage:
+    """전처리 결과. digest는 원본 바이트의 SHA-256으로 중복 제거에 사용됩니다."""
+
+    digest: str
+    base64_data: str
+    mime_type: str
+    original_bytes: int
+    processed_bytes: int
+
+
+def _load_pillow():
+    """
+    Pillow는 선택 의존성입니다. 설치되지 않았다면 리사이즈/재인코딩 없이 중복 제거만 수행합니다.
+    """
+    global _pil, _pil_checked
+    if not _pil_checked:
+        _pil_checked = True
+        try:
+            _pil = (
+                importlib.import_module("PIL.Image"),
+                importlib.import_module("PIL.ImageOps"),
+            )
+        except ModuleNotFoundError:
+            print("[image] Pillow가 설치되지 않아 이미지 리사이즈를 건너뜁니다. (pip install Pillow)")
+            _pil = None
+    return _pil
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=max(1, LLM_IMAGE_WORKERS),
+            thread_name_prefix="image-preprocess",
+        )
+    return _executor
+
+
+def shutdown_image_workers() -> None:
+    """이미지 전처리 워커 풀을 종료합니다. (앱 종료 시 호출)"""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+def process_image_bytes(
+    raw: bytes,
+    mime_type: str,
+    max_dimension: int = LLM_IMAGE_MAX_DIMENSION,
+    output_format: str = LLM_IMAGE_OUTPUT_FORMAT,
+    quality: int = LLM_IMAGE_QUALITY,
+) -> Tuple[bytes, str]:
+    """
+    [동기 함수] 이미지 바이트를 최대 크기로 축소한 뒤 압축 포맷으로 재인코딩합니다.
+    축소가 필요 없고 재인코딩 이득도 없으면 원본 바이트를 그대로 반환합니다.
+    """
+    pil = _load_pillow()
+    if pil is None:
+        return raw, mime_type
+
+    image_module, image_ops = pil
+    try:
+        with image_module.open(io.BytesIO(raw)) as image:
+            # 휴대폰 사진의 EXIF 회전 정보를 픽셀에 반영한 뒤 축소합니다.
+            image = image_ops.exif_transpose(image)
+            resized = max(image.size) > max_dimension
+            if resized:
+                image.thumbnail((max_dimension, max_dimension), image_module.LANCZOS)
+            if image.mode not in ("RGB", "L"):
+                image = image.convert("RGB")
+
+            buffer = io.BytesIO()
+            image.save(buffer, format=output_format, quality=quality, optimize=True)
+    except Exception as exc:
+        raise InvalidImageError(message=f"이미지를 처리할 수 없습니다: {exc}")
+
+    encoded = buffer.getvalue()
+    if not resized and len(encoded) >= len(raw):
+        return raw, mime_type
+    return encoded, _OUTPUT_MIME_TYPES[output_format]
+
+
+def process_image_sync(
+    base64_data: str,
+    mime_type: str,
+    max_dimension: int = LLM_IMAGE_MAX_DIMENSION,
+    output_format: str = LLM_IMAGE_OUTPUT_FORMAT,
+    quality: int = LLM_IMAGE_QUALITY,
+) -> ProcessedImage:
+    """
+    [동기 함수] Base64 이미지를 디코딩하고, 최대 크기로 축소한 뒤 압축 포맷으로 재인코딩합니다.
+    CPU 작업이므로 워커 풀에서 실행됩니다.
+    """
+    try:
+        raw = base64.b64decode(base64_data, validate=False)
+    except (binascii.Error, ValueError):
+        raise InvalidImageError(message="Base64 이미지 데이터를 디코딩할 수 없습니다.")
+
+    digest = hashlib.sha256(raw).hexdigest()
+    data, output_mime_type = process_image_bytes(raw, mime_type, max_dimension, output_format, quality)
+    if data is raw:
+        return ProcessedImage(digest, base64_data, mime_type, len(raw), len(raw))
+
+    return ProcessedImage(
+        digest=digest,
+        base64_data=base64.b64encode(data).decode("ascii"),
+        mime_type=output_mime_type,
+        original_bytes=len(raw),
+        processed_bytes=len(data),
+    )
+
+
+async def preprocess_image_bytes(raw: bytes, mime_type: str) -> Tuple[bytes, str]:
+    """원격에서 받은 이미지 바이트를 워커 풀에서 축소/재인코딩합니다."""
+    if not LLM_IMAGE_PREPROCESS_ENABLED:
+        return raw, mime_type
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), process_image_bytes, raw, mime_type)
+
+
+async def preprocess_images(
+    images: Optional[List[ImageAttachment]],
+) -> Optional[List[ImageAttachment]]:
+    """
+    요청 이미지 목록을 이벤트 루프 밖(워커 풀)에서 전처리하고,
+    요청 내 동일한 이미지는 콘텐츠 해시 기준으로 한 번만 남깁니다.
+    URL 이미지는 변환하지 않고 URL 기준으로만 중복을 제거합니다.
+    """
+    if not images or not LLM_IMAGE_PREPROCESS_ENABLED:
+        return images
+
+    loop = asyncio.get_running_loop()
+    executor = _get_executor()
+
+    pending = {}
+    for index, image in enumerate(images):
+        if image.base64_data:
+            pending[index] = loop.run_in_executor(
+                executor,
+                process_image_sync,
+                image.base64_data,
+                image.mime_type or "image/png",
+            )
+
+    processed = dict(zip(pending.keys(), await asyncio.gather(*pending.values())))
+
+    results: List[ImageAttachment] = []
+    seen = set()
+    for index, image in enumerate(images):
+        if index in processed:
+            item = processed[index]
+            if item.digest in seen:
+                continue
+            seen.add(item.digest)
+            results.append(
+                ImageAttachment(mime_type=item.mime_type, base64_data=item.base64_data)
+            )
+        else:
+            key = f"url:{image.url}"
+            if key in seen:
+                continue
+            seen.add(key)
+            results.append(image)
+
+    return results
+
+
+__all__ = [
+    "ProcessedImage",
+    "preprocess_image_bytes",
+    "preprocess_images",
+    "process_image_bytes",
+    "process_image_sync",
+    "shutdown_image_workers",
+]
@@ -0,0 +1,303 @@
+import asyncio
+import base64
+import binascii
+import hashlib
+import ipaddress
+import socket
+import time
+from typing import List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import httpx
+
+from app.core.config import (
+    LLM_FILE_HANDLE_CACHE_MAX_ENTRIES,
+    LLM_FILE_HANDLE_TTL_SECONDS,
+    LLM_IMAGE_FETCH_ALLOWED_HOSTS,
+    LLM_IMAGE_FETCH_MAX_BYTES,
+    LLM_IMAGE_FETCH_MAX_CONNECTIONS,
+    LLM_IMAGE_FETCH_MAX_REDIRECTS,
+    LLM_IMAGE_FETCH_TIMEOUT_MS,
+    LLM_IMAGE_UPLOAD_ENABLED,
+    LLM_IMAGE_UPLOAD_MIN_BYTES,
+    LLM_IMAGE_URL_CACHE_TTL_SECONDS,
+)
+from app.core.exceptions.exceptions import (
+    ExternalApiError,
+    InvalidImageError,
+    UpstreamTimeoutError,
+)
+from app.feature.LLM.gemini_client import gemini_client
+from app.feature.LLM.image_preprocessor import preprocess_image_bytes
+from app.feature.LLM.llm_backends import UploadedFile
+from app.feature.LLM.llm_schemas import ImageAttachment
+from app.shared.cache import SingleFlight, TTLCache
+from app.shared.http_clients import http_clients
+from app.shared.metrics import metrics
+
+# Files API 만료 직전의 핸들을 쓰지 않도록 두는 여유 시간
+_EXPIRY_MARGIN_SECONDS = 600
+# 이미 Gemini가 직접 읽을 수 있는 URI는 다시 받지 않습니다.
+_GEMINI_FILE_HOSTS = {"generativelanguage.googleapis.com"}
+
+http_clients.register(
+    "image_fetch",
+    max_connections=max(1, LLM_IMAGE_FETCH_MAX_CONNECTIONS),
+    max_keepalive_connections=max(1, LLM_IMAGE_FETCH_MAX_CONNECTIONS),
+    read_timeout_ms=LLM_IMAGE_FETCH_TIMEOUT_MS,
+    # 리다이렉트는 _fetch에서 단계마다 호스트/IP를 다시 검사하며 직접 따라갑니다.
+    follow_redirects=False,
+)
+
+
+class ImageResolver:
+    """
+    프롬프트에 넣기 전 이미지를 Gemini Files API 핸들로 바꾸는 단계.
+
+    - URL 이미지: 공유 HTTP 클라이언트("image_fetch")로 동시에 내려받고(크기 제한), 축소/재인코딩 후 업로드
+    - 큰 Base64 이미지(upload_min_bytes 이상): 업로드 후 핸들로 참조
+    - 업로드 핸들은 원본 콘텐츠 해시 기준으로 만료 전까지 캐시되어,
+      대화의 다음 턴에서는 바이트를 다시 보내지 않고 file_uri만 참조합니다.
+    - URL -> 콘텐츠 해시도 짧게 캐시하여 같은 사전 서명 URL은 다시 내려받지 않습니다.
+    - 서버가 대신 요청하는 URL이므로(SSRF 방지) 허용 호스트 목록을 적용하고,
+      루프백/사설/링크 로컬/예약 IP로 해석되는 주소는 리다이렉트 단계마다 거부합니다.
+    같은 이미지에 대한 동시 다운로드/업로드는 하나로 합쳐지며,
+    업로드에 실패하면 인라인 데이터로 대체합니다.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = LLM_IMAGE_UPLOAD_ENABLED,
+        max_bytes: int = LLM_IMAGE_FETCH_MAX_BYTES,
+        upload_min_bytes: int = LLM_IMAGE_UPLOAD_MIN_BYTES,
+        handle_ttl_seconds: int = LLM_FILE_HANDLE_TTL_SECONDS,
+        url_ttl_seconds: int = LLM_IMAGE_URL_CACHE_TTL_SECONDS,
+        max_entries: int = LLM_FILE_HANDLE_CACHE_MAX_ENTRIES,
+        allowed_hosts: Optional[List[str]] = None,
+        max_redirects: int = LLM_IMAGE_FETCH_MAX_REDIRECTS,
+    ) -> None:
+        self.enabled = enabled
+        self.max_bytes = max_bytes
+        self.allowed_hosts = LLM_IMAGE_FETCH_ALLOWED_HOSTS if allowed_hosts is None else allowed_hosts
+        self.max_redirects = max(0, max_redirects)
+        self.upload_min_bytes = upload_min_bytes
+        self.handle_ttl_seconds = handle_ttl_seconds
+
+        self._handles = TTLCache(max_entries=max_entries, ttl_seconds=handle_ttl_seconds)
+        self._urls = TTLCache(max_entries=max_entries, ttl_seconds=url_ttl_seconds)
+        self._uploads = SingleFlight()
+        self._fetches = SingleFlight()
+
+    async def resolve(
+        self,
+        images: Optional[List[ImageAttachment]],
+    ) -> Optional[List[ImageAttachment]]:
+        if not images or not self.enabled:
+            return images
+        return list(await asyncio.gather(*(self._resolve_one(image) for image in images)))
+
+    async def _resolve_one(self, image: ImageAttachment) -> ImageAttachment:
+        if image.base64_data:
+            return await self._resolve_inline(image)
+
+        if not _is_fetchable(image.url):
+            return image
+
+        digest = self._urls.get(image.url)
+        if digest is not None:
+            uploaded = self._handles.get(digest)
+            if uploaded is not None:
+                _count("handle_hit")
+                return _to_attachment(uploaded)
+
+        return await self._fetches.do(image.url, lambda: self._fetch_and_upload(image))
+
+    async def _resolve_inline(self, image: ImageAttachment) -> ImageAttachment:
+        # Base64 길이로 디코딩 크기를 추정해 작은 이미지는 디코딩 없이 그대로 보냅니다.
+        if not self.upload_min_bytes or len(image.base64_data) * 3 // 4 < self.upload_min_bytes:
+            return image
+
+        # 업로드 대상은 큰 이미지이므로 디코딩/해시는 이벤트 루프 밖에서 수행합니다.
+        data, digest = await asyncio.to_thread(_decode_base64, image.base64_data)
+        mime_type = image.mime_type or "image/png"
+        try:
+            uploaded = await self._get_or_upload(digest, data, mime_type)
+        except (ExternalApiError, UpstreamTimeoutError):
+            _count("inline_fallback")
+            return image
+        return _to_attachment(uploaded)
+
+    async def _fetch_and_upload(self, image: ImageAttachment) -> ImageAttachment:
+        raw, mime_type = await self._fetch(image.url, image.mime_type)
+        digest = hashlib.sha256(raw).hexdigest()
+        self._urls.set(image.url, digest)
+
+        uploaded = self._handles.get(digest)
+        if uploaded is not None:
+            _count("handle_hit")
+            return _to_attachment(uploaded)
+
+        data, mime_type = await preprocess_image_bytes(raw, mime_type)
+        try:
+            uploaded = await self._get_or_upload(digest, data, mime_type)
+        except (ExternalApiError, UpstreamTimeoutError):
+            _count("inline_fallback")
+            return ImageAttachment(
+                mime_type=mime_type,
+                base64_data=base64.b64encode(data).decode("ascii"),
+            )
+        return _to_attachment(uploaded)
+
+    async def _get_or_upload(self, digest: str, data: bytes, mime_type: str) -> UploadedFile:
+        uploaded = self._handles.get(digest)
+        if uploaded is not None:
+            _count("handle_hit")
+            return uploaded
+        return await self._uploads.do(digest, lambda: self._upload(digest, data, mime_type))
+
+    async def _upload(self, digest: str, data: bytes, mime_type: str) -> UploadedFile:
+        uploaded = await gemini_client.upload_file(data, mime_type, digest)
+        _count("uploaded")
+        metrics.increment("llm_image_upload_bytes_total", value=len(data))
+
+        ttl_seconds = self.handle_ttl_seconds
+        if uploaded.expires_at is not None:
+            ttl_seconds = min(ttl_seconds, uploaded.expires_at - time.time() - _EXPIRY_MARGIN_SECONDS)
+        if ttl_seconds > 0:
+            self._handles.set(digest, uploaded, ttl_seconds=ttl_seconds)
+        return uploaded
+
+    async def _fetch(self, url: str, fallback_mime_type: Optional[str]) -> Tuple[bytes, str]:
+        """
+        URL 이미지를 max_bytes까지만 스트리밍으로 내려받습니다.
+        리다이렉트는 max_redirects까지 따라가며, 요청마다 _check_fetch_url로 호스트와 IP를 다시 검사합니다.
+        """
+        client = http_clients.get("image_fetch")
+        body = bytearray()
+        try:
+            for _ in range(self.max_redirects + 1):
+                await _check_fetch_url(url, self.allowed_hosts)
+                async with client.stream("GET", url) as response:
+                    _check_peer_address(response)
+                    if response.is_redirect:
+                        url = str(response.url.join(response.headers["location"]))
+                        continue
+                    if response.status_code >= 400:
+                        raise InvalidImageError(
+                            message=f"이미지 URL을 가져올 수 없습니다. (HTTP {response.status_code})"
+                        )
+                    declared = response.headers.get("content-length", "")
+                    if declared.isdigit() and int(declared) > self.max_bytes:
+                        raise _too_large(self.max_bytes)
+                    async for chunk in response.aiter_bytes():
+                        body.extend(chunk)
+                        if len(body) > self.max_bytes:
+                            raise _too_large(self.max_bytes)
+                    content_type = response.headers.get("content-type", "").split(";")[0].strip()
+                break
+            else:
+                raise InvalidImageError(message="이미지 URL의 리다이렉트가 너무 많습니다.")
+        except httpx.TimeoutException:
+            raise UpstreamTimeoutError(message="이미지 URL 응답 기한이 초과되었습니다.")
+        except httpx.HTTPError as exc:
+            raise ExternalApiError(message=f"이미지 URL 요청 중 오류가 발생했습니다: {exc}")
+
+        metrics.increment("llm_image_fetch_bytes_total", value=len(body))
+        mime_type = content_type if content_type.startswith("image/") else fallback_mime_type
+        return bytes(body), mime_type or "image/png"
+
+    def stats(self) -> dict:
+        return {
+            "handles": len(self._handles),
+            "urls": len(self._urls),
+            "inflight_uploads": self._uploads.inflight_count(),
+            "inflight_fetches": self._fetches.inflight_count(),
+        }
+
+
+def _is_fetchable(url: Optional[str]) -> bool:
+    if not url:
+        return False
+    parts = urlsplit(url)
+    return parts.scheme in ("http", "https") and parts.hostname not in _GEMINI_FILE_HOSTS
+
+
+async def _check_fetch_url(url: str, allowed_hosts: List[str]) -> None:
+    """
+    서버가 대신 요청해도 되는 URL인지 확인합니다.
+    허용 호스트 목록(비어 있으면 제한 없음)에 있어야 하고, 해석된 모든 IP가 공인 주소여야 합니다.
+    """
+    parts = urlsplit(url)
+    host = (parts.hostname or "").lower()
+    if parts.scheme not in ("http", "https") or not host:
+        raise InvalidImageError(message="이미지 URL은 http/https 주소여야 합니다.")
+    if allowed_hosts and not _is_allowed_host(host, allowed_hosts):
+        _count("blocked_host")
+        raise InvalidImageError(message=f"허용되지 않은 이미지 호스트입니다: {host}")
+
+    try:
+        port = parts.port or (443 if parts.scheme == "https" else 80)
+        addresses = await asyncio.get_running_loop().getaddrinfo(host, port, type=socket.SOCK_STREAM)
+    except (OSError, UnicodeError, ValueError):
+        raise InvalidImageError(message=f"이미지 URL의 호스트를 찾을 수 없습니다: {host}")
+    if not addresses or not all(_is_public_address(address[4][0]) for address in addresses):
+        _count("blocked_address")
+        raise InvalidImageError(message="내부 네트워크 주소의 이미지는 가져올 수 없습니다.")
+
+
+def _check_peer_address(response: httpx.Response) -> None:
+    """
+    실제로 연결된 서버 IP를 다시 확인합니다.
+    검사 후 DNS 응답이 바뀌는 경우(DNS rebinding) 응답 본문을 읽기 전에 거부합니다.
+    """
+    stream = response.extensions.get("network_stream")
+    server_addr = stream.get_extra_info("server_addr") if stream is not None else None
+    if server_addr and not _is_public_address(server_addr[0]):
+        _count("blocked_address")
+        raise InvalidImageError(message="내부 네트워크 주소의 이미지는 가져올 수 없습니다.")
+
+
+def _is_allowed_host(host: str, allowed_hosts: List[str]) -> bool:
+    for allowed in allowed_hosts:
+        if allowed.startswith("*."):
+            if host.endswith(allowed[1:]):
+                return True
+        elif host == allowed:
+            return True
+    return False
+
+
+def _is_public_address(address: str) -> bool:
+    """루프백/사설/링크 로컬/예약/멀티캐스트 주소가 아니면 True."""
+    try:
+        ip = ipaddress.ip_address(address.split("%", 1)[0])
+    except ValueError:
+        return False
+    if ip.version == 6 and ip.ipv4_mapped is not None:
+        ip = ip.ipv4_mapped
+    return ip.is_global and not ip.is_multicast
+
+
+def _decode_base64(base64_data: str) -> Tuple[bytes, str]:
+    try:
+        data = base64.b64decode(base64_data)
+    except (binascii.Error, ValueError):
+        raise InvalidImageError(message="Base64 이미지 데이터를 디코딩할 수 없습니다.")
+    return data, hashlib.sha256(data).hexdigest()
+
+
+def _to_attachment(uploaded: UploadedFile) -> ImageAttachment:
+    return ImageAttachment(mime_type=uploaded.mime_type, url=uploaded.uri)
+
+
+def _too_large(max_bytes: int) -> InvalidImageError:
+    return InvalidImageError(message=f"이미지가 너무 큽니다. (최대 {max_bytes} 바이트)")
+
+
+def _count(outcome: str) -> None:
+    metrics.increment("llm_image_resolve_total", {"outcome": outcome})
+
+
+image_resolver = ImageResolver()
+
+__all__ = ["ImageResolver", "image_resolver"]
@@ -0,0 +1,508 @@
+import asyncio
+import gzip
+import importlib
+import io
+import json
+import math
+import os
+import random
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+from app.core.config import (
+    GEMINI_API_KEY,
+    GEMINI_MODEL_POOL_SIZE,
+    LLM_BACKEND,
+    LLM_RECORDING_PATH,
+    LLM_REPLAY_ALLOW_MISS,
+    LLM_REPLAY_LATENCY,
+    LLM_REPLAY_SEED,
+)
+from app.core.exceptions.exceptions import AppConfigError
+from app.feature.LLM.response_cache import build_cache_key
+
+# 기록 파일에는 SHA-256 키의 앞 128비트만 저장합니다.
+_RECORD_KEY_LENGTH = 32
+# gzip 기록은 줄마다 flush하면 압축률이 떨어지므로 일정 개수마다 flush합니다.
+_RECORD_FLUSH_EVERY = 50
+
+
+@dataclass(frozen=True)
+class UploadedFile:
+    """Files API에 업로드된 파일 핸들. expires_at은 epoch 초 (만료 정보가 없으면 None)."""
+
+    uri: str
+    mime_type: str
+    expires_at: Optional[float] = None
+
+
+class LLMBackend:
+    """
+    GeminiClient 뒤에서 실제 업스트림 호출 한 번을 수행하는 백엔드 인터페이스.
+
+    타임아웃/재시도/헤징/서킷 브레이커/동시성 제한은 GeminiClient가 담당하고,
+    백엔드는 "프롬프트 -> 텍스트" 호출만 구현합니다.
+    """
+
+    name = "base"
+
+    async def warm_up(self, system_instruction: str, model_name: str) -> None:
+        return None
+
+    async def generate(
+        self,
+        prompt_segments: List[object],
+        system_instruction: str,
+        model_name: str,
+    ) -> str:
+        """응답 텍스트를 반환합니다. (비어 있을 수 있음)"""
+        raise NotImplementedError
+
+    async def open_stream(
+        self,
+        prompt_segments: List[object],
+        system_instruction: str,
+        model_name: str,
+    ) -> AsyncIterator[str]:
+        """
+        스트림 연결을 수립한 뒤 텍스트 청크 이터레이터를 반환합니다.
+        (GeminiClient는 deadline을 연결 수립까지만 적용합니다.)
+        """
+        raise NotImplementedError
+
+    async def upload_file(self, data: bytes, mime_type: str, digest: str) -> UploadedFile:
+        """
+        파일을 업로드하고 프롬프트에서 file_uri로 참조할 핸들을 반환합니다.
+        digest는 콘텐츠의 SHA-256이며 표시 이름/기록 키로 사용됩니다.
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        return None
+
+    def stats(self) -> dict:
+        return {}
+
+
+class GeminiBackend(LLMBackend):
+    """
+    google-generativeai SDK를 사용하는 실제 백엔드.
+
+    SDK import/설정은 첫 사용 시점(또는 warm_up 호출 시)으로 지연되며,
+    GenerativeModel 인스턴스는 (model_name, system_instruction) 단위로 재사용됩니다.
+    """
+
+    name = "gemini"
+
+    def __init__(
+        self,
+        api_key: str | None = GEMINI_API_KEY,
+        model_pool_size: int = GEMINI_MODEL_POOL_SIZE,
+    ) -> None:
+        self._api_key = api_key
+        self._genai = None
+        self._model_pool_size = max(1, model_pool_size)
+        self._models: "OrderedDict[Tuple[str, str], object]" = OrderedDict()
+
+    @staticmethod
+    def _import_sdk():
+        try:
+            return importlib.import_module("google.generativeai")
+        except ModuleNotFoundError as exc:
+            raise AppConfigError(
+                "필수 패키지 'google-generativeai'가 설치되지 않았습니다. "
+                "pip install google-generativeai 로 설치하세요."
+            ) from exc
+
+    def _configure(self, genai, api_key: str | None) -> None:
+        if not api_key:
+            raise AppConfigError(
+                "환경 변수 'GEMINI_API_KEY'가 설정되지 않았습니다. .env를 확인하세요."
+            )
+
+        genai.configure(api_key=api_key)
+
+    def _ensure_sdk(self):
+        if self._genai is None:
+            genai = self._import_sdk()
+            self._configure(genai, self._api_key)
+            self._genai = genai
+        return self._genai
+
+    def _get_model(self, system_instruction: str, model_name: str):
+        """
+        (model_name, system_instruction) 키로 GenerativeModel을 재사용합니다.
+        풀 크기를 넘으면 가장 오래 사용되지 않은 모델부터 제거합니다.
+        """
+        key = (model_name, system_instruction)
+        model = self._models.get(key)
+        if model is not None:
+            self._models.move_to_end(key)
+            return model
+
+        genai = self._ensure_sdk()
+        model = genai.GenerativeModel(
+            model_name=model_name,
+            system_instruction=system_instruction,
+        )
+        self._models[key] = model
+        while len(self._models) > self._model_pool_size:
+            self._models.popitem(last=False)
+        return model
+
+    async def warm_up(self, system_instruction: str, model_name: str) -> None:
+        # SDK import는 수백 ms가 걸리므로, 함께 진행 중인 다른 시작 작업(Firebase 초기화 등)을
+        # 막지 않도록 이벤트 루프 밖에서 수행합니다.
+        await asyncio.to_thread(self._ensure_sdk)
+        model = self._get_model(system_instruction, model_name)
+        await model.count_tokens_async("ping")
+
+    async def generate(self, prompt_segments, system_instruction, model_name) -> str:
+        model = self._get_model(system_instruction, model_name)
+        response = await model.generate_content_async(prompt_segments)
+        return getattr(response, "text", "") or ""
+
+    async def open_stream(self, prompt_segments, system_instruction, model_name):
+        model = self._get_model(system_instruction, model_name)
+        response = await model.generate_content_async(prompt_segments, stream=True)
+        return self._iter_chunks(response)
+
+    @staticmethod
+    async def _iter_chunks(response) -> AsyncIterator[str]:
+        async for chunk in response:
+            text = _chunk_text(chunk)
+            if text:
+                yield text
+
+    async def upload_file(self, data: bytes, mime_type: str, digest: str) -> UploadedFile:
+        genai = self._ensure_sdk()
+        # SDK의 upload_file은 동기 HTTP 호출이므로 이벤트 루프 밖에서 실행합니다.
+        file = await asyncio.to_thread(
+            genai.upload_file,
+            io.BytesIO(data),
+            mime_type=mime_type,
+            display_name=f"image-{digest[:16]}",
+        )
+        expiration = getattr(file, "expiration_time", None)
+        return UploadedFile(
+            uri=file.uri,
+            mime_type=getattr(file, "mime_type", None) or mime_type,
+            expires_at=expiration.timestamp() if expiration else None,
+        )
+
+
+@dataclass
+class RecordedCall:
+    """기록 파일의 한 줄. 지연 시간은 밀리초 단위입니다."""
+
+    key: str
+    model_name: str
+    text: str
+    latency_ms: float
+    first_chunk_ms: Optional[float] = None  # 스트리밍 호출만 기록
+    chunks: int = 1
+
+    def to_line(self) -> str:
+        record = {"k": self.key, "m": self.model_name, "l": self.latency_ms, "t": self.text}
+        if self.first_chunk_ms is not None:
+            record["f"] = self.first_chunk_ms
+            record["c"] = self.chunks
+        return json.dumps(record, ensure_ascii=False, separators=(",", ":"))
+
+    @classmethod
+    def from_record(cls, record: dict) -> "RecordedCall":
+        return cls(
+            key=record["k"],
+            model_name=record["m"],
+            text=record["t"],
+            latency_ms=record["l"],
+            first_chunk_ms=record.get("f"),
+            chunks=record.get("c", 1),
+        )
+
+
+def _record_key(prompt_segments: List[object], system_instruction: str, model_name: str) -> str:
+    return build_cache_key(prompt_segments, system_instruction, model_name)[:_RECORD_KEY_LENGTH]
+
+
+def _open_recording(path: str, mode: str):
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+class RecordingBackend(LLMBackend):
+    """
+    실제 백엔드를 그대로 호출하면서, 성공한 호출의 프롬프트 해시/응답/지연 시간을
+    JSON Lines 파일(.gz면 gzip 압축)에 덧붙여 기록합니다.
+    기록된 지연 시간은 limiter 대기를 제외한 순수 업스트림 호출 시간입니다.
+    """
+
+    name = "record"
+
+    def __init__(self, inner: LLMBackend, path: str = LLM_RECORDING_PATH) -> None:
+        self.inner = inner
+        self.path = path
+        self._file = None
+        self._pending = 0
+        self.recorded = 0
+
+    async def warm_up(self, system_instruction: str, model_name: str) -> None:
+        await self.inner.warm_up(system_instruction, model_name)
+
+    async def generate(self, prompt_segments, system_instruction, model_name) -> str:
+        started = time.monotonic()
+        text = await self.inner.generate(prompt_segments, system_instruction, model_name)
+        if text.strip():
+            self._write(RecordedCall(
+                key=_record_key(prompt_segments, system_instruction, model_name),
+                model_name=model_name,
+                text=text,
+                latency_ms=_elapsed_ms(started),
+            ).to_line())
+        return text
+
+    async def open_stream(self, prompt_segments, system_instruction, model_name):
+        started = time.monotonic()
+        chunks = await self.inner.open_stream(prompt_segments, system_instruction, model_name)
+        key = _record_key(prompt_segments, system_instruction, model_name)
+        return self._record_stream(chunks, key, model_name, started)
+
+    async def _record_stream(self, chunks, key: str, model_name: str, started: float):
+        parts: List[str] = []
+        first_chunk_ms = None
+        async for chunk in chunks:
+            if first_chunk_ms is None:
+                first_chunk_ms = _elapsed_ms(started)
+            parts.append(chunk)
+            yield chunk
+
+        # 끝까지 수신한 스트림만 기록합니다.
+        if parts:
+            self._write(RecordedCall(
+                key=key,
+                model_name=model_name,
+                text="".join(parts),
+                latency_ms=_elapsed_ms(started),
+                first_chunk_ms=first_chunk_ms,
+                chunks=len(parts),
+            ).to_line())
+
+    async def upload_file(self, data: bytes, mime_type: str, digest: str) -> UploadedFile:
+        uploaded = await self.inner.upload_file(data, mime_type, digest)
+        # 재생 시 같은 이미지가 같은 file_uri로 바뀌어야 프롬프트 키가 일치합니다.
+        self._write(json.dumps(
+            {"d": digest, "u": uploaded.uri, "m": uploaded.mime_type},
+            separators=(",", ":"),
+        ))
+        return uploaded
+
+    def _write(self, line: str) -> None:
+        if self._file is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._file = _open_recording(self.path, "a")
+        self._file.write(line + "\n")
+        self.recorded += 1
+        self._pending += 1
+        if self._pending >= _RECORD_FLUSH_EVERY:
+            self._file.flush()
+            self._pending = 0
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._pending = 0
+        self.inner.close()
+
+    def stats(self) -> dict:
+        return {"recorded": self.recorded, "path": self.path}
+
+
+class _LogNormal:
+    """기록된 지연 시간(ms)에 맞춘 로그정규 분포."""
+
+    def __init__(self, samples: List[float]) -> None:
+        logs = [math.log(max(sample, 0.1)) for sample in samples]
+        self.mu = sum(logs) / len(logs) if logs else 0.0
+        variance = sum((value - self.mu) ** 2 for value in logs) / len(logs) if logs else 0.0
+        self.sigma = math.sqrt(variance)
+        self.empty = not logs
+
+    def sample(self, rng: random.Random) -> float:
+        if self.empty:
+            return 0.0
+        return rng.lognormvariate(self.mu, self.sigma)
+
+
+class ReplayBackend(LLMBackend):
+    """
+    RecordingBackend가 남긴 기록으로 업스트림 없이 응답합니다. (GEMINI_API_KEY 불필요)
+
+    - latency_mode=recorded: 같은 프롬프트의 기록된 지연 시간을 재현
+      (기록에 없는 프롬프트는 synthetic과 같이 분포에서 추출)
+    - latency_mode=synthetic: 기록 전체에 맞춘 로그정규 분포에서 지연 시간 추출
+    - latency_mode=none: 지연 없이 즉시 응답
+    같은 프롬프트가 여러 번 기록되어 있으면 차례대로 돌려가며 사용합니다.
+    allow_miss가 켜져 있으면 기록에 없는 프롬프트에 키 해시로 고른 기록 응답을 돌려주고,
+    꺼져 있으면 LookupError를 발생시킵니다. (GeminiClient에서 ExternalApiError로 변환)
+    """
+
+    name = "replay"
+
+    def __init__(
+        self,
+        path: str = LLM_RECORDING_PATH,
+        latency_mode: str = LLM_REPLAY_LATENCY,
+        allow_miss: bool = LLM_REPLAY_ALLOW_MISS,
+        seed: int = LLM_REPLAY_SEED,
+    ) -> None:
+        self.path = path
+        self.latency_mode = latency_mode
+        self.allow_miss = allow_miss
+        self._rng = random.Random(seed)
+        self._records: Optional[Dict[str, List[RecordedCall]]] = None
+        self._all: List[RecordedCall] = []
+        self._uploads: Dict[str, UploadedFile] = {}
+        self._cursor: Dict[str, int] = {}
+        self._latency = _LogNormal([])
+        self._first_chunk_latency = _LogNormal([])
+        self.hits = 0
+        self.misses = 0
+
+    def _load(self) -> Dict[str, List[RecordedCall]]:
+        if self._records is not None:
+            return self._records
+
+        calls: List[RecordedCall] = []
+        try:
+            with _open_recording(self.path, "r") as file:
+                for line in file:
+                    if not line.strip():
+                        continue
+                    record = json.loads(line)
+                    if "u" in record:
+                        self._uploads[record["d"]] = UploadedFile(uri=record["u"], mime_type=record["m"])
+                    else:
+                        calls.append(RecordedCall.from_record(record))
+        except FileNotFoundError as exc:
+            raise AppConfigError(
+                f"재생할 LLM 기록 파일이 없습니다: {self.path} (LLM_BACKEND=record로 먼저 기록하세요)"
+            ) from exc
+        if not calls:
+            raise AppConfigError(f"LLM 기록 파일에 항목이 없습니다: {self.path}")
+
+        records: Dict[str, List[RecordedCall]] = {}
+        for call in calls:
+            records.setdefault(call.key, []).append(call)
+
+        self._all = calls
+        self._latency = _LogNormal([call.latency_ms for call in calls])
+        first_chunks = [call.first_chunk_ms for call in calls if call.first_chunk_ms is not None]
+        self._first_chunk_latency = _LogNormal(first_chunks) if first_chunks else self._latency
+        self._records = records
+        return records
+
+    def _lookup(self, prompt_segments, system_instruction, model_name) -> Tuple[RecordedCall, bool]:
+        records = self._load()
+        key = _record_key(prompt_segments, system_instruction, model_name)
+        candidates = records.get(key)
+        if candidates:
+            index = self._cursor.get(key, 0)
+            self._cursor[key] = index + 1
+            self.hits += 1
+            return candidates[index % len(candidates)], True
+
+        self.misses += 1
+        if not self.allow_miss:
+            raise LookupError(f"재생 기록에 없는 프롬프트입니다. (key={key})")
+        return self._all[int(key[:8], 16) % len(self._all)], False
+
+    def _delay_seconds(self, call: RecordedCall, hit: bool, first_chunk: bool = False) -> float:
+        if self.latency_mode == "none":
+            return 0.0
+        if self.latency_mode == "recorded" and hit:
+            recorded = call.first_chunk_ms if first_chunk else call.latency_ms
+            if recorded is not None:
+                return recorded / 1000
+        distribution = self._first_chunk_latency if first_chunk else self._latency
+        return distribution.sample(self._rng) / 1000
+
+    async def warm_up(self, system_instruction: str, model_name: str) -> None:
+        self._load()
+
+    async def generate(self, prompt_segments, system_instruction, model_name) -> str:
+        call, hit = self._lookup(prompt_segments, system_instruction, model_name)
+        await asyncio.sleep(self._delay_seconds(call, hit))
+        return call.text
+
+    async def open_stream(self, prompt_segments, system_instruction, model_name):
+        call, hit = self._lookup(prompt_segments, system_instruction, model_name)
+        await asyncio.sleep(self._delay_seconds(call, hit, first_chunk=True))
+        return self._replay_chunks(call, hit)
+
+    async def upload_file(self, data: bytes, mime_type: str, digest: str) -> UploadedFile:
+        self._load()
+        uploaded = self._uploads.get(digest)
+        if uploaded is None:
+            uploaded = UploadedFile(uri=f"replay://files/{digest[:32]}", mime_type=mime_type)
+        return uploaded
+
+    async def _replay_chunks(self, call: RecordedCall, hit: bool) -> AsyncIterator[str]:
+        count = max(1, call.chunks)
+        size = math.ceil(len(call.text) / count)
+        gap = 0.0
+        if self.latency_mode == "recorded" and hit and call.first_chunk_ms is not None and count > 1:
+            gap = max(0.0, call.latency_ms - call.first_chunk_ms) / 1000 / (count - 1)
+
+        for index in range(0, len(call.text), size):
+            if index and gap:
+                await asyncio.sleep(gap)
+            yield call.text[index:index + size]
+
+    def stats(self) -> dict:
+        return {
+            "records": len(self._all),
+            "hits": self.hits,
+            "misses": self.misses,
+            "latency_mode": self.latency_mode,
+        }
+
+
+def create_backend(mode: str = LLM_BACKEND) -> LLMBackend:
+    """LLM_BACKEND 설정에 맞는 백엔드를 생성합니다."""
+    if mode == "replay":
+        return ReplayBackend()
+    if mode == "record":
+        return RecordingBackend(GeminiBackend())
+    return GeminiBackend()
+
+
+def _elapsed_ms(started: float) -> float:
+    return round((time.monotonic() - started) * 1000, 1)
+
+
+def _chunk_text(chunk: object) -> str:
+    """
+    스트리밍 청크에서 텍스트를 꺼냅니다.
+    안전 필터 등으로 텍스트가 없는 청크는 SDK가 ValueError를 던지므로 빈 문자열로 취급합니다.
+    """
+    try:
+        return getattr(chunk, "text", "") or ""
+    except ValueError:
+        return ""
+
+
+__all__ = [
+    "GeminiBackend",
+    "LLMBackend",
+    "RecordedCall",
+    "RecordingBackend",
+    "ReplayBackend",
+    "UploadedFile",
+    "create_backend",
+]
@@ -1,21 +1,151 @@
-from fastapi import APIRouter
+import json
+from typing import AsyncIterator, Optional
 
+import anyio
+from fastapi import APIRouter, Header, Request
+from fastapi.responses import StreamingResponse
+
+from app.core.exceptions.exception_handlers import ErrorResponse
+from app.core.exceptions.exceptions import CustomException
 from app.feature.LLM import llm_schemas, llm_service
+from app.feature.LLM.chat_jobs import chat_job_manager
 
 router = APIRouter(
     prefix="/llm",
     tags=["LLM"],
 )
 
+# 클라이언트가 지정하는 응답 기한(ms). 서버 최대값(GEMINI_TIMEOUT_MS)보다 길게 지정할 수 없습니다.
+TIMEOUT_HEADER = Header(
+    default=None,
+    alias="X-Request-Timeout-Ms",
+    ge=1,
+    description="Gemini 응답 기한 (밀리초)",
+)
+
 
 @router.post("/chat", response_model=llm_schemas.LLMChatResponse)
-async def chat_with_gemini(request: llm_schemas.LLMChatRequest):
+async def chat_with_gemini(
+    request: llm_schemas.LLMChatRequest,
+    timeout_ms: Optional[int] = TIMEOUT_HEADER,
+):
     """
     탑승권 사진 및 사용자 요청을 기반으로 항공사 리뷰/팁을 생성합니다.
     """
-    content = await llm_service.generate_chat_completion(request)
-    return llm_schemas.LLMChatResponse(
-        model=llm_service.MODEL_NAME,
-        content=content,
+    return await llm_service.generate_chat_completion(request, timeout_ms)
+
+
+@router.post("/chat/batch", response_model=llm_schemas.LLMBatchChatResponse)
+async def batch_chat_with_gemini(
+    request: llm_schemas.LLMBatchChatRequest,
+    timeout_ms: Optional[int] = TIMEOUT_HEADER,
+):
+    """
+    여러 채팅 요청(예: 여정의 구간별 질문)을 한 번에 받아 병렬로 처리합니다.
+    결과는 요청 순서대로 반환되며, 실패한 항목은 error 필드로 표시됩니다.
+    """
+    results = await llm_service.generate_batch_chat_completion(request.requests, timeout_ms)
+    return llm_schemas.LLMBatchChatResponse(results=results)
+
+
+@router.post(
+    "/chat/jobs",
+    response_model=llm_schemas.LLMChatJobResponse,
+    status_code=202,
+)
+async def create_chat_job(request: llm_schemas.LLMChatRequest):
+    """
+    오래 걸리는 채팅 요청(예: 여러 장의 탑승권 분석)을 비동기 작업으로 등록하고 job_id를 즉시 반환합니다.
+    결과는 GET /llm/chat/jobs/{job_id}로 조회합니다.
+    """
+    job = chat_job_manager.submit(request)
+    return job.to_response()
+
+
+@router.get("/chat/jobs/{job_id}", response_model=llm_schemas.LLMChatJobResponse)
+async def get_chat_job(job_id: str):
+    """
+    비동기 채팅 작업의 상태와 결과를 조회합니다. 완료된 결과는 일정 시간 후 만료됩니다.
+    """
+    return chat_job_manager.get(job_id).to_response()
+
+
+@router.post(
+    "/boarding-pass/parse",
+    response_model=llm_schemas.BoardingPassParseResponse,
+)
+async def parse_boarding_pass(request: llm_schemas.BoardingPassParseRequest):
+    """
+    탑승권 바코드(IATA BCBP)에서 항공편 정보를 추출합니다. (Gemini 호출 없음)
+    """
+    return llm_service.parse_boarding_pass(request.bcbp)
+
+
+@router.post("/chat/stream")
+async def stream_chat_with_gemini(
+    request: llm_schemas.LLMChatRequest,
+    http_request: Request,
+    timeout_ms: Optional[int] = TIMEOUT_HEADER,
+):
+    """
+    /llm/chat과 동일한 요청을 받아 응답을 Server-Sent Events로 스트리밍합니다.
+
+    - `data: {"content": "..."}` : 텍스트 청크
+    - `event: error` : 스트림 도중 발생한 오류 (ErrorResponse 형식)
+    - `event: done` : 스트림 정상 종료
+    """
+    chunks = llm_service.stream_chat_completion(request, timeout_ms)
+
+    # 첫 청크를 미리 받아 두면, 스트림 시작 전 오류는
+    # 일반 요청과 동일하게 custom_exception_handler가 처리합니다.
+    try:
+        first_chunk = await anext(chunks, None)
+    except BaseException:
+        await chunks.aclose()
+        raise
+
+    return StreamingResponse(
+        _sse_events(first_chunk, chunks, http_request),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+        },
     )
 
+
+async def _sse_events(
+    first_chunk: Optional[str],
+    chunks: AsyncIterator[str],
+    http_request: Request,
+) -> AsyncIterator[str]:
+    """
+    텍스트 청크를 SSE 이벤트 문자열로 변환합니다.
+    클라이언트 연결이 끊기면 업스트림 스트림을 정리하고 종료합니다.
+    """
+    try:
+        if first_chunk:
+            yield _format_sse({"content": first_chunk})
+
+        async for chunk in chunks:
+            if await http_request.is_disconnected():
+                return
+            yield _format_sse({"content": chunk})
+
+        yield _format_sse({}, event="done")
+
+    except CustomException as exc:
+        error = ErrorResponse(error_code=exc.error_code, message=exc.message)
+        yield _format_sse(error.model_dump(), event="error")
+
+    finally:
+        # 연결 종료로 취소된 상황에서도 업스트림 제너레이터가 정리되도록 보호합니다.
+        with anyio.CancelScope(shield=True):
+            await chunks.aclose()
+
+
+def _format_sse(data: dict, event: Optional[str] = None) -> str:
+    payload = json.dumps(data, ensure_ascii=False)
+    if event:
+        return f"event: {event}\ndata: {payload}\n\n"
+    return f"data: {payload}\n\n"
@@ -1,7 +1,10 @@
-from typing import List, Optional
+from typing import List, Literal, Optional
 
 from pydantic import BaseModel, Field, field_validator, model_validator
 
+from app.core.config import LLM_BATCH_MAX_ITEMS
+from app.core.exceptions.exception_handlers import ErrorResponse
+
 
 class FlightInfo(BaseModel):
     """
@@ -82,6 +85,40 @@ class LLMChatRequest(BaseModel):
         default=None,
         description="항공편 정보를 담고 있는 이미지 목록 (탑승권, 좌석표 등)",
     )
+    bcbp: Optional[str] = Field(
+        default=None,
+        description="탑승권 바코드 원문 (IATA BCBP). 있으면 로컬에서 항공편 정보를 추출합니다.",
+    )
+    context_priorities: Optional[List[int]] = Field(
+        default=None,
+        description="context 각 항목의 우선순위 (값이 클수록 토큰 예산 초과 시 먼저 유지)",
+    )
+    model_tier: Optional[str] = Field(
+        default=None,
+        description="모델 티어 힌트 (예: fast, standard). 서버가 허용한 티어만 적용되며, 미지정 시 서버가 자동 선택합니다.",
+    )
+    max_prompt_tokens: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="이 요청의 프롬프트 토큰 예산 (서버 예산보다 작을 때만 적용, 미지정 시 서버 기본값 사용)",
+    )
+
+    @model_validator(mode="after")
+    def validate_context_priorities(self):
+        if self.context_priorities is not None and len(self.context_priorities) != len(self.context or []):
+            raise ValueError("context_priorities는 context와 길이가 같아야 합니다.")
+        return self
+
+
+class PromptTokenUsage(BaseModel):
+    """
+    로컬에서 추정한 프롬프트 토큰 사용량
+    """
+
+    estimated_prompt_tokens: int = Field(..., description="최종 프롬프트(이미지 포함)의 추정 토큰 수")
+    estimated_context_tokens: int = Field(..., description="포함된 context의 추정 토큰 수")
+    token_budget: Optional[int] = Field(default=None, description="적용된 토큰 예산 (없으면 미적용)")
+    dropped_context_count: int = Field(default=0, description="예산 초과로 제외된 context 항목 수")
 
 
 class LLMChatResponse(BaseModel):
@@ -91,4 +128,66 @@ class LLMChatResponse(BaseModel):
 
     model: str
     content: str
+    usage: Optional[PromptTokenUsage] = None
+
+
+class BoardingPassParseRequest(BaseModel):
+    """
+    탑승권 바코드(BCBP) 파싱 요청 스키마
+    """
+
+    bcbp: str = Field(..., min_length=1, description="탑승권 바코드 원문 (IATA BCBP)")
+
+
+class BoardingPassParseResponse(BaseModel):
+    """
+    LLM 호출 없이 BCBP에서 추출한 탑승권 정보
+    """
+
+    passenger_name: str
+    electronic_ticket: bool
+    legs: List[FlightInfo]
+
+
+class LLMBatchChatRequest(BaseModel):
+    """
+    여러 채팅 요청을 한 번의 HTTP 요청으로 처리하기 위한 배치 스키마
+    """
+
+    requests: List[LLMChatRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=LLM_BATCH_MAX_ITEMS,
+        description="동시에 처리할 채팅 요청 목록 (예: 여정의 구간별 질문)",
+    )
+
+
+class LLMBatchChatItem(BaseModel):
+    """
+    배치 내 개별 요청의 처리 결과. response 또는 error 중 하나만 채워집니다.
+    """
+
+    index: int = Field(..., description="요청 목록에서의 위치")
+    response: Optional[LLMChatResponse] = None
+    error: Optional[ErrorResponse] = None
+
+
+class LLMBatchChatResponse(BaseModel):
+    """
+    요청 순서와 동일한 순서의 개별 결과 목록
+    """
+
+    results: List[LLMBatchChatItem]
+
+
+class LLMChatJobResponse(BaseModel):
+    """
+    비동기 채팅 작업의 상태. 완료되면 result 또는 error가 채워집니다.
+    """
 
+    job_id: str
+    status: Literal["queued", "running", "succeeded", "failed"]
+    created_at: str
+    finished_at: Optional[str] = None
+    result: Optional[LLMChatResponse] = None
+    error: Optional[ErrorResponse] = None
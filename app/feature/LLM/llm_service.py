@@ -1,26 +1,315 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import AsyncIterator, Awaitable, List, Optional, Tuple
+
+from app.core.config import (
+    GEMINI_TIMEOUT_MS,
+    LLM_BATCH_CONCURRENCY,
+    LLM_PROMPT_TOKEN_BUDGET,
+)
+from app.core.exceptions.exception_handlers import ErrorResponse
+from app.core.exceptions.exceptions import CustomException
+from app.feature.LLM.bcbp_parser import parse_bcbp
 from app.feature.LLM.gemini_client import gemini_client
-from app.feature.LLM.llm_schemas import LLMChatRequest
+from app.feature.LLM.image_preprocessor import preprocess_images
+from app.feature.LLM.image_resolver import image_resolver
+from app.feature.LLM.model_router import model_router
+from app.feature.LLM.llm_schemas import (
+    BoardingPassParseResponse,
+    FlightInfo,
+    LLMBatchChatItem,
+    LLMChatRequest,
+    LLMChatResponse,
+)
 from app.feature.LLM.prompt_builder import (
     DEFAULT_SYSTEM_INSTRUCTION,
-    build_prompt_segments,
+    PromptBuild,
+    build_prompt,
 )
+from app.feature.LLM.response_cache import build_cache_key, response_cache
+from app.feature.LLM.semantic_cache import build_scope, normalize_tokens, order_sensitive_key, semantic_cache
+from app.shared.metrics import metrics
+
+metrics.register_collector("llm_response_cache", response_cache.stats)
+metrics.register_collector("llm_semantic_cache", semantic_cache.stats)
+metrics.register_collector("gemini_limiter", gemini_client.limiter_stats)
+metrics.register_collector("llm_backend", gemini_client.backend_stats)
+metrics.register_collector("llm_image_resolver", image_resolver.stats)
+
 
+@dataclass
+class _PreparedChat:
+    """요청에서 만들어진 Gemini 호출 입력."""
 
-async def generate_chat_completion(request: LLMChatRequest) -> str:
+    system_instruction: str
+    prompt: PromptBuild
+    flights: List[FlightInfo]
+    # 중복 제거/전처리 후 프롬프트에 들어간 이미지 수 (모델 라우팅 기준)
+    image_count: int
+
+
+async def _prepare_prompt(request: LLMChatRequest) -> _PreparedChat:
     """
-    Gemini 모델에 프롬프트를 전달하고 응답 텍스트를 반환합니다.
+    요청으로부터 시스템 인스트럭션과 최종 프롬프트 세그먼트를 구성합니다.
+    이미지는 워커 풀에서 축소/재인코딩/중복 제거되고, URL/큰 이미지는 Files API 핸들로 바뀐 뒤
+    프롬프트에 포함되며, context는 토큰 예산 안에서만 포함됩니다.
     """
     system_instruction = request.system_instruction or DEFAULT_SYSTEM_INSTRUCTION
+    images = await image_resolver.resolve(await preprocess_images(request.images))
+    flight_info, additional_flights = _resolve_flights(request)
 
-    prompt_segments = build_prompt_segments(
+    prompt = build_prompt(
         prompt=request.prompt,
         context=request.context,
-        flight_info=request.flight_info,
-        images=request.images,
+        flight_info=flight_info,
+        images=images,
+        additional_flights=additional_flights,
+        token_budget=_resolve_token_budget(request),
+        context_priorities=request.context_priorities,
+    )
+    flights = [flight_info, *additional_flights] if flight_info else list(additional_flights)
+    return _PreparedChat(system_instruction, prompt, flights, len(images or []))
+
+
+def _resolve_token_budget(request: LLMChatRequest) -> int:
+    """
+    요청의 max_prompt_tokens는 서버 예산(LLM_PROMPT_TOKEN_BUDGET)을 줄이는 데만 사용합니다.
+    (서버 예산이 0(무제한)이면 요청 값을 그대로 사용)
+    """
+    if not request.max_prompt_tokens:
+        return LLM_PROMPT_TOKEN_BUDGET
+    if not LLM_PROMPT_TOKEN_BUDGET:
+        return request.max_prompt_tokens
+    return min(request.max_prompt_tokens, LLM_PROMPT_TOKEN_BUDGET)
+
+
+def _semantic_key(
+    request: LLMChatRequest,
+    prepared: _PreparedChat,
+    model_name: str,
+) -> Optional[Tuple[int, List[str]]]:
+    """
+    유사 프롬프트 캐시용 (scope, 정규화 토큰)을 만듭니다. 이미지가 있는 요청은 대상이 아닙니다.
+    context와 비교/부정 질문의 어순은 scope에서 정확히 비교하고, 유사도는 이번 질문(prompt)만으로 판단합니다.
+    """
+    if request.images or not semantic_cache.enabled:
+        return None
+    scope = build_scope(
+        model_name,
+        prepared.system_instruction,
+        prepared.flights,
+        context=request.context or (),
+        order_key=order_sensitive_key(request.prompt),
+    )
+    return scope, normalize_tokens(request.prompt)
+
+
+def _resolve_flights(
+    request: LLMChatRequest,
+) -> Tuple[Optional[FlightInfo], List[FlightInfo]]:
+    """
+    요청에 BCBP가 있으면 로컬에서 파싱하여 항공편 정보를 채웁니다.
+    사용자가 직접 보낸 flight_info 값이 첫 구간의 파싱 결과보다 우선합니다.
+    """
+    if not request.bcbp:
+        return request.flight_info, []
+
+    legs = parse_bcbp(request.bcbp).legs
+    flight_info = legs[0]
+    if request.flight_info:
+        flight_info = flight_info.model_copy(
+            update=request.flight_info.model_dump(exclude_none=True)
+        )
+    return flight_info, legs[1:]
+
+
+def _resolve_deadline(timeout_ms: Optional[int]) -> float:
+    """
+    클라이언트가 요청한 타임아웃(ms)과 서버 최대값 중 작은 값으로 Gemini 호출 기한을 계산합니다.
+    """
+    limit_ms = GEMINI_TIMEOUT_MS if not timeout_ms else min(timeout_ms, GEMINI_TIMEOUT_MS)
+    return time.monotonic() + limit_ms / 1000
+
+
+def parse_boarding_pass(bcbp: str) -> BoardingPassParseResponse:
+    """
+    [동기 함수] Gemini 호출 없이 BCBP 문자열에서 탑승권 정보를 추출합니다.
+    (CPU 작업이며 수 마이크로초 내에 끝나므로 async가 필요 없습니다.)
+    """
+    boarding_pass = parse_bcbp(bcbp)
+    return BoardingPassParseResponse(
+        passenger_name=boarding_pass.passenger_name,
+        electronic_ticket=boarding_pass.electronic_ticket,
+        legs=boarding_pass.legs,
+    )
+
+
+async def generate_chat_completion(
+    request: LLMChatRequest,
+    timeout_ms: Optional[int] = None,
+    deadline: Optional[float] = None,
+) -> LLMChatResponse:
+    """
+    Gemini 모델에 프롬프트를 전달하고 응답과 토큰 추정치를 반환합니다.
+    동일한 프롬프트/이미지/인스트럭션/모델 조합은 응답 캐시를 통해 재사용됩니다.
+    timeout_ms는 클라이언트가 지정한 응답 기한입니다. (서버 최대값을 넘을 수 없음)
+    deadline(time.monotonic 기준 시각)을 넘기면 timeout_ms 대신 그 기한을 사용합니다. (배치 처리용)
+    """
+    deadline = deadline or _resolve_deadline(timeout_ms)
+    prepared = await _prepare_prompt(request)
+    route = model_router.route(request, prepared.prompt.usage, prepared.image_count)
+
+    cache_key = build_cache_key(
+        prompt_segments=prepared.prompt.segments,
+        system_instruction=prepared.system_instruction,
+        model_name=route.model_name,
+    )
+
+    content = await response_cache.get_or_generate(
+        cache_key,
+        lambda: _generate_uncached(request, prepared, route.model_name, deadline),
+    )
+    return LLMChatResponse(
+        model=route.model_name,
+        content=content,
+        usage=prepared.prompt.usage,
+    )
+
+
+async def _generate_uncached(
+    request: LLMChatRequest,
+    prepared: _PreparedChat,
+    model_name: str,
+    deadline: float,
+) -> str:
+    """
+    정확 일치 캐시에 없는 요청을 처리합니다.
+    텍스트 요청은 유사 프롬프트(SimHash) 캐시를 먼저 확인하고, 없으면 Gemini를 호출합니다.
+    """
+    semantic_key = _semantic_key(request, prepared, model_name)
+    if semantic_key is not None:
+        cached = semantic_cache.lookup(*semantic_key)
+        if cached is not None:
+            return cached
+
+    content = await _timed_generate(
+        model_name,
+        gemini_client.generate(
+            prompt_segments=prepared.prompt.segments,
+            system_instruction=prepared.system_instruction,
+            deadline=deadline,
+            model_name=model_name,
+        ),
+    )
+
+    if semantic_key is not None:
+        semantic_cache.store(*semantic_key, content)
+    return content
+
+
+async def _timed_generate(model_name: str, call: Awaitable[str]) -> str:
+    """업스트림 호출 지연 시간을 모델별로 기록합니다. (캐시 적중은 기록되지 않습니다.)"""
+    started = time.perf_counter()
+    try:
+        return await call
+    finally:
+        metrics.observe(
+            "llm_generate_seconds",
+            time.perf_counter() - started,
+            {"model": model_name},
+        )
+
+
+async def stream_chat_completion(
+    request: LLMChatRequest,
+    timeout_ms: Optional[int] = None,
+) -> AsyncIterator[str]:
+    """
+    Gemini 응답을 텍스트 청크 단위로 스트리밍합니다.
+    캐시된 응답이 있으면 한 번에 반환하고, 스트림이 끝까지 완료되면 응답을 캐시에 저장합니다.
+    """
+    deadline = _resolve_deadline(timeout_ms)
+    prepared = await _prepare_prompt(request)
+    route = model_router.route(request, prepared.prompt.usage, prepared.image_count)
+
+    cache_key = build_cache_key(
+        prompt_segments=prepared.prompt.segments,
+        system_instruction=prepared.system_instruction,
+        model_name=route.model_name,
     )
 
-    return await gemini_client.generate(
-        prompt_segments=prompt_segments,
-        system_instruction=system_instruction,
+    cached = response_cache.peek(cache_key)
+    semantic_key = _semantic_key(request, prepared, route.model_name)
+    if cached is None and semantic_key is not None:
+        cached = semantic_cache.lookup(*semantic_key)
+    if cached is not None:
+        yield cached
+        return
+
+    chunks: List[str] = []
+    async for chunk in gemini_client.generate_stream(
+        prompt_segments=prepared.prompt.segments,
+        system_instruction=prepared.system_instruction,
+        deadline=deadline,
+        model_name=route.model_name,
+    ):
+        chunks.append(chunk)
+        yield chunk
+
+    content = "".join(chunks).strip()
+    response_cache.store(cache_key, content)
+    if semantic_key is not None:
+        semantic_cache.store(*semantic_key, content)
+
+
+async def generate_batch_chat_completion(
+    requests: List[LLMChatRequest],
+    timeout_ms: Optional[int] = None,
+) -> List[LLMBatchChatItem]:
+    """
+    여러 채팅 요청을 동시 실행 상한(LLM_BATCH_CONCURRENCY) 안에서 병렬로 처리합니다.
+    개별 요청의 실패는 해당 항목의 error로만 기록되며, 배치 전체를 실패시키지 않습니다.
+    기한은 배치 시작 시점에 한 번 계산해 모든 항목에 적용하므로, 동시 실행 상한 때문에 기다린 항목도
+    같은 기한 안에서 처리되며(넘기면 해당 항목만 504), 배치 전체가 timeout을 넘겨 실행되지 않습니다.
+    """
+    deadline = _resolve_deadline(timeout_ms)
+    semaphore = asyncio.Semaphore(max(1, LLM_BATCH_CONCURRENCY))
+
+    async def run_item(index: int, request: LLMChatRequest) -> LLMBatchChatItem:
+        async with semaphore:
+            try:
+                response = await generate_chat_completion(request, deadline=deadline)
+            except CustomException as exc:
+                return LLMBatchChatItem(
+                    index=index,
+                    error=ErrorResponse(error_code=exc.error_code, message=exc.message),
+                )
+            except Exception as exc:
+                return LLMBatchChatItem(
+                    index=index,
+                    error=ErrorResponse(
+                        error_code="INTERNAL_SERVER_ERROR",
+                        message=f"요청 처리 중 오류가 발생했습니다: {exc}",
+                    ),
+                )
+
+        return LLMBatchChatItem(index=index, response=response)
+
+    return list(
+        await asyncio.gather(
+            *(run_item(index, request) for index, request in enumerate(requests))
+        )
     )
 
+
+async def warm_up() -> None:
+    """
+    기본 시스템 인스트럭션 모델을 미리 생성하고 연결을 수립합니다. (앱 시작 시 호출)
+    """
+    await gemini_client.warm_up(DEFAULT_SYSTEM_INSTRUCTION)
+
+
+def shutdown() -> None:
+    """LLM 백엔드 자원(기록 파일 등)을 정리합니다. (앱 종료 시 호출)"""
+    gemini_client.close()
@@ -0,0 +1,90 @@
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional
+
+from app.core.config import (
+    LLM_MODEL_TIERS,
+    LLM_ROUTING_ADVANCED_MIN_IMAGES,
+    LLM_ROUTING_CLIENT_TIERS,
+    LLM_ROUTING_ENABLED,
+    LLM_ROUTING_FAST_MAX_TOKENS,
+)
+from app.feature.LLM.llm_schemas import LLMChatRequest, PromptTokenUsage
+from app.shared.metrics import metrics
+
+
+@dataclass(frozen=True)
+class ModelRoute:
+    """요청 하나에 대한 모델 선택 결과."""
+
+    tier: str
+    model_name: str
+    reason: str
+
+
+class ModelRouter:
+    """
+    요청 특성(이미지 유무/개수, 프롬프트 크기, 명시적 힌트)에 따라 모델 티어를 선택합니다.
+    비활성화(기본값) 상태에서는 항상 standard를 사용합니다.
+
+    규칙 (위에서부터 먼저 일치하는 규칙 적용):
+    1. 요청의 model_tier 힌트가 클라이언트 선택 가능 티어(client_tiers)이고 라우팅 테이블에 있으면 해당 티어
+    2. (중복 제거/전처리 후) 이미지가 advanced_min_images장 이상이면 advanced
+    3. 이미지가 있으면 standard
+    4. 추정 프롬프트 토큰이 fast_max_tokens 이하인 텍스트 요청이면 fast
+    5. 그 외 standard
+    테이블에 없는 티어는 standard로 대체됩니다.
+    """
+
+    def __init__(
+        self,
+        tiers: Dict[str, str] = LLM_MODEL_TIERS,
+        enabled: bool = LLM_ROUTING_ENABLED,
+        fast_max_tokens: int = LLM_ROUTING_FAST_MAX_TOKENS,
+        advanced_min_images: int = LLM_ROUTING_ADVANCED_MIN_IMAGES,
+        client_tiers: Iterable[str] = LLM_ROUTING_CLIENT_TIERS,
+    ) -> None:
+        self.tiers = dict(tiers)
+        self.enabled = enabled
+        self.fast_max_tokens = fast_max_tokens
+        self.advanced_min_images = advanced_min_images
+        self.client_tiers = frozenset(client_tiers)
+
+    def route(
+        self,
+        request: LLMChatRequest,
+        usage: Optional[PromptTokenUsage],
+        image_count: int,
+    ) -> ModelRoute:
+        """image_count는 중복 제거/전처리 후 프롬프트에 실제로 들어가는 이미지 수입니다."""
+        tier, reason = self._select_tier(request, usage, image_count)
+        if tier not in self.tiers:
+            tier, reason = "standard", f"{reason}:fallback"
+
+        decision = ModelRoute(tier=tier, model_name=self.tiers[tier], reason=reason)
+        metrics.increment(
+            "llm_model_route_total",
+            {"tier": decision.tier, "model": decision.model_name, "reason": decision.reason},
+        )
+        return decision
+
+    def _select_tier(self, request: LLMChatRequest, usage: Optional[PromptTokenUsage], image_count: int):
+        if not self.enabled:
+            return "standard", "routing_disabled"
+
+        if request.model_tier in self.client_tiers and request.model_tier in self.tiers:
+            return request.model_tier, "hint"
+
+        if image_count >= self.advanced_min_images:
+            return "advanced", "multi_image"
+        if image_count:
+            return "standard", "image"
+
+        if usage is not None and usage.estimated_prompt_tokens <= self.fast_max_tokens:
+            return "fast", "short_text"
+
+        return "standard", "long_text"
+
+
+model_router = ModelRouter()
+
+__all__ = ["ModelRoute", "ModelRouter", "model_router"]
@@ -1,6 +1,8 @@
+from dataclasses import dataclass
 from typing import List, Optional
 
-from app.feature.LLM.llm_schemas import FlightInfo, ImageAttachment
+from app.feature.LLM.llm_schemas import FlightInfo, ImageAttachment, PromptTokenUsage
+from app.feature.LLM.token_budget import estimate_segment_tokens, fit_context_to_budget
 
 DEFAULT_SYSTEM_INSTRUCTION = (
     "You are an airline experience concierge. "
@@ -13,29 +15,95 @@ DEFAULT_SYSTEM_INSTRUCTION = (
 )
 
 
-def build_prompt_segments(
+@dataclass
+class PromptBuild:
+    """최종 프롬프트 세그먼트와 토큰 추정치."""
+
+    segments: List[object]
+    usage: PromptTokenUsage
+
+
+def build_prompt(
     prompt: str,
     context: Optional[List[str]],
     flight_info: Optional[FlightInfo],
     images: Optional[List[ImageAttachment]],
-) -> List[object]:
-    """
-    Gemini SDK generate_content 호출 시 사용할 프롬프트 목록을 구성합니다.
+    additional_flights: Optional[List[FlightInfo]] = None,
+    token_budget: Optional[int] = None,
+    context_priorities: Optional[List[int]] = None,
+) -> PromptBuild:
     """
-    segments: List[object] = []
-    if context:
-        segments.extend([ctx for ctx in context if ctx.strip()])
+    Gemini SDK generate_content 호출 시 사용할 프롬프트 목록과 토큰 추정치를 구성합니다.
 
+    token_budget이 주어지면 프롬프트, 항공편 정보, 이미지에 필요한 토큰을 먼저 확보하고
+    남은 예산 안에서 우선순위가 높거나 최신인 context만 포함합니다.
+    (flight_info와 prompt는 예산과 관계없이 항상 포함됩니다.)
+    additional_flights는 다구간 탑승권의 두 번째 이후 구간입니다.
+    """
+    fixed_segments: List[object] = []
     if images:
-        segments.extend(_build_image_parts(images))
+        fixed_segments.extend(_build_image_parts(images))
 
     if flight_info:
         compiled_info = _format_flight_info(flight_info)
         if compiled_info:
-            segments.append(compiled_info)
+            fixed_segments.append(compiled_info)
+
+    if additional_flights:
+        for leg_number, leg in enumerate(additional_flights, start=2):
+            compiled_leg = _format_flight_info(leg)
+            if compiled_leg:
+                fixed_segments.append(
+                    compiled_leg.replace("Flight context", f"Flight context (leg {leg_number})", 1)
+                )
+
+    fixed_segments.append(prompt)
+    fixed_tokens = sum(estimate_segment_tokens(segment) for segment in fixed_segments)
+
+    context_items: List[str] = []
+    priorities: Optional[List[int]] = [] if context_priorities else None
+    for index, ctx in enumerate(context or []):
+        if ctx.strip():
+            context_items.append(ctx)
+            if priorities is not None:
+                priorities.append(context_priorities[index])
+
+    available = None if not token_budget else token_budget - fixed_tokens
+    selection = fit_context_to_budget(context_items, available, priorities)
 
-    segments.append(prompt)
-    return segments
+    return PromptBuild(
+        segments=[*selection.context, *fixed_segments],
+        usage=PromptTokenUsage(
+            estimated_prompt_tokens=fixed_tokens + selection.context_tokens,
+            estimated_context_tokens=selection.context_tokens,
+            token_budget=token_budget or None,
+            dropped_context_count=selection.dropped_count,
+        ),
+    )
+
+
+def build_prompt_segments(
+    prompt: str,
+    context: Optional[List[str]],
+    flight_info: Optional[FlightInfo],
+    images: Optional[List[ImageAttachment]],
+    additional_flights: Optional[List[FlightInfo]] = None,
+    token_budget: Optional[int] = None,
+    context_priorities: Optional[List[int]] = None,
+) -> List[object]:
+    """
+    Gemini SDK generate_content 호출 시 사용할 프롬프트 목록을 구성합니다.
+    (토큰 추정치가 필요하면 build_prompt를 사용하세요.)
+    """
+    return build_prompt(
+        prompt=prompt,
+        context=context,
+        flight_info=flight_info,
+        images=images,
+        additional_flights=additional_flights,
+        token_budget=token_budget,
+        context_priorities=context_priorities,
+    ).segments
 
 
 def _build_image_parts(images: List[ImageAttachment]) -> List[object]:
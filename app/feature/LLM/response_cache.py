@@ -0,0 +1,120 @@
+import hashlib
+from typing import Awaitable, Callable, List, Optional
+
+from app.core.config import (
+    LLM_CACHE_ENABLED,
+    LLM_CACHE_MAX_BYTES,
+    LLM_CACHE_MAX_ENTRIES,
+    LLM_CACHE_TTL_SECONDS,
+)
+from app.shared.cache import SingleFlight, TTLCache
+
+
+def build_cache_key(
+    prompt_segments: List[object],
+    system_instruction: str,
+    model_name: str,
+) -> str:
+    """
+    최종 프롬프트 세그먼트(이미지 바이트 포함), 시스템 인스트럭션, 모델명으로
+    안정적인 콘텐츠 주소(SHA-256) 키를 생성합니다.
+    """
+    hasher = hashlib.sha256()
+    _update_digest(hasher, model_name)
+    _update_digest(hasher, system_instruction)
+    _update_digest(hasher, prompt_segments)
+    return hasher.hexdigest()
+
+
+def _update_digest(hasher, value: object) -> None:
+    """
+    타입 태그와 길이를 함께 기록하여 세그먼트 경계가 모호해지지 않도록 해시에 반영합니다.
+    """
+    if isinstance(value, str):
+        encoded = value.encode("utf-8")
+        hasher.update(b"s%d:" % len(encoded))
+        hasher.update(encoded)
+    elif isinstance(value, (bytes, bytearray)):
+        hasher.update(b"b%d:" % len(value))
+        hasher.update(value)
+    elif isinstance(value, dict):
+        hasher.update(b"d%d:" % len(value))
+        for key in sorted(value):
+            _update_digest(hasher, str(key))
+            _update_digest(hasher, value[key])
+    elif isinstance(value, (list, tuple)):
+        hasher.update(b"l%d:" % len(value))
+        for item in value:
+            _update_digest(hasher, item)
+    elif value is None:
+        hasher.update(b"n:")
+    else:
+        _update_digest(hasher, repr(value))
+
+
+class LLMResponseCache:
+    """
+    Gemini 응답 캐시.
+    TTL/LRU/메모리 상한을 가지며, 진행 중인 동일 요청은 하나의 업스트림 호출을 공유합니다.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = LLM_CACHE_ENABLED,
+        ttl_seconds: int = LLM_CACHE_TTL_SECONDS,
+        max_entries: int = LLM_CACHE_MAX_ENTRIES,
+        max_bytes: int = LLM_CACHE_MAX_BYTES,
+    ) -> None:
+        self.enabled = enabled
+        self._cache = TTLCache(
+            max_entries=max_entries,
+            ttl_seconds=ttl_seconds,
+            max_bytes=max_bytes,
+            sizeof=lambda text: len(text.encode("utf-8")),
+        )
+        self._single_flight = SingleFlight()
+
+    async def get_or_generate(
+        self,
+        key: str,
+        generate: Callable[[], Awaitable[str]],
+    ) -> str:
+        if not self.enabled:
+            return await generate()
+
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        return await self._single_flight.do(key, lambda: self._generate_and_store(key, generate))
+
+    def peek(self, key: str) -> Optional[str]:
+        """업스트림 호출 없이 캐시된 응답만 조회합니다."""
+        if not self.enabled:
+            return None
+        return self._cache.get(key)
+
+    def store(self, key: str, content: str) -> None:
+        """스트리밍처럼 get_or_generate를 거치지 않은 응답을 캐시에 저장합니다."""
+        if self.enabled and content:
+            self._cache.set(key, content)
+
+    async def _generate_and_store(
+        self,
+        key: str,
+        generate: Callable[[], Awaitable[str]],
+    ) -> str:
+        content = await generate()
+        self._cache.set(key, content)
+        return content
+
+    def stats(self) -> dict:
+        return {
+            **self._cache.stats(),
+            "inflight": self._single_flight.inflight_count(),
+        }
+
+
+response_cache = LLMResponseCache()
+
+__all__ = ["LLMResponseCache", "build_cache_key", "response_cache"]
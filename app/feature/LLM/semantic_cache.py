@@ -0,0 +1,328 @@
+import hashlib
+import re
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from app.core.config import (
+    LLM_SEMANTIC_CACHE_ENABLED,
+    LLM_SEMANTIC_CACHE_MAX_DISTANCE,
+    LLM_SEMANTIC_CACHE_MAX_ENTRIES,
+    LLM_SEMANTIC_CACHE_TTL_SECONDS,
+)
+from app.feature.LLM.llm_schemas import FlightInfo
+
+_FINGERPRINT_BITS = 64
+_MASK = (1 << _FINGERPRINT_BITS) - 1
+
+# "KE 081", "KE81", "ke081" -> "KE081"
+# 띄어 쓴 편명은 대문자 항공사 코드만 인정합니다. ("on 12" 같은 오탐 방지)
+_SPACED_FLIGHT_RE = re.compile(r"\b([A-Z][A-Z0-9]|[0-9][A-Z])\s(\d{1,4})\b")
+_JOINED_FLIGHT_RE = re.compile(r"\b([A-Za-z][A-Za-z0-9]|[0-9][A-Za-z])(\d{1,4})\b")
+_NON_WORD_RE = re.compile(r"[^\w]+")
+
+_STOPWORDS = frozenset(
+    "a an the and on of for in to at by with about is are was be do does please "
+    "me my i you your it this that what how can could would tell give".split()
+)
+# 어순과 무관한 단어 쌍을 만들 때 함께 묶는 최대 거리(단어 수). 긴 질문에서 특징 수가 제곱으로 늘지 않도록 제한합니다.
+_PAIR_WINDOW = 8
+# 어순이 뜻을 바꾸는 비교/부정 표현 ("isn't" 등은 구두점 제거 후 "isn", "t"가 됩니다)
+_ORDER_SENSITIVE_WORDS = frozenset(
+    "than vs versus compare compared better worse more less cheaper faster slower bigger smaller "
+    "before after instead rather not no nor never without cannot t".split()
+)
+# 한국어는 조사/어미가 붙으므로 부분 문자열로 확인합니다.
+_ORDER_SENSITIVE_MARKERS = ("보다", "대비", "않", "없", "못")
+
+
+def canonical_flight_number(value: str) -> str:
+    """편명을 '항공사코드 + 최소 3자리 숫자' 형식으로 정규화합니다. (예: 'ke 81' -> 'KE081')"""
+    compact = value.replace(" ", "").upper()
+    match = _JOINED_FLIGHT_RE.fullmatch(compact)
+    if not match:
+        return compact
+    return f"{match.group(1)}{int(match.group(2)):03d}"
+
+
+def _normalize_words(text: str) -> List[str]:
+    """유니코드 정규화 -> 편명 정규화 -> 소문자/구두점 제거 -> 불용어 제거 후의 단어 목록 (어순 유지)."""
+    text = unicodedata.normalize("NFKC", text)
+    text = _SPACED_FLIGHT_RE.sub(lambda m: canonical_flight_number(m.group(0)), text)
+    text = _JOINED_FLIGHT_RE.sub(lambda m: canonical_flight_number(m.group(0)), text)
+    return [word for word in _NON_WORD_RE.sub(" ", text.lower()).split() if word not in _STOPWORDS]
+
+
+def normalize_tokens(text: str) -> List[str]:
+    """
+    텍스트를 비교용 특징(토큰) 목록으로 정규화합니다.
+    정규화된 단어와, _PAIR_WINDOW 안에 있는 두 단어를 정렬해 묶은 쌍을 중복 없이 특징으로 사용합니다.
+    쌍은 어순과 무관하므로 "KE081 business seat review" / "review business seat on KE 081"처럼
+    어순이나 절 순서만 바뀐 질문은 같은(가까운) 지문이 됩니다.
+    어순이 뜻을 바꾸는 비교/부정 질문은 order_sensitive_key()로 따로 구분합니다.
+    """
+    words = _normalize_words(text)
+    features = dict.fromkeys(words)
+    for index, first in enumerate(words):
+        for second in words[index + 1:index + _PAIR_WINDOW]:
+            if first != second:
+                features[" ".join(sorted((first, second)))] = None
+    return list(features)
+
+
+def order_sensitive_key(text: str) -> str:
+    """
+    비교/부정 표현이 있는 질문이면 정규화된 단어를 어순대로 이은 문자열을, 아니면 빈 문자열을 반환합니다.
+    build_scope()에 넘기면 이런 질문은 어순까지 같아야만 적중합니다.
+    (예: "12A가 14C보다 나은가" / "14C가 12A보다 나은가"는 같은 단어지만 서로 다른 질문)
+    """
+    words = _normalize_words(text)
+    if any(word in _ORDER_SENSITIVE_WORDS or any(marker in word for marker in _ORDER_SENSITIVE_MARKERS)
+           for word in words):
+        return " ".join(words)
+    return ""
+
+
+def build_scope(
+    model_name: str,
+    system_instruction: str,
+    flights: Iterable[FlightInfo],
+    context: Iterable[str] = (),
+    order_key: str = "",
+) -> int:
+    """
+    정확히 일치해야 하는 조건(모델, 시스템 인스트럭션, 정규화된 항공편 정보, 대화 context,
+    비교/부정 질문의 어순(order_sensitive_key))을 64비트 정수로 묶습니다.
+    유사도 비교는 같은 scope 안에서만 이루어집니다.
+    (context를 지문에 섞으면 긴 대화에서 공통 context가 지문을 지배해 다른 질문끼리 가까워지므로,
+    context는 정확히 일치해야 하는 조건으로 취급합니다.)
+    """
+    hasher = hashlib.blake2b(digest_size=8)
+    hasher.update(model_name.encode("utf-8"))
+    hasher.update(b"\x00")
+    hasher.update(system_instruction.encode("utf-8"))
+    for flight in flights:
+        hasher.update(b"\x01")
+        hasher.update(_canonical_flight(flight).encode("utf-8"))
+    for turn in context:
+        hasher.update(b"\x02")
+        hasher.update(" ".join(unicodedata.normalize("NFKC", turn).split()).encode("utf-8"))
+    if order_key:
+        hasher.update(b"\x03")
+        hasher.update(order_key.encode("utf-8"))
+    return int.from_bytes(hasher.digest(), "big")
+
+
+def _canonical_flight(flight: FlightInfo) -> str:
+    values = flight.model_dump()
+    if values.get("flight_number"):
+        values["flight_number"] = canonical_flight_number(values["flight_number"])
+    return "|".join(
+        f"{key}={' '.join(str(value).upper().split())}"
+        for key, value in sorted(values.items())
+        if value
+    )
+
+
+def _token_hash(token: str) -> int:
+    return int.from_bytes(
+        hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest(), "big"
+    )
+
+
+def simhash(tokens: List[str]) -> int:
+    """
+    토큰 집합의 64비트 SimHash를 계산합니다.
+
+    각 비트 위치에서 토큰 해시의 과반이 1이면 결과 비트를 1로 둡니다.
+    비트 위치별로 반복하지 않고, 64개 위치의 카운터를 비트 평면(bit-sliced)으로 더해
+    토큰당 O(log n)번의 정수 연산으로 계산합니다.
+    """
+    if not tokens:
+        return 0
+
+    planes: List[int] = []
+    for token in tokens:
+        carry = _token_hash(token)
+        for level in range(len(planes)):
+            planes[level], carry = planes[level] ^ carry, planes[level] & carry
+            if not carry:
+                break
+        if carry:
+            planes.append(carry)
+
+    # count * 2 > n  <=>  count >= n // 2 + 1
+    threshold = len(tokens) // 2 + 1
+    greater, equal = 0, _MASK
+    for level in range(max(len(planes), threshold.bit_length()) - 1, -1, -1):
+        plane = planes[level] if level < len(planes) else 0
+        if (threshold >> level) & 1:
+            equal &= plane
+        else:
+            greater |= equal & plane
+            equal &= ~plane & _MASK
+    return greater | equal
+
+
+class SemanticCache:
+    """
+    SimHash 지문과 밴드 인덱스를 이용한 유사 프롬프트 캐시.
+
+    64비트 지문을 (max_distance + 1)개의 밴드로 나누면, 해밍 거리가 max_distance 이하인
+    두 지문은 비둘기집 원리에 따라 최소 한 밴드가 완전히 일치합니다.
+    따라서 밴드 값이 같은 후보만 비교해도 임계값 안의 항목을 빠짐없이 찾을 수 있습니다.
+    같은 (scope, 지문)을 다시 저장하면 기존 항목을 교체하며, 만료된 항목은 조회/저장 중에 발견되는 대로 제거합니다.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = LLM_SEMANTIC_CACHE_ENABLED,
+        max_distance: int = LLM_SEMANTIC_CACHE_MAX_DISTANCE,
+        max_entries: int = LLM_SEMANTIC_CACHE_MAX_ENTRIES,
+        ttl_seconds: int = LLM_SEMANTIC_CACHE_TTL_SECONDS,
+    ) -> None:
+        self.enabled = enabled
+        self.max_distance = max(0, min(max_distance, 15))
+        self.max_entries = max(1, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self._bands = self._make_bands(self.max_distance + 1)
+
+        self._next_id = 0
+        # entry id -> (scope, fingerprint, content, expires_at)
+        self._entries: "OrderedDict[int, Tuple[int, int, str, float]]" = OrderedDict()
+        # (scope, fingerprint) -> entry id (같은 지문을 다시 저장하면 교체)
+        self._ids: Dict[Tuple[int, int], int] = {}
+        # 밴드별 인덱스: (scope, 밴드 값) -> entry id 집합
+        self._index: List[Dict[Tuple[int, int], Set[int]]] = [{} for _ in self._bands]
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+
+    @staticmethod
+    def _make_bands(count: int) -> List[Tuple[int, int]]:
+        """64비트를 count개 밴드로 나눈 (shift, mask) 목록."""
+        bands = []
+        start = 0
+        for index in range(count):
+            width = _FINGERPRINT_BITS // count + (1 if index < _FINGERPRINT_BITS % count else 0)
+            bands.append((start, (1 << width) - 1))
+            start += width
+        return bands
+
+    def lookup(self, scope: int, tokens: List[str]) -> Optional[str]:
+        if not self.enabled or not tokens:
+            return None
+        return self.lookup_fingerprint(scope, simhash(tokens))
+
+    def lookup_fingerprint(self, scope: int, fingerprint: int) -> Optional[str]:
+        now = time.monotonic()
+        with self._lock:
+            best_id, best_distance = None, self.max_distance + 1
+            expired = []
+            for band_index, (shift, mask) in enumerate(self._bands):
+                candidates = self._index[band_index].get((scope, (fingerprint >> shift) & mask))
+                if not candidates:
+                    continue
+                for entry_id in candidates:
+                    _, candidate_fp, _, expires_at = self._entries[entry_id]
+                    if expires_at <= now:
+                        expired.append(entry_id)
+                        continue
+                    distance = (candidate_fp ^ fingerprint).bit_count()
+                    if distance < best_distance:
+                        best_id, best_distance = entry_id, distance
+                        if distance == 0:
+                            break
+                if best_distance == 0:
+                    break
+
+            # 만료된 항목은 같은 항목이 여러 밴드에서 발견될 수 있으므로 순회가 끝난 뒤 한 번씩 제거합니다.
+            for entry_id in set(expired):
+                self._remove(entry_id)
+                self.expired += 1
+
+            if best_id is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(best_id)
+            self.hits += 1
+            return self._entries[best_id][2]
+
+    def store(self, scope: int, tokens: List[str], content: str) -> None:
+        if not self.enabled or not tokens or not content:
+            return
+        self.store_fingerprint(scope, simhash(tokens), content)
+
+    def store_fingerprint(self, scope: int, fingerprint: int, content: str) -> None:
+        now = time.monotonic()
+        with self._lock:
+            self._purge_expired_oldest(now)
+
+            expires_at = now + self.ttl_seconds
+            entry_id = self._ids.get((scope, fingerprint))
+            if entry_id is not None:
+                # 밴드 값이 같으므로 인덱스는 그대로 두고 내용과 만료 시각만 교체합니다.
+                self._entries[entry_id] = (scope, fingerprint, content, expires_at)
+                self._entries.move_to_end(entry_id)
+                return
+
+            entry_id = self._next_id
+            self._next_id += 1
+            self._entries[entry_id] = (scope, fingerprint, content, expires_at)
+            self._ids[(scope, fingerprint)] = entry_id
+            for band_index, (shift, mask) in enumerate(self._bands):
+                self._index[band_index].setdefault((scope, (fingerprint >> shift) & mask), set()).add(entry_id)
+
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+
+    def _purge_expired_oldest(self, now: float) -> None:
+        """가장 오래 사용되지 않은 쪽부터 만료된 항목을 제거합니다. (만료되지 않은 항목을 만나면 멈춤)"""
+        while self._entries:
+            entry_id = next(iter(self._entries))
+            if self._entries[entry_id][3] > now:
+                return
+            self._remove(entry_id)
+            self.expired += 1
+
+    def _remove(self, entry_id: int) -> None:
+        scope, fingerprint, _, _ = self._entries.pop(entry_id)
+        del self._ids[(scope, fingerprint)]
+        for band_index, (shift, mask) in enumerate(self._bands):
+            key = (scope, (fingerprint >> shift) & mask)
+            bucket = self._index[band_index].get(key)
+            if bucket is None:
+                continue
+            bucket.discard(entry_id)
+            if not bucket:
+                del self._index[band_index][key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "expired": self.expired,
+            "max_distance": self.max_distance,
+        }
+
+
+semantic_cache = SemanticCache()
+
+__all__ = [
+    "SemanticCache",
+    "build_scope",
+    "canonical_flight_number",
+    "normalize_tokens",
+    "order_sensitive_key",
+    "semantic_cache",
+    "simhash",
+]
@@ -0,0 +1,90 @@
+from dataclasses import dataclass
+from typing import List, Optional
+
+# Gemini는 이미지 1장을 고정 토큰(258)으로 계산합니다.
+IMAGE_TOKEN_ESTIMATE = 258
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    로컬 휴리스틱으로 텍스트의 토큰 수를 추정합니다.
+    - ASCII(영문/숫자/기호): 약 4자당 1토큰
+    - 비 ASCII(한글, 한자 등): 1자당 약 1토큰 (보수적으로 추정)
+    """
+    if not text:
+        return 0
+    if text.isascii():
+        return (len(text) + 3) // 4
+
+    ascii_count = len(text.encode("ascii", "ignore"))
+    return (ascii_count + 3) // 4 + (len(text) - ascii_count)
+
+
+def estimate_segment_tokens(segment: object) -> int:
+    """프롬프트 세그먼트(문자열 또는 이미지 Part) 하나의 토큰 수를 추정합니다."""
+    if isinstance(segment, str):
+        return estimate_tokens(segment)
+    return IMAGE_TOKEN_ESTIMATE
+
+
+@dataclass
+class ContextSelection:
+    """토큰 예산에 맞춰 선택된 문맥과 추정치."""
+
+    context: List[str]
+    context_tokens: int
+    dropped_count: int
+
+
+def fit_context_to_budget(
+    context: List[str],
+    available_tokens: Optional[int],
+    priorities: Optional[List[int]] = None,
+) -> ContextSelection:
+    """
+    남은 토큰 예산(available_tokens) 안에 들어가도록 문맥을 선택합니다.
+
+    우선순위가 높은 항목부터, 같은 우선순위 안에서는 최신(목록의 뒤쪽) 항목부터 채웁니다.
+    같은 우선순위 안에서 예산을 넘는 항목을 만나면 그보다 오래된 항목은 넣지 않으므로
+    (중간이 빠진 대화 기록이 되지 않도록) 각 우선순위에서 최신 쪽의 연속된 항목만 남습니다.
+    선택된 항목은 원래 순서를 유지합니다. available_tokens가 None이면 모두 유지합니다.
+    """
+    costs = [estimate_tokens(ctx) for ctx in context]
+    if available_tokens is None:
+        return ContextSelection(list(context), sum(costs), 0)
+
+    order = sorted(
+        range(len(context)),
+        key=lambda i: (priorities[i] if priorities else 0, i),
+        reverse=True,
+    )
+
+    remaining = max(0, available_tokens)
+    kept = set()
+    # 예산을 넘는 항목을 만난 우선순위 (그 우선순위의 더 오래된 항목은 건너뜀)
+    exhausted = set()
+    for index in order:
+        priority = priorities[index] if priorities else 0
+        if priority in exhausted:
+            continue
+        if costs[index] <= remaining:
+            kept.add(index)
+            remaining -= costs[index]
+        else:
+            exhausted.add(priority)
+
+    selected = [context[i] for i in range(len(context)) if i in kept]
+    return ContextSelection(
+        context=selected,
+        context_tokens=sum(costs[i] for i in kept),
+        dropped_count=len(context) - len(kept),
+    )
+
+
+__all__ = [
+    "ContextSelection",
+    "IMAGE_TOKEN_ESTIMATE",
+    "estimate_segment_tokens",
+    "estimate_tokens",
+    "fit_context_to_budget",
+]
@@ -0,0 +1,168 @@
+import hashlib
+import heapq
+import json
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from jose.utils import base64url_decode
+
+from app.core.config import (
+    ACCESS_TOKEN_CACHE_MAX_ENTRIES,
+    ACCESS_TOKEN_CACHE_TTL_SECONDS,
+    ACCESS_TOKEN_REVOCATION_MAX_ENTRIES,
+)
+from app.core.exceptions.exceptions import (
+    AppConfigError,
+    CustomException,
+    InvalidTokenError,
+    TokenExpiredError,
+    TokenRevokedError,
+    TooManyRequestsError,
+)
+from app.core.security import decode_access_token
+from app.shared.cache import TTLCache
+from app.shared.metrics import metrics
+
+
+class RevocationList:
+    """
+    폐기된 토큰 키를 만료 시각(epoch 초)까지 보관하는 목록.
+
+    LRU 캐시와 달리 만료 전 항목을 축출하지 않습니다. (축출되면 로그아웃한 토큰이 다시 유효해지므로)
+    만료되지 않은 항목이 max_entries개로 가득 차면 add()가 TooManyRequestsError를 발생시키며,
+    이 거절 횟수는 access_token_revocation_rejected_total 지표로 집계됩니다.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max(1, max_entries)
+        # key -> 만료 시각
+        self._entries: Dict[str, float] = {}
+        # (만료 시각, key) 최소 힙. 만료된 항목을 순서대로 정리하는 데 사용합니다.
+        self._expiry_heap: List[Tuple[float, str]] = []
+        self._lock = threading.Lock()
+        self.rejected = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        expires_at = self._entries.get(key)
+        return expires_at is not None and expires_at > time.time()
+
+    def add(self, key: str, expires_at: float) -> None:
+        now = time.time()
+        if expires_at <= now:
+            return
+        with self._lock:
+            self._purge_expired(now)
+            current = self._entries.get(key)
+            if current is None and len(self._entries) >= self.max_entries:
+                self.rejected += 1
+                metrics.increment("access_token_revocation_rejected_total")
+                raise TooManyRequestsError(message="로그아웃 요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도하세요.")
+            if current is None or current < expires_at:
+                self._entries[key] = expires_at
+                heapq.heappush(self._expiry_heap, (expires_at, key))
+
+    def _purge_expired(self, now: float) -> None:
+        while self._expiry_heap and self._expiry_heap[0][0] <= now:
+            expires_at, key = heapq.heappop(self._expiry_heap)
+            # 같은 키가 더 늦은 만료 시각으로 다시 추가된 경우 힙의 이전 항목만 버립니다.
+            if self._entries.get(key) == expires_at:
+                del self._entries[key]
+
+    def stats(self) -> dict:
+        return {"entries": len(self._entries), "max_entries": self.max_entries, "rejected": self.rejected}
+
+
+class AccessTokenVerifier:
+    """
+    우리 서비스 API Access Token 검증기. (요청마다 호출되는 인증 경로)
+
+    - 서명 검증 전에 payload의 exp부터 확인하여, 만료된 토큰에는 HMAC 계산을 하지 않습니다.
+    - 검증에 성공한 토큰은 SHA-256 해시 기준으로 LRU 캐시에 두며, 항목은 토큰 exp보다 늦게 남지 않습니다.
+    - 로그아웃한 토큰은 jti(없으면 토큰 해시) 기준 폐기 목록(RevocationList)에 만료 시각까지 보관하고,
+      캐시 적중 여부와 관계없이 매 검증마다 확인합니다. 폐기 목록은 만료 전에 항목을 축출하지 않습니다.
+    폐기 목록은 프로세스 안에만 있으므로, 여러 인스턴스로 운영하면 로그아웃한 인스턴스에서만 즉시 적용됩니다.
+    """
+
+    def __init__(
+        self,
+        cache_ttl_seconds: int = ACCESS_TOKEN_CACHE_TTL_SECONDS,
+        cache_max_entries: int = ACCESS_TOKEN_CACHE_MAX_ENTRIES,
+        revocation_max_entries: int = ACCESS_TOKEN_REVOCATION_MAX_ENTRIES,
+    ) -> None:
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self._verified = TTLCache(max_entries=cache_max_entries, ttl_seconds=cache_ttl_seconds)
+        self._revoked = RevocationList(max_entries=revocation_max_entries)
+
+    def verify(self, token: str) -> dict:
+        """토큰을 검증하고 payload(claims)를 반환합니다."""
+        claims, digest = self._verify(token)
+        if len(self._revoked) and _revocation_key(claims, digest) in self._revoked:
+            metrics.increment("access_token_verify_total", {"result": "revoked"})
+            raise TokenRevokedError()
+        return dict(claims)
+
+    def subject_or_none(self, token: str) -> Optional[str]:
+        """요청 주체(uid)만 필요할 때 사용합니다. (예: 요청 빈도 제한) 유효하지 않은 토큰이면 None."""
+        try:
+            return self.verify(token).get("sub")
+        except (CustomException, AppConfigError):
+            return None
+
+    def revoke(self, token: str) -> None:
+        """
+        토큰을 만료 시각까지 폐기합니다. (로그아웃)
+        폐기 목록이 가득 차 있으면 TooManyRequestsError를 발생시킵니다. (토큰은 폐기되지 않음)
+        """
+        claims, digest = self._verify(token)
+        self._revoked.add(_revocation_key(claims, digest), claims["exp"])
+        self._verified.delete(digest)
+
+    def _verify(self, token: str) -> Tuple[dict, bytes]:
+        digest = hashlib.sha256(token.encode("utf-8")).digest()
+        claims = self._verified.get(digest)
+        if claims is not None:
+            if claims["exp"] <= time.time():
+                raise TokenExpiredError()
+            metrics.increment("access_token_verify_total", {"result": "cache_hit"})
+            return claims, digest
+
+        exp = _unverified_exp(token)
+        if exp <= time.time():
+            metrics.increment("access_token_verify_total", {"result": "expired"})
+            raise TokenExpiredError()
+
+        claims = decode_access_token(token)
+        metrics.increment("access_token_verify_total", {"result": "verified"})
+        ttl = min(self.cache_ttl_seconds, claims["exp"] - time.time())
+        if ttl > 0:
+            self._verified.set(digest, claims, ttl_seconds=ttl)
+        return claims, digest
+
+    def stats(self) -> dict:
+        return {"verified_cache": self._verified.stats(), "revoked": self._revoked.stats()}
+
+
+def _unverified_exp(token: str) -> float:
+    """서명 확인 없이 payload의 exp만 읽습니다. (만료 여부를 먼저 거르기 위한 용도)"""
+    try:
+        payload_segment = token.split(".")[1]
+        exp = json.loads(base64url_decode(payload_segment.encode("ascii")))["exp"]
+    except (IndexError, KeyError, TypeError, ValueError, UnicodeError):
+        raise InvalidTokenError()
+    if not isinstance(exp, (int, float)):
+        raise InvalidTokenError()
+    return exp
+
+
+def _revocation_key(claims: dict, digest: bytes) -> str:
+    # jti가 없는 토큰(이전에 발급된 토큰)은 토큰 해시로 폐기합니다.
+    return claims.get("jti") or digest.hex()
+
+
+access_token_verifier = AccessTokenVerifier()
+
+__all__ = ["AccessTokenVerifier", "RevocationList", "access_token_verifier"]
@@ -0,0 +1,52 @@
+from typing import Optional
+
+from fastapi import Depends
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+
+from app.core.exceptions.exceptions import InvalidTokenError
+from app.feature.auth import auth_service
+from app.feature.auth.access_token_verifier import access_token_verifier
+from app.feature.auth.auth_schemas import UserInDB
+
+# Authorization: Bearer <토큰> 헤더를 읽습니다. (헤더가 없을 때의 오류는 우리 예외 형식으로 응답)
+bearer_scheme = HTTPBearer(auto_error=False)
+
+
+# 아래 의존성들은 블로킹 I/O가 없으므로 async def로 선언합니다.
+# (sync def 의존성은 FastAPI가 요청마다 스레드 풀로 옮겨 실행하므로 인증 경로에 스레드 전환 비용이 붙습니다.)
+async def get_bearer_token(
+        credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme),
+) -> str:
+    """요청의 Bearer 토큰을 꺼냅니다."""
+    if credentials is None or not credentials.credentials:
+        raise InvalidTokenError(message="인증 토큰이 필요합니다.")
+    return credentials.credentials
+
+
+async def get_current_token_claims(token: str = Depends(get_bearer_token)) -> dict:
+    """
+    API Access Token을 검증하고 payload를 반환합니다.
+    사용자 문서가 필요 없는 엔드포인트는 이 의존성만 사용하면 Firestore를 조회하지 않습니다.
+    """
+    return access_token_verifier.verify(token)
+
+
+async def get_current_user(claims: dict = Depends(get_current_token_claims)) -> UserInDB:
+    """
+    인증된 요청의 사용자(UserInDB)를 반환합니다. (프로필 캐시를 거쳐 조회)
+
+    사용 예:
+        @router.get("/me")
+        async def read_me(user: UserInDB = Depends(get_current_user)): ...
+    """
+    uid = claims.get("sub")
+    if not uid:
+        raise InvalidTokenError()
+
+    user = await auth_service.get_user(uid)
+    if user is None:
+        raise InvalidTokenError(message="사용자를 찾을 수 없습니다. 다시 로그인하세요.")
+    return user
+
+
+__all__ = ["bearer_scheme", "get_bearer_token", "get_current_token_claims", "get_current_user"]
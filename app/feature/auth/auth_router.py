@@ -1,6 +1,12 @@
-from fastapi import APIRouter
+from typing import TYPE_CHECKING, Optional
+
+from fastapi import APIRouter, Depends
 from app.feature.auth import auth_schemas, auth_service
-from firebase_admin.auth import UserRecord  # Kakao에서 반환된 타입
+from app.feature.auth.access_token_verifier import access_token_verifier
+from app.feature.auth.auth_dependencies import get_bearer_token, get_current_user
+
+if TYPE_CHECKING:
+    from firebase_admin.auth import UserRecord  # Kakao에서 반환된 타입
 
 router = APIRouter(
     prefix="/auth",
@@ -22,13 +28,8 @@ async def login_with_google(
     # 2. Firestore DB에서 사용자 조회 또는 생성
     user = await auth_service.get_or_create_user(decoded_token)
 
-    # 3. 우리 서비스 전용 API 토큰 생성
-    api_access_token = auth_service.generate_api_token(uid=user.uid)
-
-    return {
-        "access_token": api_access_token,
-        "token_type": "bearer"
-    }
+    # 3. 우리 서비스 전용 API 토큰(+ Refresh Token) 생성
+    return await auth_service.issue_token_pair(uid=user.uid)
 
 
 @router.post("/apple/login", response_model=auth_schemas.TokenResponse)
@@ -45,13 +46,8 @@ async def login_with_apple(
     # 2. Firestore DB에서 사용자 조회 또는 생성
     user = await auth_service.get_or_create_user(decoded_token)
 
-    # 3. 우리 서비스 전용 API 토큰 생성
-    api_access_token = auth_service.generate_api_token(uid=user.uid)
-
-    return {
-        "access_token": api_access_token,
-        "token_type": "bearer"
-    }
+    # 3. 우리 서비스 전용 API 토큰(+ Refresh Token) 생성
+    return await auth_service.issue_token_pair(uid=user.uid)
 
 
 @router.post("/kakao/login", response_model=auth_schemas.TokenResponse)
@@ -82,10 +78,63 @@ async def login_with_kakao(
     # 4. Firestore DB에서 사용자 조회 또는 생성
     user_in_db = await auth_service.get_or_create_user(synthetic_decoded_token)
 
-    # 5. 우리 서비스 전용 API 토큰 생성
-    api_access_token = auth_service.generate_api_token(uid=user_in_db.uid)
+    # 5. 우리 서비스 전용 API 토큰(+ Refresh Token) 생성
+    return await auth_service.issue_token_pair(uid=user_in_db.uid)
+
+
+@router.post("/email/signup", response_model=auth_schemas.TokenResponse, status_code=201)
+async def signup_with_email(
+        request: auth_schemas.EmailSignupRequest
+):
+    """
+    이메일/비밀번호로 가입하고 API Access Token을 발급합니다.
+    """
+    user = await auth_service.signup_with_email(request.email, request.password, request.display_name)
+    return await auth_service.issue_token_pair(uid=user.uid)
+
+
+@router.post("/email/login", response_model=auth_schemas.TokenResponse)
+async def login_with_email(
+        request: auth_schemas.EmailLoginRequest
+):
+    """
+    이메일/비밀번호를 확인하고 API Access Token을 발급합니다.
+    """
+    user = await auth_service.login_with_email(request.email, request.password)
+    return await auth_service.issue_token_pair(uid=user.uid)
+
+
+@router.post("/refresh", response_model=auth_schemas.TokenResponse)
+async def refresh_access_token(
+        request: auth_schemas.RefreshTokenRequest
+):
+    """
+    Refresh Token으로 API Access Token을 재발급합니다. (소셜 로그인 재수행 불필요)
+    사용한 Refresh Token은 폐기되고 응답의 새 Refresh Token으로 교체됩니다.
+    """
+    return await auth_service.refresh_token_pair(request.refresh_token)
+
 
-    return {
-        "access_token": api_access_token,
-        "token_type": "bearer"
-    }
\ No newline at end of file
+@router.get("/me", response_model=auth_schemas.UserInDB)
+async def read_current_user(
+        user: auth_schemas.UserInDB = Depends(get_current_user)
+):
+    """
+    API Access Token의 사용자 정보를 반환합니다.
+    """
+    return user
+
+
+@router.post("/logout", status_code=204)
+async def logout(
+        request: Optional[auth_schemas.LogoutRequest] = None,
+        token: str = Depends(get_bearer_token)
+):
+    """
+    현재 API Access Token을 만료 시각까지 폐기합니다.
+    Refresh Token을 함께 보내면 그 계열도 폐기합니다. (같은 사용자의 유효한 Refresh Token이 아니면 401)
+    """
+    claims = access_token_verifier.verify(token)
+    if request is not None and request.refresh_token:
+        await auth_service.refresh_token_store.revoke(request.refresh_token, uid=claims["sub"])
+    access_token_verifier.revoke(token)
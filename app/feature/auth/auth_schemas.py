@@ -1,4 +1,4 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, Field, field_validator
 from typing import Optional
 
 # --- 기본 모델 ---
@@ -24,9 +24,37 @@ class SocialLoginRequest(BaseModel):
     """
     token: str
 
+class EmailLoginRequest(BaseModel):
+    """이메일/비밀번호 로그인"""
+    email: EmailStr
+    password: str = Field(min_length=1, max_length=72)
+
+class EmailSignupRequest(BaseModel):
+    """이메일/비밀번호 회원가입"""
+    email: EmailStr
+    password: str = Field(min_length=8, max_length=72)
+    display_name: Optional[str] = Field(default=None, max_length=100)
+
+    @field_validator("password")
+    @classmethod
+    def check_password_bytes(cls, value: str) -> str:
+        # bcrypt는 72바이트까지만 사용하므로 더 긴 비밀번호는 받지 않습니다.
+        if len(value.encode("utf-8")) > 72:
+            raise ValueError("비밀번호는 72바이트 이하여야 합니다.")
+        return value
+
+class RefreshTokenRequest(BaseModel):
+    """API Access Token 재발급에 사용할 Refresh Token"""
+    refresh_token: str
+
+class LogoutRequest(BaseModel):
+    """로그아웃 시 함께 폐기할 Refresh Token (선택)"""
+    refresh_token: Optional[str] = None
+
 # --- 응답 스키마 ---
 
 class TokenResponse(BaseModel):
-    """클라이언트에게 반환할 API Access Token"""
+    """클라이언트에게 반환할 API Access Token (+ 재발급용 Refresh Token)"""
     access_token: str
+    refresh_token: Optional[str] = None
     token_type: str = "bearer"
\ No newline at end of file
@@ -1,13 +1,34 @@
+import asyncio
+import secrets
 import httpx  # 카카오 API 호출을 위해 import
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Optional
 from fastapi.concurrency import run_in_threadpool
-from firebase_admin import auth as firebase_auth
-from firebase_admin.auth import InvalidIdTokenError, ExpiredIdTokenError, UserRecord, UserNotFoundError
 
-# app.core.firebase에서 db와 auth_client 가져오기
-from app.core.firebase import db, auth_client
+from app.core.config import KAKAO_TOKEN_INFO_ENABLED
+# firebase_admin / google.api_core는 처음 사용할 때 import 됩니다. (app.core.firebase 참고)
+from app.core.firebase import (
+    collection,
+    firebase_auth,
+    firestore,
+    google_api_exceptions,
+    init_firebase,
+)
 from app.core.security import create_access_token
+from app.feature.auth.access_token_verifier import access_token_verifier
 from app.feature.auth.auth_schemas import UserBase, UserInDB
+from app.feature.auth.firebase_token_verifier import firebase_token_verifier
+from app.feature.auth.kakao_token_cache import kakao_token_cache
+from app.feature.auth.kakao_user_index import KakaoUserIndex
+from app.feature.auth.login_write_behind import LastLoginWriteBehind
+from app.feature.auth.password_hasher import password_hasher
+from app.feature.auth.refresh_token_store import RefreshTokenStore
+from app.feature.auth.user_profile_cache import user_profile_cache
+from app.shared.http_clients import http_clients
+from app.shared.metrics import metrics
+
+if TYPE_CHECKING:
+    from firebase_admin.auth import UserRecord
 
 # 4. exceptions.py에 정의된 커스텀 예외 임포트 (이름 수정)
 from app.core.exceptions.exceptions import (
@@ -18,11 +39,33 @@ from app.core.exceptions.exceptions import (
     AuthInitError,  # FirebaseInitError -> AuthInitError
     InvalidTokenPayloadError,  # TokenUIDNotFoundError -> InvalidTokenPayloadError
     DatabaseError,
-    ExternalApiError
+    ExternalApiError,
+    InvalidCredentialsError,
+    AccountAlreadyExistsError,
+    AppConfigError,
 )
 
 # Firestore 'users' 컬렉션 참조
-user_collection = db.collection("users")
+user_collection = collection("users")
+# Kakao 사용자 ID -> Firebase UID 인덱스 (이전 방식 사용자의 연결 문서는 'kakao_links' 컬렉션)
+kakao_user_index = KakaoUserIndex(collection("kakao_links"))
+# 이메일/비밀번호 계정 ('credentials' 컬렉션, 문서 ID = 소문자 이메일)
+credential_collection = collection("credentials")
+# Refresh Token 계열 상태 ('refresh_tokens' 컬렉션)
+refresh_token_store = RefreshTokenStore(collection("refresh_tokens"))
+# 재로그인의 last_login_at 지연 쓰기 (LOGIN_WRITE_BEHIND_ENABLED)
+login_write_behind = LastLoginWriteBehind(user_collection)
+
+# Kakao API 공유 클라이언트 (로그인마다 TCP+TLS 핸드셰이크를 반복하지 않도록 커넥션 재사용)
+KAKAO_API_BASE_URL = "https://kapi.kakao.com"
+http_clients.register("kakao", base_url=KAKAO_API_BASE_URL)
+metrics.register_collector("kakao_token_cache", kakao_token_cache.stats)
+metrics.register_collector("firebase_token_verifier", firebase_token_verifier.stats)
+metrics.register_collector("login_write_behind", login_write_behind.stats)
+metrics.register_collector("user_profile_cache", user_profile_cache.stats)
+metrics.register_collector("kakao_user_index", kakao_user_index.stats)
+metrics.register_collector("access_token_verifier", access_token_verifier.stats)
+metrics.register_collector("password_hasher", password_hasher.stats)
 
 
 def _verify_firebase_id_token_sync(token: str) -> dict:
@@ -32,11 +75,11 @@ def _verify_firebase_id_token_sync(token: str) -> dict:
     """
     try:
         # 이 함수는 네트워크 통신을 하므로 동기/차단 방식입니다.
-        decoded_token = auth_client.verify_id_token(token)
+        decoded_token = firebase_auth.verify_id_token(token)
         return decoded_token
-    except ExpiredIdTokenError:
+    except firebase_auth.ExpiredIdTokenError:
         raise TokenExpiredError()
-    except InvalidIdTokenError:
+    except firebase_auth.InvalidIdTokenError:
         raise InvalidTokenError()
     except Exception as e:
         raise TokenVerificationError(message=f"토큰 검증 중 오류 발생: {e}")
@@ -44,10 +87,16 @@ def _verify_firebase_id_token_sync(token: str) -> dict:
 
 async def verify_firebase_id_token(token: str) -> dict:
     """
-    [비동기 함수] Firebase Admin SDK를 사용하여 ID Token을 검증합니다.
-    (Google, Apple 공용)
+    [비동기 함수] Firebase ID Token을 검증합니다. (Google, Apple 공용)
+    공개 키가 준비되어 있으면 프로세스 안에서 바로 검증하고,
+    그렇지 않으면 Firebase Admin SDK 검증(스레드 풀)으로 대체합니다.
     """
-    if not auth_client:
+    if firebase_token_verifier.available:
+        return await firebase_token_verifier.verify(token)
+
+    try:
+        init_firebase()
+    except AppConfigError:
         raise AuthInitError()
 
     try:
@@ -64,28 +113,52 @@ async def verify_firebase_id_token(token: str) -> dict:
 async def verify_kakao_token(token: str) -> dict:
     """
     [비동기 함수] 클라이언트로부터 받은 Kakao Access Token을 검증하고,
-    Kakao API에서 사용자 정보를 가져옵니다. (httpx 사용)
+    Kakao API에서 사용자 정보를 가져옵니다. (공유 httpx 클라이언트 사용)
+    짧은 시간 안에 같은 토큰으로 재시도하면 캐시된 결과를 사용합니다.
+    """
+    digest = kakao_token_cache.digest(token)
+    cached = kakao_token_cache.get(digest)
+    if cached is not None:
+        return cached
+
+    return await kakao_token_cache.coalesce(digest, lambda: _verify_kakao_token_uncached(token, digest))
+
+
+async def _verify_kakao_token_uncached(token: str, digest: bytes) -> dict:
+    """
+    [비동기 함수] Kakao 사용자 정보를 조회하고 결과를 캐시에 기록합니다.
+    KAKAO_TOKEN_INFO_ENABLED이면 토큰 남은 수명도 동시에 조회해 캐시 TTL을 그 이하로 줄이고,
+    아니면 남은 수명을 모르므로 짧은 TTL(KAKAO_TOKEN_UNKNOWN_EXPIRY_TTL_SECONDS)로 캐시합니다.
     """
-    KAKAO_USER_ME_URL = "https://kapi.kakao.com/v2/user/me"
     headers = {"Authorization": f"Bearer {token}"}
+    client = http_clients.get("kakao")
 
     try:
-        # httpx.AsyncClient를 사용하여 비동기 HTTP 요청
-        async with httpx.AsyncClient() as client:
-            response = await client.get(KAKAO_USER_ME_URL, headers=headers)
+        if KAKAO_TOKEN_INFO_ENABLED:
+            # 사용자 정보와 토큰 정보를 동시에 요청합니다. (토큰 정보 실패는 로그인 실패로 보지 않음)
+            response, expires_in = await asyncio.gather(
+                client.get("/v2/user/me", headers=headers),
+                _get_kakao_token_expires_in(client, headers),
+            )
+        else:
+            response = await client.get("/v2/user/me", headers=headers)
+            expires_in = None
 
         # Kakao API에서 에러가 반환된 경우
         if response.status_code != 200:
-            raise ExternalApiError(
-                message=f"Kakao API 오류: {response.status_code} {response.text}"
-            )
+            message = f"Kakao API 오류: {response.status_code} {response.text}"
+            if response.status_code in (400, 401):
+                # 만료/위조된 토큰은 잠시 동안 다시 조회하지 않습니다.
+                kakao_token_cache.store_rejected(digest, message)
+            raise ExternalApiError(message=message)
 
         kakao_data = response.json()
 
-        # 필수 정보(id, email) 확인
-        if "id" not in kakao_data or "kakao_account" not in kakao_data or "email" not in kakao_data["kakao_account"]:
+        # 필수 정보(id) 확인 (이메일은 선택 동의 항목이므로 요구하지 않습니다.)
+        if "id" not in kakao_data:
             raise InvalidTokenPayloadError(message="Kakao 토큰에서 필수 정보를 찾을 수 없습니다.")
 
+        kakao_token_cache.store_valid(digest, kakao_data, expires_in)
         return kakao_data
 
     except httpx.RequestError as e:
@@ -96,52 +169,84 @@ async def verify_kakao_token(token: str) -> dict:
         raise ExternalApiError(message=f"Kakao 토큰 처리 중 오류: {e}")
 
 
-def _find_user_by_email_sync(email: str) -> UserRecord:
+async def _get_kakao_token_expires_in(client: httpx.AsyncClient, headers: dict) -> Optional[int]:
+    """[비동기 함수] 토큰의 남은 수명(초)을 조회합니다. 실패하면 None을 반환합니다."""
+    try:
+        response = await client.get("/v1/user/access_token_info", headers=headers)
+        if response.status_code != 200:
+            return None
+        expires_in = response.json().get("expires_in")
+        return int(expires_in) if expires_in is not None else None
+    except Exception:
+        return None
+
+
+def _find_user_by_email_sync(email: str) -> "UserRecord":
     """[동기 함수] 이메일로 Firebase Auth 사용자를 찾습니다."""
     return firebase_auth.get_user_by_email(email)
 
 
-def _create_firebase_user_sync(email: str, display_name: str, photo_url: str) -> UserRecord:
-    """[동기 함수] Firebase Auth에 새 사용자를 생성합니다."""
-    return firebase_auth.create_user(
-        email=email,
-        display_name=display_name,
-        photo_url=photo_url
-    )
+def _get_firebase_user_sync(uid: str) -> Optional["UserRecord"]:
+    """[동기 함수] UID로 Firebase Auth 사용자를 찾습니다. 없으면 None."""
+    try:
+        return firebase_auth.get_user(uid)
+    except firebase_auth.UserNotFoundError:
+        return None
+
+
+def _create_firebase_user_sync(
+    uid: str,
+    email: Optional[str],
+    display_name: Optional[str],
+    photo_url: Optional[str],
+) -> "UserRecord":
+    """[동기 함수] Firebase Auth에 새 사용자를 생성합니다. (값이 없는 항목은 넘기지 않음)"""
+    fields = {"email": email, "display_name": display_name, "photo_url": photo_url}
+    return firebase_auth.create_user(uid=uid, **{key: value for key, value in fields.items() if value})
+
+
+def _update_firebase_user_email_sync(uid: str, email: str) -> "UserRecord":
+    """[동기 함수] Firebase Auth 사용자의 이메일을 바꿉니다."""
+    return firebase_auth.update_user(uid, email=email)
+
+
+def _kakao_email(kakao_account: dict) -> Optional[str]:
+    """Kakao 계정의 이메일. 유효/인증되지 않은 이메일은 계정 연결에 쓰지 않습니다."""
+    if kakao_account.get("is_email_valid") is False or kakao_account.get("is_email_verified") is False:
+        return None
+    return kakao_account.get("email")
 
 
-async def get_or_create_firebase_user(kakao_data: dict) -> UserRecord:
+async def get_or_create_firebase_user(kakao_data: dict) -> "UserRecord":
     """
     [비동기 함수] Kakao 사용자 정보를 바탕으로
     Firebase Auth의 사용자를 조회하거나 생성합니다.
+
+    Kakao 사용자 ID로 UID를 정하므로(kakao_user_index), 재방문 사용자는 Firebase Auth 조회 한 번이면 되고
+    Kakao 계정에 이메일이 없거나 이메일이 바뀌어도 같은 사용자로 찾습니다.
+    이전 방식(이메일 기준)으로 만들어진 사용자는 처음 로그인할 때 연결 문서를 남겨 그대로 이어 씁니다.
     """
+    kakao_id = str(kakao_data["id"])
+    return await kakao_user_index.coalesce(kakao_id, lambda: _resolve_kakao_user(kakao_id, kakao_data))
+
+
+async def _resolve_kakao_user(kakao_id: str, kakao_data: dict) -> "UserRecord":
     kakao_account = kakao_data.get("kakao_account", {})
     kakao_profile = kakao_account.get("profile", {})
 
-    email = kakao_account.get("email")
+    email = _kakao_email(kakao_account)
     display_name = kakao_profile.get("nickname")
     photo_url = kakao_profile.get("profile_image_url")
 
-    if not email:
-        raise InvalidTokenPayloadError(message="Kakao 계정에 이메일 정보가 없습니다.")
-
     try:
-        # 1. 이메일로 기존 Firebase Auth 사용자를 찾습니다. (동기 -> 스레드 풀)
-        user_record = await run_in_threadpool(_find_user_by_email_sync, email)
-        return user_record
+        user_record = await _find_kakao_user(kakao_id, email)
+        if user_record is None:
+            user_record = await _create_kakao_user(kakao_id, email, display_name, photo_url)
+        kakao_user_index.remember(kakao_id, user_record.uid)
 
-    except UserNotFoundError:
-        # 2. 사용자가 없으면 새로 생성합니다. (동기 -> 스레드 풀)
-        try:
-            user_record = await run_in_threadpool(
-                _create_firebase_user_sync,
-                email=email,
-                display_name=display_name,
-                photo_url=photo_url
-            )
-            return user_record
-        except Exception as e:
-            raise DatabaseError(message=f"Firebase Auth 사용자 생성 실패: {e}")
+        if email and user_record.email != email and user_record.uid == kakao_user_index.deterministic_uid(kakao_id):
+            user_record = await _sync_kakao_email(user_record, email)
+        return user_record
 
     except Exception as e:
         if isinstance(e, CustomException):
@@ -149,64 +254,294 @@ async def get_or_create_firebase_user(kakao_data: dict) -> UserRecord:
         raise DatabaseError(message=f"Firebase Auth 사용자 조회 중 오류: {e}")
 
 
+async def _find_kakao_user(kakao_id: str, email: Optional[str]) -> Optional["UserRecord"]:
+    """
+    [비동기 함수] Kakao 사용자에 해당하는 Firebase Auth 사용자를 찾습니다.
+    1. 인덱스에 캐시된 UID, 없으면 Kakao ID로 정해지는 UID
+    2. 이전 방식 사용자의 연결 문서
+    3. 이메일 (이전 방식 사용자의 첫 로그인. 찾으면 연결 문서를 기록)
+    """
+    uid = kakao_user_index.get(kakao_id) or kakao_user_index.deterministic_uid(kakao_id)
+    user_record = await run_in_threadpool(_get_firebase_user_sync, uid)
+    if user_record is not None:
+        _count_kakao_resolve("uid")
+        return user_record
+    kakao_user_index.forget(kakao_id)
+
+    linked_uid = await run_in_threadpool(kakao_user_index.load_link_sync, kakao_id)
+    if linked_uid and linked_uid != uid:
+        user_record = await run_in_threadpool(_get_firebase_user_sync, linked_uid)
+        if user_record is not None:
+            _count_kakao_resolve("link")
+            return user_record
+
+    if not email:
+        return None
+    try:
+        user_record = await run_in_threadpool(_find_user_by_email_sync, email)
+    except firebase_auth.UserNotFoundError:
+        return None
+    await run_in_threadpool(kakao_user_index.save_link_sync, kakao_id, user_record.uid)
+    _count_kakao_resolve("email_linked")
+    return user_record
+
+
+async def _create_kakao_user(
+    kakao_id: str,
+    email: Optional[str],
+    display_name: Optional[str],
+    photo_url: Optional[str],
+) -> "UserRecord":
+    """[비동기 함수] Kakao ID로 정해지는 UID로 새 사용자를 만듭니다."""
+    uid = kakao_user_index.deterministic_uid(kakao_id)
+    try:
+        user_record = await run_in_threadpool(_create_firebase_user_sync, uid, email, display_name, photo_url)
+    except firebase_auth.UidAlreadyExistsError:
+        # 다른 인스턴스에서 동시에 만든 경우
+        user_record = await run_in_threadpool(_get_firebase_user_sync, uid)
+    except firebase_auth.EmailAlreadyExistsError:
+        # 다른 계정이 이미 쓰는 이메일(예: 이메일이 바뀐 뒤 다른 사용자에게 넘어간 주소)은 붙이지 않습니다.
+        user_record = await run_in_threadpool(_create_firebase_user_sync, uid, None, display_name, photo_url)
+    except Exception as e:
+        raise DatabaseError(message=f"Firebase Auth 사용자 생성 실패: {e}")
+
+    if user_record is None:
+        raise DatabaseError(message="Firebase Auth 사용자 생성 실패")
+    _count_kakao_resolve("created")
+    return user_record
+
+
+async def _sync_kakao_email(user_record: "UserRecord", email: str) -> "UserRecord":
+    """[비동기 함수] Kakao 계정의 이메일이 바뀌었으면 Firebase Auth 사용자에도 반영합니다."""
+    try:
+        return await run_in_threadpool(_update_firebase_user_email_sync, user_record.uid, email)
+    except firebase_auth.EmailAlreadyExistsError:
+        print(f"[auth] 이미 다른 계정이 사용하는 이메일이라 갱신하지 않습니다: uid={user_record.uid}")
+        return user_record
+
+
+def _count_kakao_resolve(path: str) -> None:
+    metrics.increment("kakao_user_resolve_total", {"path": path})
+
+
 # --- Firestore DB 공용 함수 ---
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _to_epoch_us(moment: datetime) -> int:
+    return (moment - _EPOCH) // timedelta(microseconds=1)
+
+
+def _from_epoch_us(value: int) -> str:
+    return (_EPOCH + timedelta(microseconds=value)).isoformat()
+
+
+def _upsert_user_sync(
+    user_ref,
+    profile: dict,
+    now: datetime,
+    cached_user: Optional[UserInDB] = None,
+) -> UserInDB:
+    """
+    [동기 함수] 사용자 문서를 merge 쓰기로 생성/갱신하고 결과 UserInDB를 반환합니다.
+
+    - 토큰에 값이 있는 프로필 필드만 쓰므로, 제공자가 보내지 않은 필드(None)가 저장된 값을 지우지 않습니다.
+    - 생성 시각은 created_at_us(epoch 마이크로초)에 Minimum 변환으로만 기록하므로 기존 문서의 값이 유지되고,
+      쓰기 응답(transform_results)으로 그 값을 돌려받습니다. (created_at 문자열은 merge에 넣지 않습니다.)
+    - 재로그인은 쓰기 한 번으로 끝납니다. 응답에 필요한 값을 쓰기 결과로 알 수 없을 때만 문서를 한 번 더 읽습니다.
+      (새 문서/created_at_us가 없던 이전 문서, 또는 토큰에 없는 필드가 프로필 캐시에도 없는 경우)
+    """
+    now_iso = now.isoformat()
+    now_us = _to_epoch_us(now)
+    fields = {key: value for key, value in profile.items() if value is not None}
+
+    write_result = user_ref.set(
+        {
+            **fields,
+            "last_login_at": now_iso,
+            "created_at_us": firestore.Minimum(now_us),
+        },
+        merge=True,
+    )
+    created_at_us = write_result.transform_results[0].integer_value
+
+    missing = [key for key, value in profile.items() if value is None]
+    known = cached_user.model_dump() if cached_user is not None and cached_user.uid == profile["uid"] else None
+    stored = {}
+    if created_at_us == now_us or (missing and known is None):
+        stored = user_ref.get().to_dict() or {}
+    elif missing:
+        stored = known
+
+    created_at = _from_epoch_us(created_at_us)
+    legacy_created_at = stored.get("created_at") if created_at_us == now_us else None
+    if legacy_created_at:
+        # 이전 방식으로 만들어진 문서: 원래 생성 시각을 created_at_us로 옮깁니다. (사용자당 최초 1회)
+        created_at = legacy_created_at
+        user_ref.update({"created_at_us": _to_epoch_us(datetime.fromisoformat(legacy_created_at))})
+
+    return UserInDB(
+        **{**profile, **{key: stored.get(key) for key in missing}},
+        created_at=created_at,
+        last_login_at=now_iso,
+    )
+
+
 async def get_or_create_user(decoded_token: dict) -> UserInDB:
     """
-    [비동기 함수] 검증된 토큰 정보를 바탕으로 Firestore에서 사용자를 조회하거나 생성합니다.
+    [비동기 함수] 검증된 토큰 정보를 바탕으로 Firestore의 사용자를 생성하거나 갱신합니다.
     (Google, Apple, Kakao 공용)
+
+    조회 후 update/set 하던 두 번의 왕복 대신 merge 쓰기 한 번으로 처리하며,
+    프로필(email, 이름, 사진, 제공자)은 토큰에 값이 있는 필드만 로그인한 제공자의 최신 값으로 갱신됩니다.
+    저장한 결과는 프로필 캐시에 반영되며, 지연 쓰기가 켜져 있으면
+    캐시된 프로필과 같은 사용자의 재로그인은 last_login_at만 메모리에 모아 둡니다.
     """
     uid = decoded_token.get("uid")
-    email = decoded_token.get("email")
-    display_name = decoded_token.get("name")
-    photo_url = decoded_token.get("picture")
     # kakao의 경우 우리가 "kakao.com"을 직접 넣어줍니다.
     provider_id = decoded_token.get("firebase", {}).get("sign_in_provider")
 
     if not uid:
         raise InvalidTokenPayloadError()  # 커스텀 예외 사용
 
+    profile = UserBase(
+        uid=uid,
+        email=decoded_token.get("email"),
+        display_name=decoded_token.get("name"),
+        photo_url=decoded_token.get("picture"),
+        provider_id=provider_id
+    ).model_dump()
+    now = datetime.now(timezone.utc)
+
+    cached_user = user_profile_cache.get(uid)
+    deferred_user = login_write_behind.record_login(cached_user, profile, now.isoformat())
+    if deferred_user is not None:
+        user_profile_cache.put(deferred_user)
+        return deferred_user
+
     try:
         user_ref = user_collection.document(uid)
+        # 동기/차단 함수이므로 스레드 풀에서 한 번에 실행합니다.
+        user = await run_in_threadpool(_upsert_user_sync, user_ref, profile, now, cached_user)
+    except Exception as e:
+        # 쓰기 결과를 알 수 없으므로 캐시된 값도 믿지 않습니다.
+        user_profile_cache.invalidate(uid)
+        if isinstance(e, CustomException):
+            raise e
+        raise DatabaseError(message=f"Firestore 처리 중 오류 발생: {e}")
 
-        # user_ref.get()은 동기/차단 함수이므로 스레드 풀에서 실행합니다.
-        user_doc = await run_in_threadpool(user_ref.get)
+    user_profile_cache.put(user)
+    login_write_behind.discard(uid)
+    return user
 
-        current_time = datetime.now(timezone.utc).isoformat()
 
-        if user_doc.exists:
-            # 기존 사용자: 마지막 로그인 시간 업데이트
-            user_data = user_doc.to_dict()
-            user_data["last_login_at"] = current_time
+def _load_user_sync(uid: str) -> Optional[UserInDB]:
+    """[동기 함수] Firestore에서 사용자 문서를 읽습니다. 없으면 None."""
+    user_doc = user_collection.document(uid).get()
+    if not user_doc.exists:
+        return None
+    data = user_doc.to_dict()
+    if not data.get("created_at") and data.get("created_at_us") is not None:
+        # 새 방식 문서는 생성 시각을 created_at_us에만 기록합니다.
+        data["created_at"] = _from_epoch_us(data["created_at_us"])
+    return UserInDB(**data)
 
-            await run_in_threadpool(user_ref.update, {"last_login_at": current_time})
 
-            return UserInDB(**user_data)
-        else:
-            # 신규 사용자: 사용자 정보 생성
-            new_user_data = UserBase(
-                uid=uid,
-                email=email,
-                display_name=display_name,
-                photo_url=photo_url,
-                provider_id=provider_id
-            )
+async def get_user(uid: str) -> Optional[UserInDB]:
+    """
+    [비동기 함수] uid로 사용자 프로필을 조회합니다. (인증이 필요한 엔드포인트용)
+    프로필 캐시에 있으면 Firestore를 읽지 않습니다.
+    """
+    async def _load() -> Optional[UserInDB]:
+        try:
+            return await run_in_threadpool(_load_user_sync, uid)
+        except Exception as e:
+            raise DatabaseError(message=f"Firestore 처리 중 오류 발생: {e}")
+
+    return await user_profile_cache.get_or_load(uid, _load)
+
+
+# --- 이메일/비밀번호 ---
+
+_PASSWORD_PROVIDER_ID = "password"
+
+
+def _credential_key(email: str) -> str:
+    return email.strip().lower()
+
+
+def _load_credential_sync(email: str) -> Optional[dict]:
+    """[동기 함수] 이메일 계정 정보를 읽습니다. 없으면 None."""
+    credential_doc = credential_collection.document(_credential_key(email)).get()
+    return credential_doc.to_dict() if credential_doc.exists else None
 
-            user_in_db_data = UserInDB(
-                **new_user_data.model_dump(),
-                created_at=current_time,
-                last_login_at=current_time
-            )
 
-            await run_in_threadpool(user_ref.set, user_in_db_data.model_dump())
+def _password_decoded_token(credential: dict) -> dict:
+    """get_or_create_user가 받는 형태로 맞춥니다."""
+    return {
+        "uid": credential["uid"],
+        "email": credential["email"],
+        "name": credential.get("display_name"),
+        "firebase": {"sign_in_provider": _PASSWORD_PROVIDER_ID}
+    }
 
-            return user_in_db_data
 
+async def signup_with_email(email: str, password: str, display_name: Optional[str] = None) -> UserInDB:
+    """
+    [비동기 함수] 이메일/비밀번호 계정을 만들고 사용자 문서를 생성합니다.
+    비밀번호 해시는 프로세스 풀에서 계산합니다.
+    """
+    password_hash = await password_hasher.hash(password)
+    credential = {
+        "uid": f"email:{secrets.token_hex(16)}",
+        "email": email,
+        "display_name": display_name,
+        "password_hash": password_hash,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+    }
+
+    try:
+        # create()는 문서가 이미 있으면 실패하므로 같은 이메일의 동시 가입도 하나만 성공합니다.
+        await run_in_threadpool(credential_collection.document(_credential_key(email)).create, credential)
+    except google_api_exceptions.AlreadyExists:
+        raise AccountAlreadyExistsError()
     except Exception as e:
-        if isinstance(e, CustomException):
-            raise e
         raise DatabaseError(message=f"Firestore 처리 중 오류 발생: {e}")
 
+    return await get_or_create_user(_password_decoded_token(credential))
+
+
+async def login_with_email(email: str, password: str) -> UserInDB:
+    """
+    [비동기 함수] 이메일/비밀번호를 확인하고 사용자 문서를 갱신합니다.
+    BCRYPT_ROUNDS가 바뀐 뒤 처음 로그인하면 새 비용으로 다시 해시해 저장합니다.
+    """
+    try:
+        credential = await run_in_threadpool(_load_credential_sync, email)
+    except Exception as e:
+        raise DatabaseError(message=f"Firestore 처리 중 오류 발생: {e}")
+
+    if credential is None:
+        await password_hasher.verify_dummy(password)
+        raise InvalidCredentialsError()
+
+    verified, new_hash = await password_hasher.verify(password, credential["password_hash"])
+    if not verified:
+        raise InvalidCredentialsError()
+
+    if new_hash:
+        try:
+            await run_in_threadpool(
+                credential_collection.document(_credential_key(email)).update,
+                {"password_hash": new_hash}
+            )
+        except Exception as e:
+            # 다음 로그인에서 다시 시도하면 되므로 로그인은 실패시키지 않습니다.
+            print(f"[auth] 비밀번호 재해시 저장 실패: {e}")
+
+    return await get_or_create_user(_password_decoded_token(credential))
+
 
 def generate_api_token(uid: str) -> str:
     """
@@ -215,4 +550,28 @@ def generate_api_token(uid: str) -> str:
     """
     data = {"sub": uid}
     access_token = create_access_token(data=data)
-    return access_token
\ No newline at end of file
+    return access_token
+
+
+async def issue_token_pair(uid: str) -> dict:
+    """
+    [비동기 함수] 로그인 응답용 API Access Token과 새 Refresh Token을 발급합니다.
+    """
+    return {
+        "access_token": generate_api_token(uid=uid),
+        "refresh_token": await refresh_token_store.issue(uid),
+        "token_type": "bearer"
+    }
+
+
+async def refresh_token_pair(refresh_token: str) -> dict:
+    """
+    [비동기 함수] Refresh Token을 다음 세대로 교체하고 새 API Access Token을 발급합니다.
+    소셜 토큰 검증, Firebase Auth 호출 없이 Firestore 트랜잭션 한 번으로 처리됩니다.
+    """
+    uid, next_refresh_token = await refresh_token_store.rotate(refresh_token)
+    return {
+        "access_token": generate_api_token(uid=uid),
+        "refresh_token": next_refresh_token,
+        "token_type": "bearer"
+    }
@@ -0,0 +1,240 @@
+import asyncio
+import hashlib
+import json
+import re
+import time
+from typing import Dict, Optional
+
+from jose import jwk
+from jose.exceptions import JOSEError
+from jose.utils import base64url_decode
+
+from app.core.config import (
+    FIREBASE_KEY_PATH,
+    FIREBASE_NATIVE_VERIFY_ENABLED,
+    FIREBASE_PROJECT_ID,
+    FIREBASE_VERIFIED_TOKEN_CACHE_MAX_ENTRIES,
+    FIREBASE_VERIFIED_TOKEN_TTL_SECONDS,
+)
+from app.core.exceptions.exceptions import (
+    InvalidTokenError,
+    TokenExpiredError,
+    TokenVerificationError,
+)
+from app.shared.cache import SingleFlight, TTLCache
+from app.shared.http_clients import http_clients
+
+# Firebase ID 토큰 서명용 공개 인증서 (kid -> x509 PEM)
+_CERTS_PATH = "/robot/v1/metadata/x509/securetoken@system.gserviceaccount.com"
+_ISSUER_PREFIX = "https://securetoken.google.com/"
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+_DEFAULT_MAX_AGE_SECONDS = 3600
+# 만료까지 남은 시간의 이 비율이 지나면 미리 갱신합니다.
+_REFRESH_AHEAD_RATIO = 0.8
+_MIN_REFRESH_SECONDS = 60
+_RETRY_SECONDS = 30
+# 갱신이 계속 실패해도 만료된 키 집합은 이 유예 시간까지만 사용하고, 이후에는 Admin SDK 검증으로 대체합니다.
+_STALE_KEYS_GRACE_SECONDS = 600
+# 알 수 없는 kid로 인한 즉시 갱신은 이 간격 안에 한 번만 허용합니다. (위조 토큰으로 갱신을 남발하지 않도록)
+_KID_MISS_REFRESH_INTERVAL_SECONDS = 60
+
+http_clients.register("google_certs", base_url="https://www.googleapis.com")
+
+
+class _UnknownKeyId(Exception):
+    """토큰의 kid가 현재 키 집합에 없는 경우. (키 교체 직후일 수 있어 한 번 갱신 후 재시도)"""
+
+
+class FirebaseTokenVerifier:
+    """
+    Firebase ID 토큰을 스레드 풀 없이 프로세스 안에서 검증합니다.
+
+    - Google 공개 인증서를 메모리에 파싱해 두고, Cache-Control max-age 만료 전에
+      백그라운드 작업이 미리 갱신합니다.
+    - 서명(RS256), aud(프로젝트 ID), iss, exp, iat, sub를 Admin SDK와 같은 규칙으로 확인합니다.
+    - 이미 검증한 토큰은 SHA-256 해시 기준으로 짧게(토큰 만료 전까지만) 결과를 재사용합니다.
+    프로젝트 ID나 키 집합을 확보하지 못하거나, 갱신 실패로 키 집합이 만료 후 유예 시간을 넘기면
+    available이 False가 되어 호출 측에서 Admin SDK 검증으로 대체합니다.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = FIREBASE_NATIVE_VERIFY_ENABLED,
+        project_id: Optional[str] = FIREBASE_PROJECT_ID,
+        cache_ttl_seconds: int = FIREBASE_VERIFIED_TOKEN_TTL_SECONDS,
+        cache_max_entries: int = FIREBASE_VERIFIED_TOKEN_CACHE_MAX_ENTRIES,
+    ) -> None:
+        self.enabled = enabled
+        self.project_id = project_id
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self._keys: Dict[str, object] = {}
+        self._keys_expire_at = 0.0  # epoch 초
+        self._keys_loaded_at = float("-inf")  # monotonic
+        self._verified = TTLCache(max_entries=cache_max_entries, ttl_seconds=cache_ttl_seconds)
+        self._refresh = SingleFlight()
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    @property
+    def available(self) -> bool:
+        return (
+            self.enabled
+            and bool(self.project_id)
+            and bool(self._keys)
+            and time.time() < self._keys_expire_at + _STALE_KEYS_GRACE_SECONDS
+        )
+
+    async def start(self) -> None:
+        """
+        키 집합을 처음 받아오고 백그라운드 갱신 작업을 시작합니다. (앱 시작 시 호출)
+        실패해도 앱 시작을 막지 않으며, 그동안은 Admin SDK 검증으로 대체됩니다.
+        """
+        if not self.enabled or self._refresh_task is not None:
+            return
+        if not self.project_id:
+            self.project_id = _read_project_id(FIREBASE_KEY_PATH)
+        if not self.project_id:
+            print("[auth] Firebase 프로젝트 ID를 알 수 없어 ID 토큰 자체 검증을 사용하지 않습니다.")
+            return
+
+        try:
+            await self.refresh_keys()
+        except Exception as exc:
+            print(f"[auth] Firebase 공개 키를 가져오지 못했습니다. 재시도합니다: {exc}")
+        self._refresh_task = asyncio.create_task(self._refresh_loop(), name="firebase-key-refresh")
+
+    async def stop(self) -> None:
+        """백그라운드 갱신 작업을 종료합니다. (앱 종료 시 호출)"""
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            await asyncio.gather(self._refresh_task, return_exceptions=True)
+            self._refresh_task = None
+
+    async def refresh_keys(self) -> None:
+        """공개 인증서를 받아 키 집합을 교체합니다. 동시 호출은 하나로 합쳐집니다."""
+        await self._refresh.do("keys", self._fetch_keys)
+
+    async def _fetch_keys(self) -> None:
+        response = await http_clients.get("google_certs").get(_CERTS_PATH)
+        response.raise_for_status()
+        match = _MAX_AGE_RE.search(response.headers.get("cache-control", ""))
+        max_age = int(match.group(1)) if match else _DEFAULT_MAX_AGE_SECONDS
+        self.load_certificates(response.json(), max_age)
+
+    def load_certificates(self, certificates: Dict[str, str], max_age_seconds: float) -> None:
+        """kid -> x509 PEM 인증서로 키 집합을 교체합니다. 인증서 파싱은 여기서 한 번만 수행합니다."""
+        self._keys = {kid: jwk.construct(pem, "RS256") for kid, pem in certificates.items()}
+        self._keys_expire_at = time.time() + max_age_seconds
+        self._keys_loaded_at = time.monotonic()
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            remaining = self._keys_expire_at - time.time()
+            delay = max(_MIN_REFRESH_SECONDS, remaining * _REFRESH_AHEAD_RATIO) if self._keys else _RETRY_SECONDS
+            await asyncio.sleep(delay)
+            try:
+                await self.refresh_keys()
+            except Exception as exc:
+                print(f"[auth] Firebase 공개 키 갱신 실패, {_RETRY_SECONDS}초 후 재시도: {exc}")
+                await asyncio.sleep(_RETRY_SECONDS)
+
+    async def verify(self, token: str) -> dict:
+        """
+        토큰을 검증하고 Admin SDK와 같은 형태(uid 포함)의 claims를 반환합니다.
+        kid가 키 집합에 없을 때만 키를 한 번 갱신하며, 그 외에는 네트워크/스레드를 사용하지 않습니다.
+        """
+        try:
+            return self.verify_sync(token)
+        except _UnknownKeyId:
+            if time.monotonic() - self._keys_loaded_at < _KID_MISS_REFRESH_INTERVAL_SECONDS:
+                raise InvalidTokenError()
+            try:
+                await self.refresh_keys()
+            except Exception as exc:
+                raise TokenVerificationError(message=f"Firebase 공개 키를 갱신할 수 없습니다: {exc}")
+            try:
+                return self.verify_sync(token)
+            except _UnknownKeyId:
+                raise InvalidTokenError()
+
+    def verify_sync(self, token: str) -> dict:
+        digest = hashlib.sha256(token.encode("utf-8")).digest()
+        cached = self._verified.get(digest)
+        if cached is not None:
+            return dict(cached)
+
+        claims = self._verify_uncached(token)
+        ttl = min(self.cache_ttl_seconds, claims["exp"] - time.time())
+        self._verified.set(digest, claims, ttl_seconds=ttl)
+        return dict(claims)
+
+    def _verify_uncached(self, token: str) -> dict:
+        try:
+            header_segment, payload_segment, signature_segment = token.split(".")
+            header = json.loads(base64url_decode(header_segment.encode("ascii")))
+            claims = json.loads(base64url_decode(payload_segment.encode("ascii")))
+            signature = base64url_decode(signature_segment.encode("ascii"))
+        except (ValueError, UnicodeError):
+            raise InvalidTokenError()
+
+        if not isinstance(header, dict) or not isinstance(claims, dict):
+            raise InvalidTokenError()
+        kid = header.get("kid")
+        if header.get("alg") != "RS256" or not isinstance(kid, str):
+            raise InvalidTokenError()
+
+        key = self._keys.get(kid)
+        if key is None:
+            raise _UnknownKeyId()
+        try:
+            signature_ok = key.verify(f"{header_segment}.{payload_segment}".encode("ascii"), signature)
+        except JOSEError:
+            signature_ok = False
+        if not signature_ok:
+            raise InvalidTokenError()
+
+        self._check_claims(claims)
+        claims["uid"] = claims["sub"]
+        return claims
+
+    def _check_claims(self, claims: dict) -> None:
+        now = time.time()
+        exp = claims.get("exp")
+        iat = claims.get("iat")
+        sub = claims.get("sub")
+
+        if claims.get("aud") != self.project_id:
+            raise InvalidTokenError(message="토큰의 대상(aud)이 올바르지 않습니다.")
+        if claims.get("iss") != _ISSUER_PREFIX + self.project_id:
+            raise InvalidTokenError(message="토큰의 발급자(iss)가 올바르지 않습니다.")
+        if not isinstance(sub, str) or not sub or len(sub) > 128:
+            raise InvalidTokenError(message="토큰의 사용자 식별자(sub)가 올바르지 않습니다.")
+        if not isinstance(exp, (int, float)) or not isinstance(iat, (int, float)):
+            raise InvalidTokenError()
+        if exp <= now:
+            raise TokenExpiredError()
+        if iat > now:
+            raise InvalidTokenError(message="아직 유효하지 않은 토큰입니다.")
+
+    def stats(self) -> dict:
+        return {
+            "available": self.available,
+            "keys_stale": bool(self._keys) and time.time() >= self._keys_expire_at,
+            "keys": len(self._keys),
+            "keys_expire_in": max(0, int(self._keys_expire_at - time.time())),
+            "verified_cache": self._verified.stats(),
+        }
+
+
+def _read_project_id(key_path: Optional[str]) -> Optional[str]:
+    if not key_path:
+        return None
+    try:
+        with open(key_path, encoding="utf-8") as file:
+            return json.load(file).get("project_id")
+    except (OSError, ValueError):
+        return None
+
+
+firebase_token_verifier = FirebaseTokenVerifier()
+
+__all__ = ["FirebaseTokenVerifier", "firebase_token_verifier"]
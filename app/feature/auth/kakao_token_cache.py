@@ -0,0 +1,91 @@
+import hashlib
+import hmac
+import secrets
+from typing import Awaitable, Callable, Optional
+
+from app.core.config import (
+    KAKAO_TOKEN_CACHE_ENABLED,
+    KAKAO_TOKEN_CACHE_MAX_ENTRIES,
+    KAKAO_TOKEN_CACHE_TTL_SECONDS,
+    KAKAO_TOKEN_NEGATIVE_TTL_SECONDS,
+    KAKAO_TOKEN_UNKNOWN_EXPIRY_TTL_SECONDS,
+)
+from app.core.exceptions.exceptions import ExternalApiError
+from app.shared.cache import SingleFlight, TTLCache
+from app.shared.metrics import metrics
+
+
+class KakaoTokenCache:
+    """
+    Kakao Access Token 검증 결과 캐시.
+
+    - 키: 프로세스마다 새로 만드는 비밀 키로 계산한 HMAC-SHA256(token)
+      (원본 토큰은 메모리에 보관하지 않습니다.)
+    - 유효한 토큰: 사용자 정보를 min(ttl_seconds, 토큰 남은 수명) 동안 보관
+      (남은 수명을 모르면 만료/폐기된 토큰을 오래 받아들이지 않도록 짧은 unknown_expiry_ttl_seconds 동안만 보관)
+    - 거절된 토큰: 오류 메시지를 negative_ttl_seconds 동안 보관하여 같은 예외를 다시 발생
+    - 같은 토큰의 동시 검증은 업스트림 호출 하나로 합쳐집니다.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = KAKAO_TOKEN_CACHE_ENABLED,
+        ttl_seconds: int = KAKAO_TOKEN_CACHE_TTL_SECONDS,
+        negative_ttl_seconds: int = KAKAO_TOKEN_NEGATIVE_TTL_SECONDS,
+        max_entries: int = KAKAO_TOKEN_CACHE_MAX_ENTRIES,
+        unknown_expiry_ttl_seconds: int = KAKAO_TOKEN_UNKNOWN_EXPIRY_TTL_SECONDS,
+    ) -> None:
+        self.enabled = enabled
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.unknown_expiry_ttl_seconds = min(ttl_seconds, unknown_expiry_ttl_seconds)
+        self._key = secrets.token_bytes(32)
+        # digest -> ("valid", kakao_data) | ("rejected", message)
+        self._cache = TTLCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
+        self._single_flight = SingleFlight()
+
+    def digest(self, token: str) -> bytes:
+        return hmac.new(self._key, token.encode("utf-8"), hashlib.sha256).digest()
+
+    def get(self, digest: bytes) -> Optional[dict]:
+        """
+        캐시된 사용자 정보를 반환합니다. 없으면 None,
+        거절된 토큰으로 캐시되어 있으면 ExternalApiError를 다시 발생시킵니다.
+        """
+        if not self.enabled:
+            return None
+
+        entry = self._cache.get(digest)
+        if entry is None:
+            metrics.increment("kakao_token_cache_total", {"result": "miss"})
+            return None
+
+        kind, value = entry
+        if kind == "rejected":
+            metrics.increment("kakao_token_cache_total", {"result": "negative_hit"})
+            raise ExternalApiError(message=value)
+        metrics.increment("kakao_token_cache_total", {"result": "hit"})
+        return value
+
+    async def coalesce(self, digest: bytes, verify: Callable[[], Awaitable[dict]]) -> dict:
+        """같은 토큰에 대한 동시 검증을 하나로 합칩니다."""
+        return await self._single_flight.do(digest, verify)
+
+    def store_valid(self, digest: bytes, kakao_data: dict, expires_in: Optional[int]) -> None:
+        if not self.enabled:
+            return
+        ttl = self.unknown_expiry_ttl_seconds if expires_in is None else min(self.ttl_seconds, expires_in)
+        self._cache.set(digest, ("valid", kakao_data), ttl_seconds=ttl)
+
+    def store_rejected(self, digest: bytes, message: str) -> None:
+        if not self.enabled:
+            return
+        self._cache.set(digest, ("rejected", message), ttl_seconds=self.negative_ttl_seconds)
+
+    def stats(self) -> dict:
+        return {**self._cache.stats(), "inflight": self._single_flight.inflight_count()}
+
+
+kakao_token_cache = KakaoTokenCache()
+
+__all__ = ["KakaoTokenCache", "kakao_token_cache"]
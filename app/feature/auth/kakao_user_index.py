@@ -0,0 +1,63 @@
+from typing import Awaitable, Callable, Optional, TypeVar
+
+from app.core.config import KAKAO_UID_INDEX_MAX_ENTRIES, KAKAO_UID_INDEX_TTL_SECONDS
+from app.shared.cache import SingleFlight, TTLCache
+
+T = TypeVar("T")
+
+# 새 Kakao 사용자는 Firebase UID를 Kakao 사용자 ID로부터 정합니다.
+KAKAO_UID_PREFIX = "kakao:"
+
+
+class KakaoUserIndex:
+    """
+    Kakao 사용자 ID -> Firebase UID 인덱스.
+
+    - 새 사용자: UID가 "kakao:<Kakao ID>"로 정해져 있어 조회 한 번으로 찾습니다.
+    - 이전(이메일 기준) 방식으로 만든 사용자: 처음 찾을 때 Firestore 연결 문서
+      (kakao_links/<Kakao ID> = {uid})에 기록해 두고, 이후에는 이메일 없이 찾습니다.
+    찾은 UID는 프로세스 안에 캐시하며, 같은 Kakao ID의 동시 로그인은 하나로 합칩니다.
+    """
+
+    def __init__(
+        self,
+        link_collection,
+        ttl_seconds: int = KAKAO_UID_INDEX_TTL_SECONDS,
+        max_entries: int = KAKAO_UID_INDEX_MAX_ENTRIES,
+    ) -> None:
+        self.link_collection = link_collection
+        self._uids = TTLCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
+        self._single_flight = SingleFlight()
+
+    @staticmethod
+    def deterministic_uid(kakao_id: str) -> str:
+        return f"{KAKAO_UID_PREFIX}{kakao_id}"
+
+    def get(self, kakao_id: str) -> Optional[str]:
+        return self._uids.get(kakao_id)
+
+    def remember(self, kakao_id: str, uid: str) -> None:
+        self._uids.set(kakao_id, uid)
+
+    def forget(self, kakao_id: str) -> None:
+        self._uids.delete(kakao_id)
+
+    async def coalesce(self, kakao_id: str, resolve: Callable[[], Awaitable[T]]) -> T:
+        return await self._single_flight.do(kakao_id, resolve)
+
+    def load_link_sync(self, kakao_id: str) -> Optional[str]:
+        """[동기 함수] 이전 방식 사용자의 연결 문서를 읽습니다."""
+        link_doc = self.link_collection.document(kakao_id).get()
+        if not link_doc.exists:
+            return None
+        return (link_doc.to_dict() or {}).get("uid")
+
+    def save_link_sync(self, kakao_id: str, uid: str) -> None:
+        """[동기 함수] 이전 방식 사용자의 연결 문서를 기록합니다."""
+        self.link_collection.document(kakao_id).set({"uid": uid})
+
+    def stats(self) -> dict:
+        return {**self._uids.stats(), "inflight": self._single_flight.inflight_count()}
+
+
+__all__ = ["KAKAO_UID_PREFIX", "KakaoUserIndex"]
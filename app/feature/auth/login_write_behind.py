@@ -0,0 +1,133 @@
+import asyncio
+from typing import Dict, Optional, Set
+
+from fastapi.concurrency import run_in_threadpool
+
+from app.core.config import (
+    LOGIN_WRITE_BEHIND_ENABLED,
+    LOGIN_WRITE_BEHIND_FLUSH_SECONDS,
+    LOGIN_WRITE_BEHIND_MAX_PENDING,
+)
+from app.core.firebase import db
+from app.feature.auth.auth_schemas import UserInDB
+from app.shared.metrics import metrics
+
+# Firestore 일괄 쓰기(batch) 한 번에 담을 수 있는 최대 쓰기 수
+_BATCH_LIMIT = 500
+
+
+class LastLoginWriteBehind:
+    """
+    재로그인의 last_login_at 갱신을 메모리에 모았다가 Firestore batch로 일괄 기록합니다.
+
+    프로필 캐시에 같은 프로필로 올라 있는(문서가 있다고 확인된) 사용자만 대상이며,
+    같은 사용자의 여러 로그인은 마지막 시각 하나로 합쳐집니다.
+    기록은 flush_seconds마다, 대기 건수가 max_pending에 닿았을 때, 그리고 앱 종료 시 수행됩니다.
+    프로세스가 비정상 종료되면 마지막 flush 이후의 로그인 시각은 유실될 수 있습니다.
+    """
+
+    def __init__(
+        self,
+        collection,
+        client=db,
+        enabled: bool = LOGIN_WRITE_BEHIND_ENABLED,
+        flush_seconds: int = LOGIN_WRITE_BEHIND_FLUSH_SECONDS,
+        max_pending: int = LOGIN_WRITE_BEHIND_MAX_PENDING,
+    ) -> None:
+        self.collection = collection
+        self.client = client
+        self.enabled = enabled
+        self.flush_seconds = max(1, flush_seconds)
+        self.max_pending = max(1, max_pending)
+        # uid -> 기록할 last_login_at
+        self._pending: Dict[str, str] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._flush_lock = asyncio.Lock()
+        # 대기 건수 초과로 시작한 flush 작업 (완료 전에 GC되지 않도록 참조를 유지)
+        self._flushes: Set[asyncio.Task] = set()
+
+    def start(self) -> None:
+        """주기적 flush 작업을 시작합니다. (앱 시작 시 호출)"""
+        if self.enabled and self._task is None:
+            self._task = asyncio.create_task(self._flush_loop(), name="login-write-behind")
+
+    async def stop(self) -> None:
+        """주기 작업을 멈추고 남은 로그인 시각을 기록합니다. (앱 종료 시 호출)"""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await self.flush()
+
+    def discard(self, uid: str) -> None:
+        """
+        Firestore에 사용자 문서를 방금 직접 썼을 때 호출합니다.
+        그 문서에 더 최근 로그인 시각이 들어 있으므로 대기 중인 이전 시각은 버립니다.
+        """
+        self._pending.pop(uid, None)
+
+    def record_login(
+        self,
+        cached_user: Optional[UserInDB],
+        profile: dict,
+        last_login_at: str,
+    ) -> Optional[UserInDB]:
+        """
+        캐시된 사용자의 프로필이 그대로면 로그인 시각만 대기열에 넣고 갱신된 UserInDB를 반환합니다.
+        대상이 아니면 None을 반환하며, 호출 측에서 Firestore에 바로 저장합니다.
+        """
+        if not self.enabled:
+            return None
+
+        user = cached_user
+        # 토큰에 없는 필드(None)는 저장된 값을 바꾸지 않으므로 비교하지 않습니다.
+        if user is None or any(
+            getattr(user, key) != value for key, value in profile.items() if value is not None
+        ):
+            return None
+
+        self._pending[user.uid] = last_login_at
+        metrics.increment("login_write_behind_total", {"result": "deferred"})
+        if len(self._pending) >= self.max_pending:
+            task = asyncio.get_running_loop().create_task(self.flush())
+            self._flushes.add(task)
+            task.add_done_callback(self._flushes.discard)
+        return user.model_copy(update={"last_login_at": last_login_at})
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_seconds)
+            await self.flush()
+
+    async def flush(self) -> None:
+        async with self._flush_lock:
+            if not self._pending:
+                return
+            pending, self._pending = self._pending, {}
+            items = list(pending.items())
+            for start in range(0, len(items), _BATCH_LIMIT):
+                chunk = items[start:start + _BATCH_LIMIT]
+                try:
+                    await run_in_threadpool(self._commit_sync, chunk)
+                    metrics.increment("login_write_behind_flushed_total", value=len(chunk))
+                except Exception as exc:
+                    print(f"[auth] last_login_at 일괄 기록 실패 ({len(chunk)}건), 다음 주기에 재시도합니다: {exc}")
+                    for uid, last_login_at in chunk:
+                        # 그사이 더 최근 로그인이 들어왔다면 그것을 유지합니다.
+                        self._pending.setdefault(uid, last_login_at)
+
+    def _commit_sync(self, chunk) -> None:
+        """
+        [동기 함수] last_login_at 갱신을 batch 하나로 기록합니다.
+        update는 문서 하나만 없어도 batch 전체가 실패하므로(계속 재시도됨) merge set을 사용합니다.
+        """
+        batch = self.client.batch()
+        for uid, last_login_at in chunk:
+            batch.set(self.collection.document(uid), {"last_login_at": last_login_at}, merge=True)
+        batch.commit()
+
+    def stats(self) -> dict:
+        return {"enabled": self.enabled, "pending": len(self._pending)}
+
+
+__all__ = ["LastLoginWriteBehind"]
@@ -0,0 +1,83 @@
+import asyncio
+import multiprocessing
+import secrets
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Tuple
+
+from app.core.config import PASSWORD_HASH_MAX_QUEUE, PASSWORD_HASH_WORKERS
+from app.core.security import get_password_hash, verify_and_update_password
+from app.shared.concurrency import ConcurrencyLimiter
+from app.shared.metrics import metrics
+
+
+class PasswordHasher:
+    """
+    bcrypt 해시/검증을 별도 프로세스 풀에서 실행합니다.
+
+    - 이벤트 루프와 GIL을 점유하지 않으므로 같은 워커의 다른 요청 지연에 영향을 주지 않고,
+      프로세스 수만큼 여러 코어로 확장됩니다.
+    - 동시 실행은 프로세스 수로, 대기는 max_queue로 제한하며
+      대기열이 가득 차면 기다리지 않고 즉시 TooManyRequestsError(429)를 발생시킵니다.
+    프로세스 풀은 처음 사용할 때 만들어집니다.
+    """
+
+    def __init__(
+        self,
+        workers: int = PASSWORD_HASH_WORKERS,
+        max_queue: int = PASSWORD_HASH_MAX_QUEUE,
+    ) -> None:
+        self.workers = max(1, workers)
+        self._limiter = ConcurrencyLimiter(
+            max_concurrency=self.workers,
+            max_queue=max_queue,
+            name="password_hash",
+        )
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._dummy_hash: Optional[str] = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # 스레드가 떠 있는 서버 프로세스를 fork하지 않도록 spawn으로 시작합니다.
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    async def _run(self, operation: str, fn, *args):
+        async with self._limiter.acquire():
+            loop = asyncio.get_running_loop()
+            started = loop.time()
+            result = await loop.run_in_executor(self._get_executor(), fn, *args)
+            metrics.observe("password_hash_seconds", loop.time() - started, {"operation": operation})
+            return result
+
+    async def hash(self, password: str) -> str:
+        return await self._run("hash", get_password_hash, password)
+
+    async def verify(self, password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+        """(일치 여부, 비용이 바뀌었을 때의 새 해시 또는 None)을 반환합니다."""
+        return await self._run("verify", verify_and_update_password, password, hashed_password)
+
+    async def verify_dummy(self, password: str) -> None:
+        """
+        없는 계정으로 로그인할 때도 같은 비용의 검증을 수행하여,
+        응답 시간으로 가입 여부를 알 수 없도록 합니다.
+        """
+        if self._dummy_hash is None:
+            self._dummy_hash = await self.hash(secrets.token_urlsafe(16))
+        await self.verify(password, self._dummy_hash)
+
+    def shutdown(self) -> None:
+        """프로세스 풀을 종료합니다. (앱 종료 시 호출)"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def stats(self) -> dict:
+        return {**self._limiter.stats(), "started": self._executor is not None}
+
+
+password_hasher = PasswordHasher()
+
+__all__ = ["PasswordHasher", "password_hasher"]
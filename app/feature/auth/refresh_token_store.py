@@ -0,0 +1,241 @@
+import hashlib
+import hmac
+import secrets
+import time
+from dataclasses import asdict, dataclass
+from typing import Optional, Tuple
+
+from fastapi.concurrency import run_in_threadpool
+
+from app.core.config import REFRESH_TOKEN_EXPIRE_DAYS, REFRESH_TOKEN_REUSE_GRACE_SECONDS
+from app.core.exceptions.exceptions import (
+    CustomException,
+    DatabaseError,
+    InvalidTokenError,
+    TokenExpiredError,
+    TokenRevokedError,
+)
+from app.core.firebase import db, firestore
+from app.shared.metrics import metrics
+
+# rotate 판정 결과
+ROTATED = "rotated"
+RETRY_REJECTED = "retry_rejected"
+REUSE_DETECTED = "reuse_detected"
+REVOKED = "revoked"
+EXPIRED = "expired"
+INVALID = "invalid"
+
+
+@dataclass
+class RefreshTokenFamily:
+    """
+    한 번의 로그인에서 이어지는 Refresh Token 계열의 상태.
+    토큰 원문은 보관하지 않고 현재 세대 비밀값의 SHA-256만 보관합니다.
+    """
+    uid: str
+    generation: int
+    secret_hash: str
+    expires_at: float  # epoch 초
+    revoked: bool = False
+    # 직전 세대 (재시도 유예 판단용)
+    previous_secret_hash: Optional[str] = None
+    rotated_at: float = 0.0
+
+    def to_document(self) -> dict:
+        return asdict(self)
+
+
+def evaluate_rotation(
+    family: Optional[RefreshTokenFamily],
+    generation: int,
+    secret_hash: str,
+    now: float,
+    reuse_grace_seconds: float,
+) -> str:
+    """
+    제시된 (세대, 비밀값 해시)를 계열 상태와 비교해 판정 결과를 반환합니다. (상태는 바꾸지 않습니다.)
+
+    - ROTATED: 현재 세대 토큰 -> 다음 세대로 교체
+    - RETRY_REJECTED: 직전 세대 토큰이 reuse_grace_seconds 안에 다시 옴 (응답 유실 후 재시도로 보고 거절만)
+    - REUSE_DETECTED: 이미 교체된 이전 세대 토큰 -> 탈취 가능성이 있으므로 계열 폐기
+    - REVOKED / EXPIRED / INVALID
+    """
+    if family is None or family.revoked:
+        return REVOKED
+    if family.expires_at <= now:
+        return EXPIRED
+
+    if generation == family.generation and hmac.compare_digest(secret_hash, family.secret_hash):
+        return ROTATED
+    if (
+        generation == family.generation - 1
+        and family.previous_secret_hash is not None
+        and hmac.compare_digest(secret_hash, family.previous_secret_hash)
+        and now - family.rotated_at <= reuse_grace_seconds
+    ):
+        return RETRY_REJECTED
+    if generation < family.generation:
+        return REUSE_DETECTED
+    return INVALID
+
+
+class RefreshTokenStore:
+    """
+    회전(rotation) 방식의 Refresh Token 저장소. (Firestore 'refresh_tokens' 컬렉션, 문서 ID = family_id)
+
+    - 토큰 형식: "<family_id>.<generation>.<secret>"
+      family_id로 계열 상태를 찾고, 세대 번호와 비밀값 해시를 비교합니다.
+    - 갱신할 때마다 세대를 올리고 새 비밀값을 발급합니다.
+    - 이미 교체된 이전 세대 토큰이 다시 오면 탈취로 보고 계열 전체를 폐기합니다.
+      (단, 직전 세대가 reuse_grace_seconds 안에 다시 오면 응답 유실로 인한 재시도로 보고 거절만 합니다.)
+    - 갱신은 Firestore 트랜잭션 안에서 최신 상태를 읽고 판정/기록하므로,
+      여러 인스턴스에서 같은 토큰이 동시에 오더라도 한 번만 교체되고 재사용 탐지가 유지됩니다.
+      (프로세스 안에 계열 상태를 캐시하지 않습니다.)
+    """
+
+    def __init__(
+        self,
+        collection,
+        client=db,
+        expire_days: int = REFRESH_TOKEN_EXPIRE_DAYS,
+        reuse_grace_seconds: int = REFRESH_TOKEN_REUSE_GRACE_SECONDS,
+    ) -> None:
+        self.collection = collection
+        self.client = client
+        self.ttl_seconds = expire_days * 86400
+        self.reuse_grace_seconds = reuse_grace_seconds
+
+    async def issue(self, uid: str) -> str:
+        """새 계열의 첫 Refresh Token을 발급합니다. (로그인 시)"""
+        family_id = secrets.token_urlsafe(12)
+        secret = secrets.token_urlsafe(24)
+        family = RefreshTokenFamily(
+            uid=uid,
+            generation=0,
+            secret_hash=_hash(secret),
+            expires_at=time.time() + self.ttl_seconds,
+        )
+        try:
+            await run_in_threadpool(self.collection.document(family_id).set, family.to_document())
+        except Exception as e:
+            raise DatabaseError(message=f"Refresh Token 저장 중 오류 발생: {e}")
+        return _format(family_id, family.generation, secret)
+
+    async def rotate(self, token: str) -> Tuple[str, str]:
+        """Refresh Token을 검증하고 (uid, 다음 세대 Refresh Token)을 반환합니다."""
+        family_id, generation, secret = _parse(token)
+        next_secret = secrets.token_urlsafe(24)
+        try:
+            outcome, family = await run_in_threadpool(
+                self._rotate_sync, family_id, generation, _hash(secret), _hash(next_secret)
+            )
+        except CustomException:
+            raise
+        except Exception as e:
+            raise DatabaseError(message=f"Refresh Token 갱신 중 오류 발생: {e}")
+
+        metrics.increment("refresh_token_total", {"result": outcome})
+        if outcome == ROTATED:
+            return family.uid, _format(family_id, family.generation, next_secret)
+        if outcome == REVOKED:
+            raise TokenRevokedError()
+        if outcome == EXPIRED:
+            raise TokenExpiredError()
+        if outcome == RETRY_REJECTED:
+            raise InvalidTokenError(message="이미 사용된 Refresh Token입니다.")
+        if outcome == REUSE_DETECTED:
+            raise TokenRevokedError(message="재사용된 Refresh Token입니다. 다시 로그인하세요.")
+        raise InvalidTokenError()
+
+    def _rotate_sync(
+        self,
+        family_id: str,
+        generation: int,
+        secret_hash: str,
+        next_secret_hash: str,
+    ) -> Tuple[str, Optional[RefreshTokenFamily]]:
+        """
+        [동기 함수] 트랜잭션 안에서 계열 상태를 읽고, 판정 결과에 따라 교체/폐기를 기록합니다.
+        다른 요청이 그 사이 같은 계열을 바꾸면 트랜잭션이 재시도되어 바뀐 상태로 다시 판정합니다.
+        """
+        reference = self.collection.document(family_id)
+
+        @firestore.transactional
+        def rotate_in_transaction(transaction) -> Tuple[str, Optional[RefreshTokenFamily]]:
+            snapshot = reference.get(transaction=transaction)
+            family = RefreshTokenFamily(**snapshot.to_dict()) if snapshot.exists else None
+            now = time.time()
+            outcome = evaluate_rotation(family, generation, secret_hash, now, self.reuse_grace_seconds)
+            if outcome == ROTATED:
+                family.previous_secret_hash = family.secret_hash
+                family.generation += 1
+                family.secret_hash = next_secret_hash
+                family.rotated_at = now
+                transaction.set(reference, family.to_document())
+            elif outcome == REUSE_DETECTED:
+                family.revoked = True
+                transaction.update(reference, {"revoked": True})
+            return outcome, family
+
+        return rotate_in_transaction(self.client.transaction())
+
+    async def revoke(self, token: str, uid: str) -> None:
+        """
+        토큰이 속한 계열을 폐기합니다. (로그아웃)
+        계열의 사용자가 uid(Access Token의 sub)와 같고 토큰이 현재(또는 직전) 세대 비밀값일 때만 폐기하며,
+        그 외에는 InvalidTokenError를 발생시킵니다. (family_id만 알아낸 다른 사용자가 폐기하지 못하도록)
+        """
+        family_id, generation, secret = _parse(token)
+        try:
+            revoked = await run_in_threadpool(self._revoke_sync, family_id, uid, generation, _hash(secret))
+        except CustomException:
+            raise
+        except Exception as e:
+            raise DatabaseError(message=f"Refresh Token 폐기 중 오류 발생: {e}")
+        metrics.increment("refresh_token_revoke_total", {"result": "revoked" if revoked else "rejected"})
+        if not revoked:
+            raise InvalidTokenError()
+
+    def _revoke_sync(self, family_id: str, uid: str, generation: int, secret_hash: str) -> bool:
+        """[동기 함수] 트랜잭션 안에서 계열 상태를 읽고, 소유자와 비밀값이 맞으면 폐기를 기록합니다."""
+        reference = self.collection.document(family_id)
+
+        @firestore.transactional
+        def revoke_in_transaction(transaction) -> bool:
+            snapshot = reference.get(transaction=transaction)
+            family = RefreshTokenFamily(**snapshot.to_dict()) if snapshot.exists else None
+            if family is None or family.uid != uid:
+                return False
+            if generation == family.generation:
+                expected_hash = family.secret_hash
+            elif generation == family.generation - 1 and family.previous_secret_hash is not None:
+                # 갱신 응답을 받지 못한 클라이언트는 직전 세대 토큰을 갖고 있을 수 있습니다.
+                expected_hash = family.previous_secret_hash
+            else:
+                return False
+            if not hmac.compare_digest(secret_hash, expected_hash):
+                return False
+            if not family.revoked:
+                transaction.update(reference, {"revoked": True})
+            return True
+
+        return revoke_in_transaction(self.client.transaction())
+
+
+def _hash(secret: str) -> str:
+    return hashlib.sha256(secret.encode("utf-8")).hexdigest()
+
+
+def _format(family_id: str, generation: int, secret: str) -> str:
+    return f"{family_id}.{generation}.{secret}"
+
+
+def _parse(token: str) -> Tuple[str, int, str]:
+    parts = token.split(".")
+    if len(parts) != 3 or not parts[0] or not parts[1].isdigit() or not parts[2]:
+        raise InvalidTokenError()
+    return parts[0], int(parts[1]), parts[2]
+
+
+__all__ = ["RefreshTokenFamily", "RefreshTokenStore", "evaluate_rotation"]
@@ -0,0 +1,72 @@
+from typing import Awaitable, Callable, Optional
+
+from app.core.config import (
+    USER_PROFILE_CACHE_ENABLED,
+    USER_PROFILE_CACHE_MAX_ENTRIES,
+    USER_PROFILE_CACHE_TTL_SECONDS,
+)
+from app.feature.auth.auth_schemas import UserInDB
+from app.shared.cache import SingleFlight, TTLCache
+from app.shared.metrics import metrics
+
+
+class UserProfileCache:
+    """
+    uid -> UserInDB 읽기 캐시 (프로세스 내, TTL + LRU 상한).
+
+    - get_or_load: 캐시에 없을 때만 loader(Firestore 조회)를 호출하며, 같은 uid의 동시 조회는 하나로 합칩니다.
+    - get_or_create_user처럼 사용자 문서를 쓰는 곳은 put/invalidate로 캐시를 맞춥니다.
+    다른 인스턴스에서 바뀐 문서는 TTL이 지날 때까지 이전 값이 보일 수 있습니다.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = USER_PROFILE_CACHE_ENABLED,
+        ttl_seconds: int = USER_PROFILE_CACHE_TTL_SECONDS,
+        max_entries: int = USER_PROFILE_CACHE_MAX_ENTRIES,
+    ) -> None:
+        self.enabled = enabled
+        self._cache = TTLCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
+        self._single_flight = SingleFlight()
+
+    def get(self, uid: str) -> Optional[UserInDB]:
+        if not self.enabled:
+            return None
+        user = self._cache.get(uid)
+        metrics.increment("user_profile_cache_total", {"result": "miss" if user is None else "hit"})
+        return user
+
+    async def get_or_load(
+        self,
+        uid: str,
+        load: Callable[[], Awaitable[Optional[UserInDB]]],
+    ) -> Optional[UserInDB]:
+        """캐시된 사용자를 반환하고, 없으면 load()로 읽어 캐시에 넣습니다. 없는 사용자는 캐시하지 않습니다."""
+        user = self.get(uid)
+        if user is not None:
+            return user
+        if not self.enabled:
+            return await load()
+
+        async def _load() -> Optional[UserInDB]:
+            loaded = await load()
+            if loaded is not None:
+                self._cache.set(uid, loaded)
+            return loaded
+
+        return await self._single_flight.do(uid, _load)
+
+    def put(self, user: UserInDB) -> None:
+        if self.enabled:
+            self._cache.set(user.uid, user)
+
+    def invalidate(self, uid: str) -> None:
+        self._cache.delete(uid)
+
+    def stats(self) -> dict:
+        return {**self._cache.stats(), "inflight": self._single_flight.inflight_count()}
+
+
+user_profile_cache = UserProfileCache()
+
+__all__ = ["UserProfileCache", "user_profile_cache"]
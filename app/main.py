@@ -1,17 +1,69 @@
 # app/main.py
 
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse
 
 # 1. 기능별 라우터 import
-from app.feature.LLM import llm_router
+from app.feature.LLM import llm_router, llm_service
+from app.feature.LLM.chat_jobs import chat_job_manager
+from app.feature.LLM.image_preprocessor import shutdown_image_workers
 from app.feature.auth import auth_router
+from app.feature.auth.access_token_verifier import access_token_verifier
+from app.feature.auth.auth_service import login_write_behind
+from app.feature.auth.password_hasher import password_hasher
+from app.feature.auth.firebase_token_verifier import firebase_token_verifier
 
-# 2. Firebase 초기화 실행
-from app.core import firebase
+# 2. Firebase 초기화 (import 시점이 아니라 lifespan 시작 단계에서 실행)
+from app.core.firebase import init_firebase_async
 
 # 3. 커스텀 예외 핸들러 import
 from app.core.exceptions.exceptions import CustomException
 from app.core.exceptions.exception_handlers import custom_exception_handler
+from app.core.config import (
+    RATE_LIMIT_ENABLED,
+    RATE_LIMIT_MAX_KEYS,
+    RATE_LIMIT_POLICIES,
+    RATE_LIMIT_SHARDS,
+    RATE_LIMIT_TRUST_FORWARDED_FOR,
+)
+from app.core.health import readiness_snapshot, run_startup_check
+from app.shared.http_clients import http_clients
+from app.shared.metrics import metrics
+from app.shared.rate_limit import RateLimiter, RateLimitMiddleware
+
+metrics.register_collector("llm_jobs", chat_job_manager.stats)
+metrics.register_collector("http_clients", http_clients.stats)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    앱 시작/종료 시점에 실행될 작업을 정의합니다.
+    - 시작: Firebase 초기화, Gemini 기본 모델 warm-up, Firebase ID 토큰 공개 키 로드를 동시에 진행한 뒤
+      LLM 비동기 작업 워커, 로그인 시각 지연 쓰기 시작
+    - 종료: 작업 워커, 공개 키 갱신 작업, 로그인 시각 지연 쓰기(남은 기록 flush),
+      이미지 전처리 워커 풀, 비밀번호 해시 프로세스 풀, 공유 HTTP 커넥션 풀, LLM 백엔드(기록 파일) 정리
+    """
+    # 서로 의존하지 않는 준비 작업이므로 동시에 진행합니다. (시작 시간 = 가장 느린 작업)
+    # Firebase 설정 오류(AppConfigError)는 그대로 발생하여 앱 시작을 중단합니다.
+    await asyncio.gather(
+        run_startup_check("firebase", init_firebase_async),
+        run_startup_check("gemini", llm_service.warm_up),
+        firebase_token_verifier.start(),
+    )
+    chat_job_manager.start()
+    login_write_behind.start()
+    yield
+    await chat_job_manager.stop()
+    await firebase_token_verifier.stop()
+    await login_write_behind.stop()
+    shutdown_image_workers()
+    password_hasher.shutdown()
+    await http_clients.aclose()
+    llm_service.shutdown()
 
 
 # 4. FastAPI 앱 인스턴스 생성
@@ -19,11 +71,23 @@ app = FastAPI(
     title="BIMO-BE Project",
     description="BIMO-BE FastAPI 서버입니다.",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 # 5. 커스텀 예외 핸들러 등록
 app.add_exception_handler(CustomException, custom_exception_handler)
 
+# 요청 빈도 제한 (라우트별 정책, 인증된 사용자는 uid / 그 외는 IP 기준)
+if RATE_LIMIT_ENABLED:
+    rate_limiter = RateLimiter(RATE_LIMIT_POLICIES, shards=RATE_LIMIT_SHARDS, max_keys=RATE_LIMIT_MAX_KEYS)
+    metrics.register_collector("rate_limit", rate_limiter.stats)
+    app.add_middleware(
+        RateLimitMiddleware,
+        limiter=rate_limiter,
+        identify=access_token_verifier.subject_or_none,
+        trust_forwarded_for=RATE_LIMIT_TRUST_FORWARDED_FOR,
+    )
+
 
 # 6. 루트 엔드포인트 (서버 동작 확인용)
 @app.get("/")
@@ -31,6 +95,27 @@ def read_root():
     return {"Hello": "Welcome to BIMO-BE API"}
 
 
+@app.get("/health/ready")
+def readiness_probe():
+    """
+    시작 단계(warm-up 등)가 모두 성공했는지 보고합니다.
+    하나라도 실패/대기 중이면 503을 반환합니다.
+    """
+    ready, components = readiness_snapshot()
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={"ready": ready, "components": components},
+    )
+
+
+@app.get("/metrics")
+def read_metrics():
+    """
+    인프로세스 메트릭(라우팅 결정, 지연 시간, 캐시/리미터 상태 등)을 JSON으로 반환합니다.
+    """
+    return metrics.snapshot()
+
+
 # 5. 기능별 라우터 등록
 app.include_router(auth_router.router)
 app.include_router(llm_router.router)
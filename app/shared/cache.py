@@ -0,0 +1,151 @@
+import asyncio
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    TTL 만료와 LRU 축출을 지원하는 인메모리 캐시.
+
+    - max_entries: 최대 항목 수 (초과 시 가장 오래 사용되지 않은 항목부터 축출)
+    - max_bytes: 값 크기 합계의 상한 (None이면 제한 없음)
+    - ttl_seconds: 기본 만료 시간. set() 호출 시 항목별로 덮어쓸 수 있습니다.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float,
+        max_bytes: Optional[int] = None,
+        sizeof: Callable[[Any], int] = sys.getsizeof,
+    ) -> None:
+        self.max_entries = max(1, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof
+        # key -> (만료 시각(monotonic), 값, 크기)
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any, int]]" = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+
+            expires_at, value, _ = entry
+            if expires_at <= now:
+                self._remove(key)
+                self.misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        if ttl <= 0:
+            return
+
+        size = self._sizeof(value)
+        if self.max_bytes is not None and size > self.max_bytes:
+            # 단일 항목이 전체 한도를 넘으면 캐시하지 않습니다.
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = (time.monotonic() + ttl, value, size)
+            self._total_bytes += size
+            self._evict_overflow()
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def stats(self) -> Dict[str, int]:
+        """캐시 적중/미스/축출 통계를 반환합니다."""
+        return {
+            "entries": len(self._entries),
+            "bytes": self._total_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def _remove(self, key: Hashable) -> None:
+        _, _, size = self._entries.pop(key)
+        self._total_bytes -= size
+
+    def _evict_overflow(self) -> None:
+        while len(self._entries) > self.max_entries or (
+            self.max_bytes is not None and self._total_bytes > self.max_bytes
+        ):
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+            self.evictions += 1
+
+
+class SingleFlight:
+    """
+    동일한 키로 동시에 들어온 비동기 작업을 하나의 실행으로 합칩니다.
+
+    첫 호출자가 작업을 별도 Task로 시작하고, 이후 호출자들은 같은 Task의 결과를 기다립니다.
+    호출자 중 하나가 취소되더라도 공유 작업은 취소되지 않습니다.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: Dict[Hashable, "asyncio.Future[Any]"] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done, k=key: self._on_done(k, done))
+        return await asyncio.shield(task)
+
+    def inflight_count(self) -> int:
+        return len(self._inflight)
+
+    def _on_done(self, key: Hashable, task: "asyncio.Future[Any]") -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # 기다리는 호출자가 모두 사라진 경우에도 예외가 회수되도록 합니다.
+            task.exception()
+
+
+__all__ = ["TTLCache", "SingleFlight"]
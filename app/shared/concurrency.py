@@ -0,0 +1,58 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict
+
+from app.core.exceptions.exceptions import TooManyRequestsError
+
+
+class ConcurrencyLimiter:
+    """
+    동시 실행 수와 대기열 길이를 함께 제한하는 비동기 리미터.
+
+    - max_concurrency: 동시에 실행될 수 있는 작업 수
+    - max_queue: 실행 슬롯을 기다릴 수 있는 작업 수.
+      대기열이 가득 차면 기다리지 않고 즉시 TooManyRequestsError(429)를 발생시킵니다.
+    """
+
+    def __init__(self, max_concurrency: int, max_queue: int, name: str = "") -> None:
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_queue = max(0, max_queue)
+        self.name = name
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._in_flight = 0
+        self._waiting = 0
+        self.rejected = 0
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[None]:
+        if self._semaphore.locked():
+            if self._waiting >= self.max_queue:
+                self.rejected += 1
+                raise TooManyRequestsError()
+
+            self._waiting += 1
+            try:
+                await self._semaphore.acquire()
+            finally:
+                self._waiting -= 1
+        else:
+            await self._semaphore.acquire()
+
+        self._in_flight += 1
+        try:
+            yield
+        finally:
+            self._in_flight -= 1
+            self._semaphore.release()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "in_flight": self._in_flight,
+            "waiting": self._waiting,
+            "rejected": self.rejected,
+            "max_concurrency": self.max_concurrency,
+            "max_queue": self.max_queue,
+        }
+
+
+__all__ = ["ConcurrencyLimiter"]
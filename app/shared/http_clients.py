@@ -0,0 +1,151 @@
+import importlib.util
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+import httpx
+
+from app.core.config import (
+    HTTP_CLIENT_CONNECT_TIMEOUT_MS,
+    HTTP_CLIENT_HTTP2_ENABLED,
+    HTTP_CLIENT_KEEPALIVE_EXPIRY_SECONDS,
+    HTTP_CLIENT_MAX_CONNECTIONS,
+    HTTP_CLIENT_MAX_KEEPALIVE,
+    HTTP_CLIENT_READ_TIMEOUT_MS,
+)
+from app.core.exceptions.exceptions import AppConfigError
+from app.shared.metrics import metrics
+
+_H2_AVAILABLE = importlib.util.find_spec("h2") is not None
+_TIMER_EXTENSION = "http_client_timer"
+
+
+@dataclass(frozen=True)
+class HttpClientConfig:
+    """공유 HTTP 클라이언트 하나의 커넥션 풀/타임아웃 설정."""
+
+    base_url: str = ""
+    max_connections: int = HTTP_CLIENT_MAX_CONNECTIONS
+    max_keepalive_connections: int = HTTP_CLIENT_MAX_KEEPALIVE
+    keepalive_expiry_seconds: float = HTTP_CLIENT_KEEPALIVE_EXPIRY_SECONDS
+    connect_timeout_ms: int = HTTP_CLIENT_CONNECT_TIMEOUT_MS
+    read_timeout_ms: int = HTTP_CLIENT_READ_TIMEOUT_MS
+    http2: bool = HTTP_CLIENT_HTTP2_ENABLED
+    follow_redirects: bool = False
+
+
+class _RequestTimer:
+    """
+    httpcore trace 이벤트로 요청 하나의 커넥션 풀 대기/핸드셰이크 시간을 측정합니다.
+
+    - 풀 대기: 요청 시작 -> 새 연결 시작 또는 재사용 연결로 헤더 전송 시작
+    - 핸드셰이크: TCP 연결 시작 -> 헤더 전송 시작 (TLS 포함)
+    """
+
+    __slots__ = ("labels", "started", "connect_started", "sent")
+
+    def __init__(self, labels: Dict[str, str]) -> None:
+        self.labels = labels
+        self.started = time.perf_counter()
+        self.connect_started: Optional[float] = None
+        self.sent = False
+
+    async def trace(self, event: str, info: dict) -> None:
+        if event == "connection.connect_tcp.started":
+            now = time.perf_counter()
+            metrics.observe("http_client_pool_wait_seconds", now - self.started, self.labels)
+            metrics.increment("http_client_connections_opened_total", self.labels)
+            self.connect_started = now
+        elif event.endswith(".send_request_headers.started") and not self.sent:
+            now = time.perf_counter()
+            self.sent = True
+            if self.connect_started is None:
+                metrics.observe("http_client_pool_wait_seconds", now - self.started, self.labels)
+            else:
+                metrics.observe("http_client_connect_seconds", now - self.connect_started, self.labels)
+
+
+class HttpClientRegistry:
+    """
+    외부 API(Kakao 등)별로 공유하는 httpx.AsyncClient 저장소.
+
+    요청마다 클라이언트를 만들면 매번 TCP+TLS 핸드셰이크를 치르므로,
+    클라이언트는 이름별로 한 번만 만들어 keep-alive 커넥션을 재사용합니다.
+    각 클라이언트는 보통 한 제공자 호스트만 호출하므로 풀 제한이 곧 호스트별 제한이 됩니다.
+    요청별 지연/풀 대기/핸드셰이크 시간은 client, host 라벨로 메트릭에 기록됩니다.
+    클라이언트는 첫 사용 시 생성되며 앱 종료 시 aclose()로 정리합니다.
+    """
+
+    def __init__(self) -> None:
+        self._configs: Dict[str, HttpClientConfig] = {}
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+
+    def register(self, name: str, **options) -> None:
+        """클라이언트 설정을 등록합니다. (모듈 import 시점에 호출)"""
+        self._configs[name] = HttpClientConfig(**options)
+
+    def get(self, name: str) -> httpx.AsyncClient:
+        client = self._clients.get(name)
+        if client is None:
+            config = self._configs.get(name)
+            if config is None:
+                raise AppConfigError(f"등록되지 않은 HTTP 클라이언트입니다: {name}")
+            client = self._clients[name] = self._create(name, config)
+        return client
+
+    def _create(self, name: str, config: HttpClientConfig) -> httpx.AsyncClient:
+        async def on_request(request: httpx.Request) -> None:
+            timer = _RequestTimer({"client": name, "host": request.url.host})
+            request.extensions["trace"] = timer.trace
+            request.extensions[_TIMER_EXTENSION] = timer
+
+        async def on_response(response: httpx.Response) -> None:
+            timer: Optional[_RequestTimer] = response.request.extensions.get(_TIMER_EXTENSION)
+            if timer is None:
+                return
+            metrics.observe(
+                "http_client_request_seconds",
+                time.perf_counter() - timer.started,
+                timer.labels,
+            )
+            metrics.increment(
+                "http_client_requests_total",
+                {**timer.labels, "status": response.status_code},
+            )
+
+        return httpx.AsyncClient(
+            base_url=config.base_url,
+            http2=config.http2 and _H2_AVAILABLE,
+            follow_redirects=config.follow_redirects,
+            timeout=httpx.Timeout(
+                config.read_timeout_ms / 1000,
+                connect=config.connect_timeout_ms / 1000,
+            ),
+            limits=httpx.Limits(
+                max_connections=config.max_connections,
+                max_keepalive_connections=config.max_keepalive_connections,
+                keepalive_expiry=config.keepalive_expiry_seconds,
+            ),
+            event_hooks={"request": [on_request], "response": [on_response]},
+        )
+
+    async def aclose(self) -> None:
+        """열린 클라이언트의 커넥션 풀을 모두 닫습니다. (앱 종료 시 호출)"""
+        clients, self._clients = self._clients, {}
+        for client in clients.values():
+            await client.aclose()
+
+    def stats(self) -> dict:
+        return {
+            name: {
+                "open": name in self._clients,
+                "http2": config.http2 and _H2_AVAILABLE,
+                "max_connections": config.max_connections,
+            }
+            for name, config in self._configs.items()
+        }
+
+
+http_clients = HttpClientRegistry()
+
+__all__ = ["HttpClientConfig", "HttpClientRegistry", "http_clients"]
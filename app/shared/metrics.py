@@ -0,0 +1,66 @@
+import threading
+from typing import Callable, Dict, Optional, Tuple
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _label_key(labels: Optional[Dict[str, object]]) -> LabelKey:
+    if not labels:
+        return ()
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+class MetricsRegistry:
+    """
+    외부 의존성 없는 인프로세스 메트릭 저장소.
+
+    - counter: increment()로 누적되는 값 (예: 라우팅 결정 횟수)
+    - summary: observe()로 기록되는 관측값의 count/sum/min/max (예: 지연 시간)
+    - collector: snapshot 시점에 호출되어 현재 상태(dict)를 반환하는 함수 (예: 캐시 통계)
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[LabelKey, float]] = {}
+        self._summaries: Dict[str, Dict[LabelKey, Dict[str, float]]] = {}
+        self._collectors: Dict[str, Callable[[], dict]] = {}
+
+    def increment(self, name: str, labels: Optional[Dict[str, object]] = None, value: float = 1) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + value
+
+    def observe(self, name: str, value: float, labels: Optional[Dict[str, object]] = None) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            series = self._summaries.setdefault(name, {})
+            summary = series.get(key)
+            if summary is None:
+                series[key] = {"count": 1, "sum": value, "min": value, "max": value}
+            else:
+                summary["count"] += 1
+                summary["sum"] += value
+                summary["min"] = min(summary["min"], value)
+                summary["max"] = max(summary["max"], value)
+
+    def register_collector(self, name: str, collect: Callable[[], dict]) -> None:
+        self._collectors[name] = collect
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            counters = {
+                name: [{"labels": dict(key), "value": value} for key, value in series.items()]
+                for name, series in self._counters.items()
+            }
+            summaries = {
+                name: [{"labels": dict(key), **summary} for key, summary in series.items()]
+                for name, series in self._summaries.items()
+            }
+        collected = {name: collect() for name, collect in self._collectors.items()}
+        return {"counters": counters, "summaries": summaries, "collectors": collected}
+
+
+metrics = MetricsRegistry()
+
+__all__ = ["MetricsRegistry", "metrics"]
@@ -0,0 +1,217 @@
+import re
+import threading
+import time
+from dataclasses import dataclass
+from fnmatch import translate
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+from starlette.requests import Request
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.exceptions.exception_handlers import custom_exception_handler
+from app.core.exceptions.exceptions import AppConfigError, RateLimitExceededError
+from app.shared.metrics import metrics
+
+# 샤드마다 가득 찬(=새 버킷과 같은) 버킷을 정리하는 주기
+_SWEEP_INTERVAL_SECONDS = 5.0
+# (메서드, 경로) -> 정책 매칭 결과 캐시 상한 (경로 파라미터가 있는 라우트로 무한히 커지지 않도록)
+_ROUTE_CACHE_MAX_ENTRIES = 4096
+
+
+@dataclass(frozen=True)
+class RateLimitPolicy:
+    """라우트 패턴 하나에 대한 토큰 버킷 정책. rate는 초당 보충되는 토큰 수입니다."""
+
+    name: str
+    method: Optional[str]
+    pattern: "re.Pattern[str]"
+    rate: float
+    capacity: float
+
+    @classmethod
+    def from_config(cls, name: str, spec: dict) -> "RateLimitPolicy":
+        method, _, path_pattern = name.rpartition(" ")
+        try:
+            requests = float(spec["requests"])
+            period_seconds = float(spec.get("period_seconds", 60))
+            capacity = float(spec.get("burst", requests))
+        except (KeyError, TypeError, ValueError):
+            raise AppConfigError(f"RATE_LIMIT_POLICIES의 '{name}' 정책 형식이 올바르지 않습니다.")
+        if requests <= 0 or period_seconds <= 0 or capacity < 1:
+            raise AppConfigError(f"RATE_LIMIT_POLICIES의 '{name}' 정책 값은 양수여야 합니다. (burst는 1 이상)")
+        return cls(
+            name=name,
+            method=method.upper() or None,
+            pattern=re.compile(translate(path_pattern)),
+            rate=requests / period_seconds,
+            capacity=capacity,
+        )
+
+    def matches(self, method: str, path: str) -> bool:
+        return (self.method is None or self.method == method) and self.pattern.match(path) is not None
+
+
+class _Shard:
+    __slots__ = ("lock", "buckets", "next_sweep")
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        # key -> [남은 토큰, 마지막 갱신 시각(monotonic), 초당 보충량, 용량]
+        self.buckets: Dict[Hashable, List[float]] = {}
+        self.next_sweep = 0.0
+
+
+class TokenBucketTable:
+    """
+    락 단위로 샤딩된 인메모리 토큰 버킷 테이블.
+
+    - 보충은 접근할 때 경과 시간만큼 한 번에 계산합니다. (타이머 없음)
+    - 다시 가득 찬 버킷은 새 버킷과 같으므로 샤드별로 주기적으로 지웁니다.
+    - 샤드당 키 수가 상한을 넘으면 가장 오래전에 만든 버킷부터 지웁니다.
+    """
+
+    def __init__(self, shards: int, max_keys: int) -> None:
+        shard_count = 1
+        while shard_count < max(1, shards):
+            shard_count *= 2
+        self._mask = shard_count - 1
+        self._shards = [_Shard() for _ in range(shard_count)]
+        self._max_keys_per_shard = max(1, max_keys // shard_count)
+        self.evictions = 0
+
+    def take(self, key: Hashable, rate: float, capacity: float, now: Optional[float] = None) -> float:
+        """토큰 하나를 꺼냅니다. 허용되면 0, 아니면 토큰이 생길 때까지 기다려야 하는 초를 반환합니다."""
+        if now is None:
+            now = time.monotonic()
+        shard = self._shards[hash(key) & self._mask]
+        with shard.lock:
+            if now >= shard.next_sweep:
+                self._sweep(shard, now)
+
+            bucket = shard.buckets.get(key)
+            if bucket is None:
+                if len(shard.buckets) >= self._max_keys_per_shard:
+                    del shard.buckets[next(iter(shard.buckets))]
+                    self.evictions += 1
+                shard.buckets[key] = [capacity - 1, now, rate, capacity]
+                return 0.0
+
+            tokens = bucket[0] + (now - bucket[1]) * rate
+            if tokens > capacity:
+                tokens = capacity
+            bucket[1] = now
+            if tokens >= 1:
+                bucket[0] = tokens - 1
+                return 0.0
+            bucket[0] = tokens
+            return (1 - tokens) / rate
+
+    def _sweep(self, shard: _Shard, now: float) -> None:
+        shard.next_sweep = now + _SWEEP_INTERVAL_SECONDS
+        full = [
+            key for key, (tokens, updated_at, rate, capacity) in shard.buckets.items()
+            if tokens + (now - updated_at) * rate >= capacity
+        ]
+        for key in full:
+            del shard.buckets[key]
+
+    def __len__(self) -> int:
+        return sum(len(shard.buckets) for shard in self._shards)
+
+
+class RateLimiter:
+    """라우트별 정책과 토큰 버킷 테이블을 묶은 요청 빈도 제한기."""
+
+    def __init__(self, policies: Dict[str, dict], shards: int, max_keys: int) -> None:
+        self.policies = [RateLimitPolicy.from_config(name, spec) for name, spec in policies.items()]
+        self.table = TokenBucketTable(shards=shards, max_keys=max_keys)
+        self._routes: Dict[Tuple[str, str], Optional[RateLimitPolicy]] = {}
+        self.rejected = 0
+
+    def match(self, method: str, path: str) -> Optional[RateLimitPolicy]:
+        route = (method, path)
+        try:
+            return self._routes[route]
+        except KeyError:
+            pass
+        policy = next((policy for policy in self.policies if policy.matches(method, path)), None)
+        if len(self._routes) >= _ROUTE_CACHE_MAX_ENTRIES:
+            self._routes.clear()
+        self._routes[route] = policy
+        return policy
+
+    def check(self, policy: RateLimitPolicy, subject: str) -> float:
+        """허용되면 0, 거절되면 Retry-After로 보낼 초를 반환합니다."""
+        retry_after = self.table.take((policy.name, subject), policy.rate, policy.capacity)
+        if retry_after:
+            self.rejected += 1
+            metrics.increment("rate_limit_rejected_total", {"policy": policy.name})
+        return retry_after
+
+    def stats(self) -> dict:
+        return {
+            "policies": len(self.policies),
+            "buckets": len(self.table),
+            "evictions": self.table.evictions,
+            "rejected": self.rejected,
+        }
+
+
+class RateLimitMiddleware:
+    """
+    요청 빈도 제한 ASGI 미들웨어. (BaseHTTPMiddleware를 쓰지 않아 요청당 오버헤드가 작습니다.)
+
+    - 요청 주체: Bearer 토큰이 있고 identify(token)가 uid를 돌려주면 "uid:<uid>", 아니면 "ip:<클라이언트 IP>"
+    - 한도를 넘으면 RateLimitExceededError를 custom_exception_handler로 변환해
+      429 + Retry-After 응답을 보내고 라우트는 실행하지 않습니다.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        limiter: RateLimiter,
+        identify: Optional[Callable[[str], Optional[str]]] = None,
+        trust_forwarded_for: bool = False,
+    ) -> None:
+        self.app = app
+        self.limiter = limiter
+        self.identify = identify
+        self.trust_forwarded_for = trust_forwarded_for
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        policy = self.limiter.match(scope["method"], scope["path"])
+        if policy is None:
+            await self.app(scope, receive, send)
+            return
+
+        retry_after = self.limiter.check(policy, self._subject(scope))
+        if not retry_after:
+            await self.app(scope, receive, send)
+            return
+
+        response = await custom_exception_handler(Request(scope), RateLimitExceededError(retry_after))
+        await response(scope, receive, send)
+
+    def _subject(self, scope: Scope) -> str:
+        forwarded_for = None
+        for name, value in scope["headers"]:
+            if name == b"authorization" and self.identify is not None:
+                scheme, _, token = value.decode("latin-1").partition(" ")
+                if scheme.lower() == "bearer" and token:
+                    uid = self.identify(token)
+                    if uid:
+                        return f"uid:{uid}"
+            elif name == b"x-forwarded-for" and self.trust_forwarded_for:
+                forwarded_for = value.decode("latin-1").split(",")[0].strip()
+
+        if forwarded_for:
+            return f"ip:{forwarded_for}"
+        client = scope.get("client")
+        return f"ip:{client[0] if client else 'unknown'}"
+
+
+__all__ = ["RateLimitMiddleware", "RateLimitPolicy", "RateLimiter", "TokenBucketTable"]
@@ -0,0 +1,88 @@
+import random
+import time
+from collections import deque
+from typing import Deque, Optional
+
+
+class CircuitBreaker:
+    """
+    연속 실패가 임계값에 도달하면 일정 시간 동안 호출을 즉시 차단하는 서킷 브레이커.
+
+    - closed: 정상. 모든 호출 허용
+    - open: 차단. recovery_seconds가 지나면 half_open으로 전환
+    - half_open: 시험 호출 1건만 허용. 성공하면 closed, 실패하면 다시 open
+      시험 호출이 결과 없이 끝나면(429, 취소 등) release_probe()로 다음 요청에 시험 기회를 넘깁니다.
+    """
+
+    def __init__(self, failure_threshold: int, recovery_seconds: float) -> None:
+        self.failure_threshold = max(1, failure_threshold)
+        self.recovery_seconds = recovery_seconds
+        self._state = "closed"
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+    @property
+    def state(self) -> str:
+        if self._state == "open" and time.monotonic() - self._opened_at >= self.recovery_seconds:
+            return "half_open"
+        return self._state
+
+    def allow_request(self) -> bool:
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half_open" and not self._probe_in_flight:
+            self._state = "half_open"
+            self._probe_in_flight = True
+            return True
+        return False
+
+    def release_probe(self) -> None:
+        """
+        시험 호출이 성공/실패를 기록하지 않고 끝났을 때 호출합니다. (결과를 기록했다면 아무 일도 하지 않습니다.)
+        half_open 상태는 유지되므로 다음 요청이 다시 시험 호출이 됩니다.
+        """
+        self._probe_in_flight = False
+
+    def record_success(self) -> None:
+        self._state = "closed"
+        self._failures = 0
+        self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        self._probe_in_flight = False
+        self._failures += 1
+        if self._state == "half_open" or self._failures >= self.failure_threshold:
+            self._state = "open"
+            self._opened_at = time.monotonic()
+
+
+class LatencyTracker:
+    """최근 성공 호출의 지연 시간(초)을 보관하고 백분위수를 계산합니다."""
+
+    def __init__(self, window: int = 200, min_samples: int = 20) -> None:
+        self._samples: Deque[float] = deque(maxlen=window)
+        self.min_samples = min_samples
+
+    def record(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def percentile(self, percentile: float) -> Optional[float]:
+        """표본이 min_samples보다 적으면 None을 반환합니다."""
+        if len(self._samples) < self.min_samples:
+            return None
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, int(len(ordered) * percentile / 100))
+        return ordered[index]
+
+
+def backoff_delay(attempt: int, base_seconds: float, max_seconds: float = 5.0) -> float:
+    """
+    지수 백오프에 Full Jitter를 적용한 재시도 대기 시간을 반환합니다.
+    (attempt는 0부터 시작)
+    """
+    return random.uniform(0, min(max_seconds, base_seconds * (2 ** attempt)))
+
+
+__all__ = ["CircuitBreaker", "LatencyTracker", "backoff_delay"]
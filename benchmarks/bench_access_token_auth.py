@@ -0,0 +1,124 @@
+"""
+요청당 인증 오버헤드 마이크로벤치마크. (우리 API Access Token)
+
+- jose       : 요청마다 decode_access_token(python-jose)으로 서명/클레임 검증 (캐시 없는 경우)
+- verifier   : AccessTokenVerifier, 처음 보는 토큰 (exp 확인 후 서명 검증, 캐시 기록)
+- cached     : AccessTokenVerifier, 이미 검증한 토큰 (해시 캐시 적중 + 폐기 목록 확인)
+- expired    : AccessTokenVerifier, 만료된 토큰 (서명 검증 없이 거절)
+- dependency : cached + 프로필 캐시 적중 (get_current_user 경로에서 Firestore를 제외한 비용)
+- endpoint   : get_current_token_claims 의존성을 쓰는 엔드포인트를 ASGI로 호출 (FastAPI 의존성 실행 비용 포함)
+
+순차 호출의 지연(p50/p99)과, 한 코어에서 낼 수 있는 초당 검증 수를 측정합니다.
+
+실행: python -m benchmarks.bench_access_token_auth --tokens 5000
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import time
+from datetime import timedelta
+
+import httpx
+from fastapi import Depends, FastAPI
+
+os.environ.setdefault("API_SECRET_KEY", "bench-secret")
+
+from app.core.exceptions.exceptions import TokenExpiredError  # noqa: E402
+from app.core.security import create_access_token, decode_access_token  # noqa: E402
+from app.feature.auth.access_token_verifier import AccessTokenVerifier  # noqa: E402
+from app.feature.auth.auth_dependencies import get_current_token_claims  # noqa: E402
+from app.feature.auth.auth_schemas import UserInDB  # noqa: E402
+from app.feature.auth.user_profile_cache import UserProfileCache  # noqa: E402
+
+
+def measure(name: str, verify, tokens: list) -> None:
+    latencies = []
+    for token in tokens:
+        started = time.perf_counter()
+        verify(token)
+        latencies.append((time.perf_counter() - started) * 1e6)
+    latencies.sort()
+
+    total = sum(latencies) / 1e6
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    print(
+        f"{name:<11} p50={statistics.median(latencies):7.2f}us p99={p99:7.2f}us "
+        f"rps(1 core)={len(tokens) / total:10.0f}/s"
+    )
+
+
+def measure_endpoint(tokens: list) -> None:
+    """인증 의존성만 있는 엔드포인트를 순차 호출합니다. (캐시 적중 토큰, 네트워크 없이 ASGI 직접 호출)"""
+    app = FastAPI()
+
+    @app.get("/claims")
+    async def read_claims(claims: dict = Depends(get_current_token_claims)) -> dict:
+        return {"sub": claims["sub"]}
+
+    async def run() -> list:
+        latencies = []
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            for token in tokens:
+                started = time.perf_counter()
+                response = await client.get("/claims", headers={"Authorization": f"Bearer {token}"})
+                latencies.append((time.perf_counter() - started) * 1e6)
+                response.raise_for_status()
+        return latencies
+
+    latencies = sorted(asyncio.run(run()))
+    total = sum(latencies) / 1e6
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    print(
+        f"{'endpoint':<11} p50={statistics.median(latencies):7.2f}us p99={p99:7.2f}us "
+        f"rps(1 core)={len(tokens) / total:10.0f}/s"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tokens", type=int, default=5000)
+    args = parser.parse_args()
+
+    tokens = [create_access_token({"sub": f"user-{index}"}) for index in range(args.tokens)]
+    expired = [
+        create_access_token({"sub": f"user-{index}"}, expires_delta=timedelta(seconds=-1))
+        for index in range(args.tokens)
+    ]
+
+    measure("jose", decode_access_token, tokens)
+
+    verifier = AccessTokenVerifier(cache_max_entries=args.tokens)
+    measure("verifier", verifier.verify, tokens)
+    measure("cached", verifier.verify, tokens)
+
+    def verify_expired(token: str) -> None:
+        try:
+            verifier.verify(token)
+        except TokenExpiredError:
+            pass
+
+    measure("expired", verify_expired, expired)
+
+    profiles = UserProfileCache(max_entries=args.tokens)
+    for index in range(args.tokens):
+        profiles.put(UserInDB(
+            uid=f"user-{index}",
+            email=None,
+            display_name=None,
+            photo_url=None,
+            provider_id="google.com",
+            created_at="2025-01-01T00:00:00+00:00",
+            last_login_at="2025-01-01T00:00:00+00:00",
+        ))
+
+    def dependency(token: str) -> None:
+        profiles.get(verifier.verify(token)["sub"])
+
+    measure("dependency", dependency, tokens)
+    measure_endpoint(tokens)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+BCBP 파서 처리량 벤치마크.
+
+무작위 합성 BCBP 문자열(1~4구간)을 생성해 parse_bcbp의 처리량과 건당 지연을 측정합니다.
+
+실행: python -m benchmarks.bench_bcbp_parser --count 200000
+"""
+import argparse
+import random
+import string
+import time
+from datetime import date
+
+from app.feature.LLM.bcbp_parser import parse_bcbp
+
+_AIRPORTS = ["ICN", "GMP", "JFK", "LAX", "NRT", "HND", "CDG", "FRA", "SFO", "SIN", "HKG", "YUL"]
+_CARRIERS = ["KE", "OZ", "DL", "AA", "JL", "NH", "AF", "LH", "UA", "SQ", "CX", "AC"]
+_COMPARTMENTS = "FJCWYMBK"
+
+
+def make_bcbp(rng: random.Random) -> str:
+    legs = rng.randint(1, 4)
+    name = f"{rng.choice(['KIM', 'LEE', 'PARK', 'CHOI'])}/{rng.choice(['MINJI', 'JUNHO', 'SEOYEON'])}"
+    parts = [f"M{legs}{name:<20}E"]
+    for leg in range(legs):
+        # 첫 구간에는 조건부 항목이 있는 것처럼 가변 영역을 붙입니다.
+        variable = ">6" + "".join(rng.choices(string.ascii_uppercase, k=rng.randint(0, 20))) if leg == 0 else ""
+        origin, destination = rng.sample(_AIRPORTS, 2)
+        parts.append(
+            "".join(rng.choices(string.ascii_uppercase + string.digits, k=6)) + " "
+            + origin + destination
+            + f"{rng.choice(_CARRIERS):<3}"
+            + f"{rng.randint(1, 9999):04d} "
+            + f"{rng.randint(1, 365):03d}"
+            + rng.choice(_COMPARTMENTS)
+            + f"{rng.randint(1, 60):03d}{rng.choice('ABCDEFGHJK')}"
+            + f"{rng.randint(1, 400):04d} "
+            + "1"
+            + f"{len(variable):02X}"
+            + variable
+        )
+    return "".join(parts)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=200_000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    corpus = [make_bcbp(rng) for _ in range(args.count)]
+    reference = date.today()
+
+    started = time.perf_counter()
+    legs = 0
+    for data in corpus:
+        legs += len(parse_bcbp(data, reference).legs)
+    elapsed = time.perf_counter() - started
+
+    print(f"parsed passes : {args.count:,} ({legs:,} legs)")
+    print(f"elapsed       : {elapsed:.3f} s")
+    print(f"throughput    : {args.count / elapsed:,.0f} passes/s")
+    print(f"per pass      : {elapsed / args.count * 1e6:.2f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""
+Firebase ID 토큰 검증 마이크로벤치마크.
+
+테스트용 RSA 키/자체 서명 인증서로 Firebase 형식의 ID 토큰을 만들어 세 경로를 비교합니다.
+
+- threadpool : 기존 경로와 같은 방식. 스레드 풀로 넘긴 뒤 매 호출마다 x509 인증서를 파싱해 검증
+               (Admin SDK도 호출마다 인증서로 검증기를 만듭니다. 인증서 다운로드 비용은 제외)
+- native     : FirebaseTokenVerifier, 서로 다른 토큰 (서명 검증 수행)
+- cached     : FirebaseTokenVerifier, 이미 검증한 토큰 (해시 캐시 적중)
+
+순차 호출의 지연(p50/p99)과 동시 호출(--concurrency) 시 처리량을 측정합니다.
+
+실행: python -m benchmarks.bench_firebase_token_verify --tokens 2000 --concurrency 64
+"""
+import argparse
+import asyncio
+import datetime
+import statistics
+import time
+
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.x509.oid import NameOID
+from fastapi.concurrency import run_in_threadpool
+from jose import jwt
+
+from app.feature.auth.firebase_token_verifier import FirebaseTokenVerifier
+
+PROJECT_ID = "bimo-bench"
+KID = "bench-key"
+
+
+def make_key_and_cert():
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "securetoken.bench")])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(days=1))
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .sign(key, hashes.SHA256())
+    )
+    private_pem = key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode()
+    return private_pem, cert.public_bytes(serialization.Encoding.PEM).decode()
+
+
+def make_tokens(private_pem: str, count: int) -> list:
+    now = int(time.time())
+    return [
+        jwt.encode(
+            {
+                "iss": f"https://securetoken.google.com/{PROJECT_ID}",
+                "aud": PROJECT_ID,
+                "sub": f"user-{index}",
+                "iat": now - 10,
+                "exp": now + 3600,
+                "email": f"user{index}@example.com",
+                "firebase": {"sign_in_provider": "google.com"},
+            },
+            private_pem,
+            algorithm="RS256",
+            headers={"kid": KID},
+        )
+        for index in range(count)
+    ]
+
+
+def verify_with_certificate(token: str, certificates: dict) -> dict:
+    """기존 경로 근사: 호출마다 인증서를 파싱해 서명/클레임을 검증합니다."""
+    kid = jwt.get_unverified_header(token)["kid"]
+    claims = jwt.decode(
+        token,
+        certificates[kid],
+        algorithms=["RS256"],
+        audience=PROJECT_ID,
+        issuer=f"https://securetoken.google.com/{PROJECT_ID}",
+        options={"verify_at_hash": False},
+    )
+    claims["uid"] = claims["sub"]
+    return claims
+
+
+async def measure(name: str, verify, tokens: list, concurrency: int) -> None:
+    latencies = []
+    for token in tokens:
+        started = time.perf_counter()
+        await verify(token)
+        latencies.append((time.perf_counter() - started) * 1e6)
+    latencies.sort()
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def limited(token: str) -> None:
+        async with semaphore:
+            await verify(token)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(limited(token) for token in tokens))
+    throughput = len(tokens) / (time.perf_counter() - started)
+
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    print(
+        f"{name:<11} p50={statistics.median(latencies):8.1f}us p99={p99:8.1f}us "
+        f"throughput(c={concurrency})={throughput:9.0f}/s"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tokens", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    args = parser.parse_args()
+
+    private_pem, cert_pem = make_key_and_cert()
+    certificates = {KID: cert_pem}
+    tokens = make_tokens(private_pem, args.tokens)
+
+    async def threadpool_verify(token: str) -> dict:
+        return await run_in_threadpool(verify_with_certificate, token, certificates)
+
+    await measure("threadpool", threadpool_verify, tokens, args.concurrency)
+
+    # 순차 측정과 동시 측정이 같은 토큰을 쓰므로, native는 검증 결과 캐시를 끈 검증기를 사용합니다.
+    native = FirebaseTokenVerifier(enabled=True, project_id=PROJECT_ID, cache_ttl_seconds=0)
+    native.load_certificates(certificates, max_age_seconds=3600)
+    await measure("native", native.verify, tokens, args.concurrency)
+
+    cached = FirebaseTokenVerifier(enabled=True, project_id=PROJECT_ID)
+    cached.load_certificates(certificates, max_age_seconds=3600)
+    for token in tokens:
+        await cached.verify(token)
+    await measure("cached", cached.verify, tokens, args.concurrency)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
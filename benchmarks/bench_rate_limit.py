@@ -0,0 +1,111 @@
+"""
+요청 빈도 제한(RateLimitMiddleware) 요청당 오버헤드 마이크로벤치마크.
+
+빈 ASGI 앱을 직접 호출해(서버/네트워크 제외) 미들웨어가 더하는 시간만 측정합니다.
+
+- table      : TokenBucketTable.take 단독 (키 --keys개를 돌아가며 사용)
+- bare       : 미들웨어 없이 빈 앱 호출 (기준값)
+- unmatched  : 정책이 없는 경로 (매칭 캐시 조회만)
+- ip         : 정책 경로, 클라이언트 IP 기준 버킷
+- bearer     : 정책 경로, Bearer 토큰의 uid 기준 버킷 (토큰 검증 캐시 적중)
+- rejected   : 한도를 넘은 요청 (429 + Retry-After 응답 생성 포함)
+
+실행: python -m benchmarks.bench_rate_limit --requests 200000 --keys 10000
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import time
+
+os.environ.setdefault("API_SECRET_KEY", "bench-secret")
+
+from app.core.security import create_access_token  # noqa: E402
+from app.feature.auth.access_token_verifier import AccessTokenVerifier  # noqa: E402
+from app.shared.rate_limit import RateLimiter, RateLimitMiddleware, TokenBucketTable  # noqa: E402
+
+POLICIES = {
+    "POST /llm/chat*": {"requests": 1_000_000, "period_seconds": 1, "burst": 1_000_000},
+    "POST /limited": {"requests": 1, "period_seconds": 3600, "burst": 1},
+}
+
+
+async def empty_app(scope, receive, send) -> None:
+    return None
+
+
+async def receive():
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def send(message) -> None:
+    return None
+
+
+def make_scope(path: str, index: int, token: str = "") -> dict:
+    headers = [(b"host", b"localhost"), (b"content-type", b"application/json")]
+    if token:
+        headers.append((b"authorization", f"Bearer {token}".encode()))
+    return {
+        "type": "http",
+        "method": "POST",
+        "path": path,
+        "headers": headers,
+        "client": (f"10.0.{index // 256 % 256}.{index % 256}", 50000),
+    }
+
+
+async def measure_app(name: str, app, scopes: list, requests: int, baseline: float = 0.0) -> float:
+    samples = []
+    # 1000회씩 묶어 측정해 타이머 오버헤드를 줄입니다.
+    for start in range(0, requests, 1000):
+        started = time.perf_counter()
+        for index in range(start, min(start + 1000, requests)):
+            await app(scopes[index % len(scopes)], receive, send)
+        samples.append((time.perf_counter() - started) / 1000 * 1e6)
+    median = statistics.median(samples)
+    overhead = f" (+{median - baseline:5.2f}us)" if baseline else ""
+    print(f"{name:<10} {median:6.2f}us/request{overhead}")
+    return median
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=200_000)
+    parser.add_argument("--keys", type=int, default=10_000)
+    args = parser.parse_args()
+
+    table = TokenBucketTable(shards=16, max_keys=100_000)
+    keys = [("bench", f"ip:{index}") for index in range(args.keys)]
+    started = time.perf_counter()
+    for index in range(args.requests):
+        table.take(keys[index % len(keys)], 1_000_000.0, 1_000_000.0)
+    print(f"{'table':<10} {(time.perf_counter() - started) / args.requests * 1e6:6.2f}us/take")
+
+    verifier = AccessTokenVerifier(cache_max_entries=args.keys)
+    tokens = [create_access_token({"sub": f"user-{index}"}) for index in range(min(args.keys, 2000))]
+    for token in tokens:
+        verifier.verify(token)
+
+    def middleware(limiter: RateLimiter) -> RateLimitMiddleware:
+        return RateLimitMiddleware(empty_app, limiter=limiter, identify=verifier.subject_or_none)
+
+    limiter = RateLimiter(POLICIES, shards=16, max_keys=100_000)
+    ip_scopes = [make_scope("/llm/chat", index) for index in range(args.keys)]
+    bearer_scopes = [make_scope("/llm/chat", index, token) for index, token in enumerate(tokens)]
+    unmatched_scopes = [make_scope("/health/ready", index) for index in range(args.keys)]
+
+    baseline = await measure_app("bare", empty_app, ip_scopes, args.requests)
+    await measure_app("unmatched", middleware(limiter), unmatched_scopes, args.requests, baseline)
+    await measure_app("ip", middleware(limiter), ip_scopes, args.requests, baseline)
+    await measure_app("bearer", middleware(limiter), bearer_scopes, args.requests, baseline)
+
+    rejected_limiter = RateLimiter(POLICIES, shards=16, max_keys=100_000)
+    rejected_scopes = [make_scope("/limited", 0)]
+    await middleware(rejected_limiter)(rejected_scopes[0], receive, send)
+    await measure_app("rejected", middleware(rejected_limiter), rejected_scopes, args.requests // 10, baseline)
+    assert rejected_limiter.rejected >= args.requests // 10, "한도를 넘은 요청이 거절되지 않았습니다."
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,160 @@
+"""
+유사 프롬프트(SimHash) 캐시 벤치마크.
+
+합성 질문 코퍼스(기본 100만 건)를 캐시에 넣은 뒤, 다음 다섯 종류의 질의로
+적중률, 오탐률(다른 질문의 답을 돌려준 비율), 조회 지연(p50/p99)을 측정합니다.
+
+- reworded   : 같은 질문을 다르게 쓴 것. 주제 어순을 섞고, 절 순서와 문형(템플릿)을 바꾸고,
+               편명 표기를 바꿉니다. (원래 질문의 답으로 적중해야 함)
+- extra_word : reworded에 내용어 하나를 더한 질문 (임계값에 따라 적중/미스, 적중하면 원래 질문의 답이어야 함)
+- topic_swap : 주제 하나를 다른 주제로 바꾼 질문 (미스여야 함)
+- comparison : 저장된 비교 질문의 두 대상을 뒤바꾼 질문 (미스여야 함)
+- novel      : 코퍼스에 없는 질문 (미스여야 함)
+
+실행: python -m benchmarks.bench_semantic_cache --entries 1000000 --queries 20000
+"""
+import argparse
+import random
+import statistics
+import time
+
+from app.feature.LLM.semantic_cache import SemanticCache, build_scope, normalize_tokens, order_sensitive_key
+
+_AIRLINES = ["KE", "OZ", "DL", "AA", "JL", "NH", "AF", "LH", "UA", "SQ", "CX", "TG", "EK", "QR", "BA"]
+_TOPICS = [
+    "business", "economy", "first", "premium", "seat", "meal", "lounge", "wifi", "legroom",
+    "service", "crew", "review", "vegetarian", "kosher", "baggage", "upgrade", "entertainment",
+    "blanket", "pillow", "bassinet", "window", "aisle", "recline", "noise", "jetlag", "sleep",
+    "breakfast", "dinner", "wine", "snack", "amenity", "kit", "toilet", "boarding", "priority",
+]
+# 저장되는 원래 질문 형식
+_CANONICAL_TEMPLATE = "{flight} {topics}"
+# 같은 질문을 다르게 쓰는 문형 (절 순서/어순/기능어가 다름)
+_REWORD_TEMPLATES = [
+    "{topics} on {flight}",
+    "what about the {topics} on {flight}?",
+    "{flight}: tell me about {topics}, please",
+    "can you give me the {topics} for {flight}",
+    "{first} on {flight} and the {rest}",
+    "about {flight} - {rest}, {first}?",
+]
+_EXTRA_WORDS = ["really", "honest", "latest", "overall", "quick", "detailed"]
+_COMPARISON_TEMPLATE = "is the {first} better than the {second} on {flight}?"
+
+
+def make_question(rng: random.Random) -> tuple:
+    airline = rng.choice(_AIRLINES)
+    number = rng.randint(1, 999)
+    topics = rng.sample(_TOPICS, rng.randint(3, 6))
+    return airline, number, topics
+
+
+def render(question: tuple) -> str:
+    airline, number, topics = question
+    return _CANONICAL_TEMPLATE.format(flight=f"{airline}{number:03d}", topics=" ".join(topics))
+
+
+def reword(question: tuple, rng: random.Random) -> str:
+    airline, number, topics = question
+    words = rng.sample(topics, len(topics))
+    flight = rng.choice([f"{airline} {number:03d}", f"{airline.lower()}{number}", f"{airline} {number}"])
+    return rng.choice(_REWORD_TEMPLATES).format(
+        flight=flight,
+        topics=" ".join(words),
+        first=words[0],
+        rest=" ".join(words[1:]),
+    )
+
+
+def swap_topic(question: tuple, rng: random.Random) -> tuple:
+    airline, number, topics = question
+    replacement = rng.choice([topic for topic in _TOPICS if topic not in topics])
+    swapped = list(topics)
+    swapped[rng.randrange(len(swapped))] = replacement
+    return airline, number, swapped
+
+
+def render_comparison(question: tuple, reverse: bool = False) -> str:
+    airline, number, topics = question
+    first, second = (topics[1], topics[0]) if reverse else (topics[0], topics[1])
+    return _COMPARISON_TEMPLATE.format(first=first, second=second, flight=f"{airline}{number:03d}")
+
+
+def scope_for(text: str) -> int:
+    # 최악의 경우: 모든 항목이 같은 모델/인스트럭션/항공편 scope에 있고, 비교 질문의 어순만 구분됩니다.
+    return build_scope("bench-model", "", [], order_key=order_sensitive_key(text))
+
+
+def measure(cache: SemanticCache, queries: list) -> tuple:
+    """queries: (질문, 기대하는 답 또는 None) 목록 -> (적중률, 오탐률, p50 µs, p99 µs)"""
+    latencies = []
+    hits = false_hits = 0
+    for text, expected in queries:
+        started = time.perf_counter()
+        answer = cache.lookup(scope_for(text), normalize_tokens(text))
+        latencies.append((time.perf_counter() - started) * 1e6)
+        if answer is None:
+            continue
+        if answer == expected:
+            hits += 1
+        else:
+            false_hits += 1
+    latencies.sort()
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    return hits / len(queries), false_hits / len(queries), statistics.median(latencies), p99
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entries", type=int, default=1_000_000)
+    parser.add_argument("--queries", type=int, default=20_000)
+    parser.add_argument("--max-distance", type=int, default=3)
+    parser.add_argument("--comparison-ratio", type=float, default=0.05, help="코퍼스 중 비교 질문의 비율")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    cache = SemanticCache(
+        enabled=True,
+        max_distance=args.max_distance,
+        max_entries=args.entries,
+        ttl_seconds=3600,
+    )
+
+    stored, comparisons = [], []
+    started = time.perf_counter()
+    for index in range(args.entries):
+        question = make_question(rng)
+        answer = f"answer-{index}"
+        if rng.random() < args.comparison_ratio:
+            text = render_comparison(question)
+            if len(comparisons) < args.queries:
+                comparisons.append((question, answer))
+        else:
+            text = render(question)
+            if len(stored) < args.queries:
+                stored.append((question, answer))
+        cache.store(scope_for(text), normalize_tokens(text), answer)
+    insert_seconds = time.perf_counter() - started
+
+    workloads = (
+        ("reworded", [(reword(question, rng), answer) for question, answer in stored]),
+        ("extra_word", [
+            (f"{reword(question, rng)} {rng.choice(_EXTRA_WORDS)}", answer) for question, answer in stored
+        ]),
+        ("topic_swap", [(render(swap_topic(question, rng)), None) for question, _ in stored]),
+        ("comparison", [(render_comparison(question, reverse=True), None) for question, _ in comparisons]),
+        ("novel", [(f"{render(make_question(rng))} zeppelin", None) for _ in range(args.queries)]),
+    )
+
+    print(f"entries        : {len(cache):,} (insert {insert_seconds:.1f} s, "
+          f"{insert_seconds / args.entries * 1e6:.1f} µs/entry)")
+    print(f"max distance   : {args.max_distance} bits")
+    for name, queries in workloads:
+        hit_rate, false_hit_rate, p50, p99 = measure(cache, queries)
+        print(f"{name:<15}: hit rate {hit_rate * 100:5.1f}%  false-hit rate {false_hit_rate * 100:5.2f}%  "
+              f"lookup p50 {p50:6.1f} µs  p99 {p99:6.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+서버 시작 시간 벤치마크.
+
+import 캐시의 영향을 받지 않도록 매 실행을 새 인터프리터(subprocess)에서 측정합니다.
+
+- import   : `import app.main` 소요 시간, import 직후 이미 로드된 무거운 SDK 목록,
+             -X importtime 기준 패키지별 누적 import 시간
+- ready    : lifespan 시작 단계 전체 시간(time-to-ready)과
+             컴포넌트별(firebase, gemini) 준비 시간 (/health/ready와 같은 readiness 상태에서 읽음)
+
+서비스 키/API 키가 없는 환경에서는 해당 컴포넌트가 failed로 표시되고, 실패까지 걸린 시간이 보고됩니다.
+
+실행: python -m benchmarks.bench_startup --runs 5
+"""
+import argparse
+import asyncio
+import importlib
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+# import 시점에 로드되지 않아야 하는(첫 사용 또는 lifespan에서 로드되는) SDK
+HEAVY_MODULES = [
+    "firebase_admin",
+    "google.cloud.firestore",
+    "google.api_core",
+    "google.generativeai",
+    "grpc",
+]
+# -X importtime 결과에서 보고할 패키지
+REPORTED_PACKAGES = HEAVY_MODULES + ["fastapi", "pydantic", "httpx", "jose", "passlib", "PIL", "app.main"]
+
+
+def run_child() -> None:
+    """새 인터프리터에서 import와 lifespan 시작을 측정하고 결과를 JSON 한 줄로 출력합니다."""
+    started = time.perf_counter()
+    main_module = importlib.import_module("app.main")
+    import_ms = (time.perf_counter() - started) * 1000
+    loaded_at_import = [name for name in HEAVY_MODULES if name in sys.modules]
+
+    from app.core.health import readiness_snapshot
+
+    async def start() -> dict:
+        started = time.perf_counter()
+        error = None
+        ready_ms = None
+        try:
+            async with main_module.lifespan(main_module.app):
+                ready_ms = (time.perf_counter() - started) * 1000
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            ready_ms = (time.perf_counter() - started) * 1000
+        _, components = readiness_snapshot()
+        return {"ready_ms": ready_ms, "error": error, "components": components}
+
+    result = {"import_ms": import_ms, "loaded_at_import": loaded_at_import, **asyncio.run(start())}
+    print(json.dumps(result, ensure_ascii=False))
+
+
+def spawn_child() -> dict:
+    completed = subprocess.run(
+        [sys.executable, "-m", "benchmarks.bench_startup", "--child"],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"},
+    )
+    lines = completed.stdout.strip().splitlines()
+    if completed.returncode != 0 or not lines:
+        raise RuntimeError(f"측정 프로세스 실패:\n{completed.stderr}")
+    return json.loads(lines[-1])
+
+
+def measure_import_breakdown() -> dict:
+    """-X importtime 출력에서 패키지별 누적 import 시간(ms)을 읽습니다."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app.main"],
+        capture_output=True,
+        text=True,
+    )
+    cumulative = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative_us, name = (part.strip() for part in line[len("import time:"):].split("|"))
+        if name in REPORTED_PACKAGES and name not in cumulative:
+            cumulative[name] = int(cumulative_us) / 1000
+    return cumulative
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child()
+        return
+
+    results = [spawn_child() for _ in range(args.runs)]
+    last = results[-1]
+
+    print(f"import app.main   p50 {statistics.median(r['import_ms'] for r in results):8.1f}ms")
+    print(f"  import 시점에 로드된 SDK: {', '.join(last['loaded_at_import']) or '없음'}")
+    for name, elapsed_ms in sorted(measure_import_breakdown().items(), key=lambda item: -item[1]):
+        print(f"  {name:<24} {elapsed_ms:8.1f}ms (cumulative)")
+
+    print(f"time-to-ready     p50 {statistics.median(r['ready_ms'] for r in results):8.1f}ms")
+    if last["error"]:
+        print(f"  시작 중단: {last['error']}")
+    for name in sorted(last["components"]):
+        samples = [r["components"][name].get("elapsed_ms") for r in results if name in r["components"]]
+        samples = [sample for sample in samples if sample is not None]
+        state = last["components"][name]
+        elapsed = f"{statistics.median(samples):8.1f}ms" if samples else "       -  "
+        detail = f" ({state['error']})" if state.get("error") else ""
+        print(f"  {name:<24} {elapsed} {state['status']}{detail}")
+
+
+if __name__ == "__main__":
+    main()
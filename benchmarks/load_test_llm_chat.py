@@ -0,0 +1,143 @@
+"""
+/llm/chat 부하 테스트.
+
+동시성 단계별로 요청을 보내 처리량(req/s)과 지연(p50/p95/p99)을 측정합니다.
+Gemini 할당량을 쓰지 않도록 LLM_BACKEND=replay로 기록된 응답을 재생하는 것을 전제로 합니다.
+
+1) 기록: 실제 서버를 LLM_BACKEND=record로 띄우고 같은 --seed/--distinct로 한 번 실행
+   LLM_BACKEND=record LLM_CACHE_ENABLED=false uvicorn app.main:app
+   python -m benchmarks.load_test_llm_chat --url http://localhost:8000 --concurrency 4 --requests 200
+2) 재생: --url 없이 실행하면 LLM 라우터만 올린 앱을 프로세스 안에서 호출합니다. (기본 LLM_BACKEND=replay)
+   LLM_CACHE_ENABLED=false LLM_SEMANTIC_CACHE_ENABLED=false \\
+   python -m benchmarks.load_test_llm_chat --concurrency 1,8,32,64 --requests 2000
+
+응답 캐시가 켜져 있으면 반복 프롬프트가 캐시에서 처리되므로, 백엔드 처리량을 보려면 캐시를 끄세요.
+"""
+import argparse
+import asyncio
+import os
+import random
+import time
+from collections import Counter
+
+import httpx
+
+_AIRLINES = ["KE", "OZ", "DL", "AA", "JL", "NH", "AF", "LH", "UA", "SQ", "CX", "TG"]
+_QUESTIONS = [
+    "비즈니스석 좌석은 편한가요?",
+    "기내식 평가는 어떤가요?",
+    "이코노미석 레그룸이 넓은 편인가요?",
+    "승무원 서비스 후기를 요약해 주세요.",
+    "장거리 비행에서 잠을 잘 수 있을까요?",
+    "기내 와이파이 품질은 어떤가요?",
+]
+
+
+def make_payloads(count: int, seed: int) -> list:
+    rng = random.Random(seed)
+    payloads = []
+    for _ in range(count):
+        airline = rng.choice(_AIRLINES)
+        payloads.append({
+            "prompt": f"{airline}{rng.randint(1, 999):03d} {rng.choice(_QUESTIONS)}",
+            "flight_info": {"airline": airline},
+        })
+    return payloads
+
+
+def build_in_process_client(timeout: float) -> httpx.AsyncClient:
+    # 설정은 import 시점에 읽히므로 앱 모듈보다 먼저 지정합니다.
+    os.environ.setdefault("LLM_BACKEND", "replay")
+
+    from fastapi import FastAPI
+
+    from app.core.exceptions.exception_handlers import custom_exception_handler
+    from app.core.exceptions.exceptions import CustomException
+    from app.feature.LLM import llm_router
+
+    app = FastAPI()
+    app.add_exception_handler(CustomException, custom_exception_handler)
+    app.include_router(llm_router.router)
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url="http://load-test",
+        timeout=timeout,
+    )
+
+
+def percentile(ordered: list, value: float) -> float:
+    return ordered[min(len(ordered) - 1, int(len(ordered) * value / 100))]
+
+
+async def run_level(client: httpx.AsyncClient, payloads: list, concurrency: int, total: int) -> dict:
+    latencies = []
+    statuses: Counter = Counter()
+    next_index = 0
+
+    async def worker() -> None:
+        nonlocal next_index
+        while next_index < total:
+            payload = payloads[next_index % len(payloads)]
+            next_index += 1
+            started = time.perf_counter()
+            try:
+                response = await client.post("/llm/chat", json=payload)
+                status = str(response.status_code)
+            except httpx.HTTPError as exc:
+                status = type(exc).__name__
+            latencies.append((time.perf_counter() - started) * 1000)
+            statuses[status] += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "concurrency": concurrency,
+        "requests": len(latencies),
+        "throughput": len(latencies) / elapsed,
+        "p50": percentile(latencies, 50),
+        "p95": percentile(latencies, 95),
+        "p99": percentile(latencies, 99),
+        "max": latencies[-1],
+        "statuses": dict(statuses),
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", help="대상 서버 주소. 생략하면 프로세스 안에서 LLM 라우터를 호출합니다.")
+    parser.add_argument("--concurrency", default="1,8,32", help="쉼표로 구분한 동시성 단계")
+    parser.add_argument("--requests", type=int, default=500, help="단계별 요청 수")
+    parser.add_argument("--distinct", type=int, default=200, help="서로 다른 프롬프트 수")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--timeout", type=float, default=60.0, help="요청 타임아웃(초)")
+    args = parser.parse_args()
+
+    payloads = make_payloads(args.distinct, args.seed)
+    levels = [int(value) for value in args.concurrency.split(",") if value.strip()]
+
+    if args.url:
+        client = httpx.AsyncClient(
+            base_url=args.url,
+            timeout=args.timeout,
+            limits=httpx.Limits(max_connections=max(levels), max_keepalive_connections=max(levels)),
+        )
+    else:
+        client = build_in_process_client(args.timeout)
+
+    print(f"target={args.url or 'in-process'} backend={os.getenv('LLM_BACKEND', 'gemini')}")
+    print(f"{'conc':>5} {'reqs':>6} {'req/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}  statuses")
+    async with client:
+        for concurrency in levels:
+            result = await run_level(client, payloads, concurrency, args.requests)
+            print(
+                f"{result['concurrency']:>5} {result['requests']:>6} {result['throughput']:>9.1f} "
+                f"{result['p50']:>9.1f} {result['p95']:>9.1f} {result['p99']:>9.1f} {result['max']:>9.1f}  "
+                f"{result['statuses']}"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
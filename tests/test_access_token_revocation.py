@@ -0,0 +1,38 @@
+import time
+
+import pytest
+
+from app.core.exceptions.exceptions import TooManyRequestsError
+from app.feature.auth.access_token_verifier import RevocationList
+
+
+def test_revocations_are_not_evicted_before_expiry():
+    revoked = RevocationList(max_entries=2)
+    now = time.time()
+    revoked.add("first", now + 60)
+    revoked.add("second", now + 60)
+
+    with pytest.raises(TooManyRequestsError):
+        revoked.add("third", now + 60)
+
+    assert "first" in revoked and "second" in revoked
+    assert "third" not in revoked
+    assert revoked.stats()["rejected"] == 1
+
+
+def test_expired_revocations_free_capacity():
+    revoked = RevocationList(max_entries=1)
+    revoked.add("old", time.time() + 0.01)
+    time.sleep(0.02)
+
+    assert "old" not in revoked
+    revoked.add("new", time.time() + 60)
+    assert "new" in revoked and len(revoked) == 1
+
+
+def test_revoking_the_same_token_twice_keeps_one_entry():
+    revoked = RevocationList(max_entries=1)
+    now = time.time()
+    revoked.add("token", now + 60)
+    revoked.add("token", now + 60)
+    assert len(revoked) == 1
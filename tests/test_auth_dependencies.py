@@ -0,0 +1,18 @@
+import asyncio
+import inspect
+
+import pytest
+
+from app.core.exceptions.exceptions import InvalidTokenError
+from app.feature.auth import auth_dependencies
+
+
+@pytest.mark.parametrize("dependency", ["get_bearer_token", "get_current_token_claims", "get_current_user"])
+def test_auth_dependencies_run_on_the_event_loop(dependency):
+    # sync def 의존성은 FastAPI가 스레드 풀에서 실행하므로 인증 경로의 의존성은 모두 async여야 합니다.
+    assert inspect.iscoroutinefunction(getattr(auth_dependencies, dependency))
+
+
+def test_missing_bearer_token_is_rejected():
+    with pytest.raises(InvalidTokenError):
+        asyncio.run(auth_dependencies.get_bearer_token(None))
@@ -0,0 +1,69 @@
+from datetime import date
+
+import pytest
+
+from app.core.exceptions.exceptions import InvalidBoardingPassError
+from app.feature.LLM.bcbp_parser import parse_bcbp
+
+REFERENCE = date(2026, 5, 1)
+HEADER = "M1" + "HONG/GILDONG".ljust(20) + "E"
+
+
+def leg(departure="ICN", arrival="JFK", carrier="KE ", number="0081 ", day="123",
+        compartment="J", seat="012A", variable="") -> str:
+    """PNR(7) 출발(3) 도착(3) 항공사(3) 편명(5) 날짜(3) 등급(1) 좌석(4) 탑승순번(5) 상태(1) 가변길이(2) + 가변 영역"""
+    return (
+        "ABC123 " + departure + arrival + carrier + number + day + compartment + seat
+        + "0001 " + "1" + f"{len(variable):02X}" + variable
+    )
+
+
+def test_single_leg():
+    boarding_pass = parse_bcbp(HEADER + leg(), reference_date=REFERENCE)
+
+    assert boarding_pass.passenger_name == "HONG/GILDONG"
+    assert boarding_pass.electronic_ticket
+    [flight] = boarding_pass.legs
+    assert flight.airline == "KE"
+    assert flight.flight_number == "KE081"
+    assert (flight.departure_airport, flight.arrival_airport) == ("ICN", "JFK")
+    assert flight.departure_date == "2026-05-03"
+    assert (flight.seat_class, flight.seat_number) == ("Business", "12A")
+
+
+def test_multi_leg_skips_variable_section():
+    data = "M2" + HEADER[2:] + leg(variable="ABCDE") + leg(
+        departure="JFK", arrival="BOS", carrier="DL ", number="0123A", day="124", compartment="Y", seat="034C",
+    )
+
+    first, second = parse_bcbp(data, reference_date=REFERENCE).legs
+    assert first.flight_number == "KE081"
+    assert second.flight_number == "DL123A"
+    assert (second.departure_airport, second.arrival_airport) == ("JFK", "BOS")
+    assert (second.departure_date, second.seat_class, second.seat_number) == ("2026-05-04", "Economy", "34C")
+
+
+def test_julian_day_resolves_to_nearest_year():
+    flight = parse_bcbp(HEADER + leg(day="365"), reference_date=date(2026, 1, 5)).legs[0]
+    assert flight.departure_date == "2025-12-31"
+
+    flight = parse_bcbp(HEADER + leg(day="ABC"), reference_date=REFERENCE).legs[0]
+    assert flight.departure_date is None
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        "",
+        "X" + HEADER[1:] + leg(),
+        HEADER + leg()[:-5],
+        "M0" + HEADER[2:] + leg(),
+        "MX" + HEADER[2:] + leg(),
+        "M2" + HEADER[2:] + leg(),
+        HEADER + leg()[:-2] + "ZZ",
+    ],
+    ids=["empty", "format_code", "truncated", "zero_legs", "non_digit_legs", "missing_leg", "bad_variable_size"],
+)
+def test_malformed_input_is_rejected(data):
+    with pytest.raises(InvalidBoardingPassError):
+        parse_bcbp(data, reference_date=REFERENCE)
@@ -0,0 +1,42 @@
+import base64
+import json
+import time
+
+import pytest
+
+from app.core.exceptions.exceptions import InvalidTokenError
+from app.feature.auth import firebase_token_verifier as verifier_module
+from app.feature.auth.firebase_token_verifier import FirebaseTokenVerifier
+
+
+def segment(value) -> str:
+    return base64.urlsafe_b64encode(json.dumps(value).encode()).rstrip(b"=").decode()
+
+
+def make_verifier() -> FirebaseTokenVerifier:
+    verifier = FirebaseTokenVerifier(enabled=True, project_id="bimo", cache_ttl_seconds=60, cache_max_entries=10)
+    verifier._keys = {"kid-1": object()}
+    verifier._keys_expire_at = time.time() + 3600
+    return verifier
+
+
+@pytest.mark.parametrize(
+    "header",
+    [["RS256"], "RS256", 1, None, {"alg": "RS256", "kid": ["kid-1"]}, {"alg": "HS256", "kid": "kid-1"}],
+)
+def test_malformed_header_is_invalid_token(header):
+    token = f"{segment(header)}.{segment({'sub': 'uid'})}.c2ln"
+    with pytest.raises(InvalidTokenError):
+        make_verifier().verify_sync(token)
+
+
+def test_expired_keys_are_used_only_within_grace():
+    verifier = make_verifier()
+    assert verifier.available
+
+    verifier._keys_expire_at = time.time() - 1
+    assert verifier.available
+    assert verifier.stats()["keys_stale"]
+
+    verifier._keys_expire_at = time.time() - verifier_module._STALE_KEYS_GRACE_SECONDS - 1
+    assert not verifier.available
@@ -0,0 +1,95 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.core.exceptions.exceptions import InvalidImageError
+from app.feature.LLM import image_resolver as image_resolver_module
+from app.feature.LLM.image_resolver import ImageResolver, _check_fetch_url, _is_public_address
+from app.feature.LLM.llm_schemas import ImageAttachment
+
+PUBLIC_URL = "http://93.184.216.34/image.png"
+
+
+@pytest.mark.parametrize(
+    "address, expected",
+    [
+        ("93.184.216.34", True),
+        ("127.0.0.1", False),
+        ("10.1.2.3", False),
+        ("192.168.0.1", False),
+        ("169.254.169.254", False),
+        ("100.64.0.1", False),
+        ("0.0.0.0", False),
+        ("::1", False),
+        ("fe80::1%eth0", False),
+        ("::ffff:127.0.0.1", False),
+        ("224.0.0.1", False),
+    ],
+)
+def test_is_public_address(address, expected):
+    assert _is_public_address(address) is expected
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "http://169.254.169.254/latest/meta-data/",
+        "http://127.0.0.1:8000/metrics",
+        "http://[::1]/",
+        "ftp://93.184.216.34/image.png",
+    ],
+)
+def test_check_fetch_url_rejects_internal_addresses(url):
+    with pytest.raises(InvalidImageError):
+        asyncio.run(_check_fetch_url(url, []))
+
+
+def test_check_fetch_url_applies_allowlist():
+    asyncio.run(_check_fetch_url(PUBLIC_URL, ["93.184.216.34"]))
+    with pytest.raises(InvalidImageError):
+        asyncio.run(_check_fetch_url(PUBLIC_URL, ["*.example.com"]))
+
+
+def _resolver_with_transport(monkeypatch, handler) -> ImageResolver:
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler), follow_redirects=False)
+    monkeypatch.setattr(image_resolver_module.http_clients, "get", lambda name: client)
+    return ImageResolver(allowed_hosts=[], max_redirects=2)
+
+
+def test_fetch_rechecks_redirect_target(monkeypatch):
+    requested = []
+
+    def handler(request):
+        requested.append(str(request.url))
+        return httpx.Response(302, headers={"location": "http://169.254.169.254/latest/meta-data/"})
+
+    resolver = _resolver_with_transport(monkeypatch, handler)
+    with pytest.raises(InvalidImageError):
+        asyncio.run(resolver._fetch(PUBLIC_URL, None))
+    assert requested == [PUBLIC_URL]
+
+
+def test_fetch_follows_public_redirect(monkeypatch):
+    def handler(request):
+        if request.url.path == "/image.png":
+            return httpx.Response(301, headers={"location": "/moved.png"})
+        return httpx.Response(200, content=b"png-bytes", headers={"content-type": "image/png"})
+
+    resolver = _resolver_with_transport(monkeypatch, handler)
+    assert asyncio.run(resolver._fetch(PUBLIC_URL, None)) == (b"png-bytes", "image/png")
+
+
+def test_fetch_limits_redirect_count(monkeypatch):
+    resolver = _resolver_with_transport(
+        monkeypatch, lambda request: httpx.Response(302, headers={"location": PUBLIC_URL})
+    )
+    with pytest.raises(InvalidImageError):
+        asyncio.run(resolver._fetch(PUBLIC_URL, None))
+
+
+def test_invalid_base64_is_rejected_as_invalid_image():
+    resolver = ImageResolver(upload_min_bytes=1)
+    image = ImageAttachment(mime_type="image/png", base64_data="not*valid*base64!")
+    with pytest.raises(InvalidImageError):
+        asyncio.run(resolver._resolve_inline(image))
@@ -0,0 +1,53 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from app.feature.auth import auth_service
+from app.feature.auth.kakao_token_cache import KakaoTokenCache
+
+
+@pytest.fixture
+def kakao(monkeypatch):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        if request.url.path == "/v1/user/access_token_info":
+            return httpx.Response(200, json={"id": 1, "expires_in": 5})
+        return httpx.Response(200, json={"id": 1})
+
+    client = httpx.AsyncClient(base_url="https://kapi.kakao.com", transport=httpx.MockTransport(handler))
+    cache = KakaoTokenCache(
+        enabled=True, ttl_seconds=300, negative_ttl_seconds=30, max_entries=10, unknown_expiry_ttl_seconds=20,
+    )
+    monkeypatch.setattr(auth_service.http_clients, "get", lambda name: client)
+    monkeypatch.setattr(auth_service, "kakao_token_cache", cache)
+    return calls, cache
+
+
+def cached_ttl(cache: KakaoTokenCache) -> float:
+    [(expires_at, _, _)] = cache._cache._entries.values()
+    return expires_at - time.monotonic()
+
+
+def test_token_info_is_not_called_by_default(kakao, monkeypatch):
+    calls, cache = kakao
+    monkeypatch.setattr(auth_service, "KAKAO_TOKEN_INFO_ENABLED", False)
+
+    assert asyncio.run(auth_service.verify_kakao_token("token")) == {"id": 1}
+    assert calls == ["/v2/user/me"]
+    # 남은 수명을 모르므로 짧은 TTL로 캐시되며, 그동안 같은 토큰은 다시 조회하지 않습니다.
+    assert 0 < cached_ttl(cache) <= 20
+    assert asyncio.run(auth_service.verify_kakao_token("token")) == {"id": 1}
+    assert calls == ["/v2/user/me"]
+
+
+def test_token_info_is_opt_in_and_caps_ttl_by_token_lifetime(kakao, monkeypatch):
+    calls, cache = kakao
+    monkeypatch.setattr(auth_service, "KAKAO_TOKEN_INFO_ENABLED", True)
+
+    asyncio.run(auth_service.verify_kakao_token("token"))
+    assert sorted(calls) == ["/v1/user/access_token_info", "/v2/user/me"]
+    assert 0 < cached_ttl(cache) <= 5
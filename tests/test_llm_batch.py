@@ -0,0 +1,22 @@
+import asyncio
+
+from app.feature.LLM import llm_service
+from app.feature.LLM.llm_schemas import LLMChatRequest, LLMChatResponse
+
+
+def test_batch_items_share_one_deadline(monkeypatch):
+    deadlines = []
+
+    async def fake_completion(request, timeout_ms=None, deadline=None):
+        deadlines.append(deadline)
+        await asyncio.sleep(0.01)
+        return LLMChatResponse(model="fake", content=request.prompt)
+
+    monkeypatch.setattr(llm_service, "LLM_BATCH_CONCURRENCY", 1)
+    monkeypatch.setattr(llm_service, "generate_chat_completion", fake_completion)
+
+    requests = [LLMChatRequest(prompt=f"q{index}") for index in range(3)]
+    items = asyncio.run(llm_service.generate_batch_chat_completion(requests, timeout_ms=1000))
+
+    assert [item.response.content for item in items] == ["q0", "q1", "q2"]
+    assert len(set(deadlines)) == 1 and deadlines[0] is not None
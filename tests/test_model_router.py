@@ -0,0 +1,34 @@
+from app.feature.LLM.llm_schemas import ImageAttachment, LLMChatRequest, PromptTokenUsage
+from app.feature.LLM.model_router import ModelRouter
+
+TIERS = {"fast": "flash-8b", "standard": "flash", "advanced": "pro"}
+LONG_PROMPT = PromptTokenUsage(estimated_prompt_tokens=5000, estimated_context_tokens=0)
+
+
+def make_router(**overrides) -> ModelRouter:
+    options = {"tiers": TIERS, "enabled": True, "fast_max_tokens": 400, "advanced_min_images": 2}
+    options.update(overrides)
+    return ModelRouter(**options)
+
+
+def test_routing_is_off_by_default():
+    route = ModelRouter(tiers=TIERS).route(LLMChatRequest(prompt="hi", model_tier="advanced"), LONG_PROMPT, 5)
+    assert (route.tier, route.model_name) == ("standard", "flash")
+
+
+def test_client_cannot_request_advanced_tier():
+    router = make_router()
+    route = router.route(LLMChatRequest(prompt="hi", model_tier="advanced"), LONG_PROMPT, 0)
+    assert route.tier == "standard"
+
+    route = router.route(LLMChatRequest(prompt="hi", model_tier="fast"), LONG_PROMPT, 0)
+    assert (route.tier, route.reason) == ("fast", "hint")
+
+
+def test_image_count_after_dedup_decides_advanced():
+    router = make_router()
+    request = LLMChatRequest(prompt="hi", images=[ImageAttachment(base64_data="aGVsbG8=")] * 3)
+
+    # 원본 요청의 이미지 수가 아니라 중복 제거 후 실제로 프롬프트에 들어간 수를 기준으로 합니다.
+    assert router.route(request, LONG_PROMPT, 1).tier == "standard"
+    assert router.route(request, LONG_PROMPT, 2).tier == "advanced"
@@ -0,0 +1,212 @@
+import asyncio
+import copy
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.exceptions.exceptions import InvalidTokenError, TokenExpiredError, TokenRevokedError
+from app.feature.auth import refresh_token_store as store_module
+from app.feature.auth.refresh_token_store import (
+    EXPIRED,
+    INVALID,
+    REUSE_DETECTED,
+    RETRY_REJECTED,
+    REVOKED,
+    ROTATED,
+    RefreshTokenFamily,
+    RefreshTokenStore,
+    evaluate_rotation,
+)
+
+
+class FakeSnapshot:
+    def __init__(self, document):
+        self._document = copy.deepcopy(document)
+        self.exists = document is not None
+
+    def to_dict(self):
+        return copy.deepcopy(self._document)
+
+
+class FakeDocument:
+    def __init__(self, documents: dict, document_id: str) -> None:
+        self._documents = documents
+        self._id = document_id
+
+    def get(self, transaction=None):
+        return FakeSnapshot(self._documents.get(self._id))
+
+    def set(self, document):
+        self._documents[self._id] = copy.deepcopy(document)
+
+    def update(self, fields):
+        self._documents[self._id].update(fields)
+
+
+class FakeCollection:
+    def __init__(self) -> None:
+        self.documents = {}
+
+    def document(self, document_id):
+        return FakeDocument(self.documents, document_id)
+
+
+class FakeTransaction:
+    def set(self, reference, document):
+        reference.set(document)
+
+    def update(self, reference, fields):
+        reference.update(fields)
+
+
+@pytest.fixture(autouse=True)
+def fake_firestore(monkeypatch):
+    monkeypatch.setattr(store_module, "firestore", SimpleNamespace(transactional=lambda fn: fn))
+
+
+def make_store(collection: FakeCollection, reuse_grace_seconds: int = 10) -> RefreshTokenStore:
+    client = SimpleNamespace(transaction=FakeTransaction)
+    return RefreshTokenStore(collection, client=client, reuse_grace_seconds=reuse_grace_seconds)
+
+
+def family(**overrides) -> RefreshTokenFamily:
+    values = dict(uid="u1", generation=3, secret_hash="current", expires_at=time.time() + 60,
+                  previous_secret_hash="previous", rotated_at=time.time())
+    values.update(overrides)
+    return RefreshTokenFamily(**values)
+
+
+@pytest.mark.parametrize(
+    "state, generation, secret_hash, expected",
+    [
+        (family(), 3, "current", ROTATED),
+        (family(), 2, "previous", RETRY_REJECTED),
+        (family(rotated_at=time.time() - 60), 2, "previous", REUSE_DETECTED),
+        (family(), 1, "older", REUSE_DETECTED),
+        (family(), 3, "wrong", INVALID),
+        (family(), 4, "future", INVALID),
+        (family(revoked=True), 3, "current", REVOKED),
+        (None, 0, "current", REVOKED),
+        (family(expires_at=time.time() - 1), 3, "current", EXPIRED),
+    ],
+)
+def test_evaluate_rotation(state, generation, secret_hash, expected):
+    assert evaluate_rotation(state, generation, secret_hash, time.time(), 10) == expected
+
+
+def test_rotation_chain_and_reuse_revokes_family():
+    async def scenario():
+        store = make_store(FakeCollection(), reuse_grace_seconds=0)
+        first = await store.issue("u1")
+        uid, second = await store.rotate(first)
+        assert uid == "u1"
+        _, third = await store.rotate(second)
+
+        with pytest.raises(TokenRevokedError):
+            await store.rotate(first)
+        with pytest.raises(TokenRevokedError):
+            await store.rotate(third)
+
+    asyncio.run(scenario())
+
+
+def test_retry_within_grace_is_rejected_without_revoking():
+    async def scenario():
+        store = make_store(FakeCollection(), reuse_grace_seconds=10)
+        first = await store.issue("u1")
+        _, second = await store.rotate(first)
+
+        with pytest.raises(InvalidTokenError):
+            await store.rotate(first)
+        uid, _ = await store.rotate(second)
+        assert uid == "u1"
+
+    asyncio.run(scenario())
+
+
+def test_rotation_on_another_instance_is_seen_by_stale_instance():
+    async def scenario():
+        collection = FakeCollection()
+        instance_a, instance_b = make_store(collection, 0), make_store(collection, 0)
+        first = await instance_a.issue("u1")
+        _, second = await instance_a.rotate(first)
+
+        _, third = await instance_b.rotate(second)
+        # instance_a가 마지막으로 본 세대(second)를 다시 써도 재사용으로 탐지되어야 합니다.
+        with pytest.raises(TokenRevokedError):
+            await instance_a.rotate(second)
+        with pytest.raises(TokenRevokedError):
+            await instance_b.rotate(third)
+
+    asyncio.run(scenario())
+
+
+def test_expired_and_revoked_tokens():
+    async def scenario():
+        collection = FakeCollection()
+        store = make_store(collection)
+        token = await store.issue("u1")
+        family_id = token.split(".")[0]
+
+        collection.documents[family_id]["expires_at"] = time.time() - 1
+        with pytest.raises(TokenExpiredError):
+            await store.rotate(token)
+
+        collection.documents[family_id]["expires_at"] = time.time() + 60
+        await store.revoke(token, uid="u1")
+        with pytest.raises(TokenRevokedError):
+            await store.rotate(token)
+        # 이미 폐기된 계열을 다시 로그아웃해도 성공합니다.
+        await store.revoke(token, uid="u1")
+
+    asyncio.run(scenario())
+
+
+def test_malformed_token_is_invalid():
+    store = make_store(FakeCollection())
+    for token in ("", "a.b.c", "a..c", "a.1"):
+        with pytest.raises(InvalidTokenError):
+            asyncio.run(store.rotate(token))
+
+
+def test_retry_after_grace_revokes_family():
+    async def scenario():
+        collection = FakeCollection()
+        store = make_store(collection, reuse_grace_seconds=10)
+        first = await store.issue("u1")
+        _, second = await store.rotate(first)
+
+        collection.documents[first.split(".")[0]]["rotated_at"] = time.time() - 60
+        with pytest.raises(TokenRevokedError):
+            await store.rotate(first)
+        with pytest.raises(TokenRevokedError):
+            await store.rotate(second)
+
+    asyncio.run(scenario())
+
+
+def test_revoke_requires_owner_and_secret():
+    async def scenario():
+        collection = FakeCollection()
+        store = make_store(collection)
+        first = await store.issue("u1")
+        family_id = first.split(".")[0]
+
+        for token, uid in (
+            (first, "attacker"),
+            (f"{family_id}.0.guessed", "u1"),
+            (f"{family_id}.5.guessed", "u1"),
+            ("unknown.0.secret", "u1"),
+            ("not-a-token", "u1"),
+        ):
+            with pytest.raises(InvalidTokenError):
+                await store.revoke(token, uid=uid)
+        assert not collection.documents[family_id]["revoked"]
+
+        # 갱신 응답을 받지 못한 클라이언트의 직전 세대 토큰으로도 로그아웃할 수 있습니다.
+        await store.rotate(first)
+        await store.revoke(first, uid="u1")
+        assert collection.documents[family_id]["revoked"]
+
+    asyncio.run(scenario())
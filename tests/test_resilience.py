@@ -0,0 +1,167 @@
+import asyncio
+
+import pytest
+
+from app.core.exceptions.exceptions import ExternalApiError, TooManyRequestsError
+from app.feature.LLM.gemini_client import GeminiClient
+from app.feature.LLM.llm_backends import LLMBackend
+from app.shared.resilience import CircuitBreaker
+
+
+class EchoBackend(LLMBackend):
+    name = "echo"
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def generate(self, prompt_segments, system_instruction, model_name) -> str:
+        self.calls += 1
+        return "ok"
+
+    async def open_stream(self, prompt_segments, system_instruction, model_name):
+        self.calls += 1
+
+        async def chunks():
+            yield "ok"
+
+        return chunks()
+
+
+def half_open_client() -> GeminiClient:
+    """동시 실행 1, 대기열 0이고 서킷이 half_open인 클라이언트."""
+    client = GeminiClient(backend=EchoBackend(), max_concurrency=1, max_queue=0)
+    client._breaker = CircuitBreaker(failure_threshold=1, recovery_seconds=0)
+    client._breaker.record_failure()
+    assert client.circuit_state() == "half_open"
+    return client
+
+
+async def hold_slot(client: GeminiClient, release: asyncio.Event, held: asyncio.Event) -> None:
+    async with client._limiter.acquire():
+        held.set()
+        await release.wait()
+
+
+def test_breaker_allows_single_probe_until_released():
+    breaker = CircuitBreaker(failure_threshold=1, recovery_seconds=0)
+    breaker.record_failure()
+    assert breaker.allow_request() is True
+    assert breaker.allow_request() is False
+    breaker.release_probe()
+    assert breaker.state == "half_open"
+    assert breaker.allow_request() is True
+
+
+def test_release_probe_after_outcome_keeps_state():
+    breaker = CircuitBreaker(failure_threshold=1, recovery_seconds=60)
+    breaker.record_failure()
+    breaker.release_probe()
+    assert breaker.state == "open"
+    assert breaker.allow_request() is False
+
+
+def test_half_open_probe_rejected_by_limiter_does_not_wedge_circuit():
+    async def scenario():
+        client = half_open_client()
+        release, held = asyncio.Event(), asyncio.Event()
+        holder = asyncio.create_task(hold_slot(client, release, held))
+        await held.wait()
+
+        with pytest.raises(TooManyRequestsError):
+            await client.generate(["hi"], "system")
+
+        release.set()
+        await holder
+        assert await client.generate(["hi"], "system") == "ok"
+        assert client.circuit_state() == "closed"
+
+    asyncio.run(scenario())
+
+
+def test_half_open_stream_rejected_by_limiter_does_not_wedge_circuit():
+    async def scenario():
+        client = half_open_client()
+        release, held = asyncio.Event(), asyncio.Event()
+        holder = asyncio.create_task(hold_slot(client, release, held))
+        await held.wait()
+
+        with pytest.raises(TooManyRequestsError):
+            async for _ in client.generate_stream(["hi"], "system"):
+                pass
+
+        release.set()
+        await holder
+        assert [chunk async for chunk in client.generate_stream(["hi"], "system")] == ["ok"]
+        assert client.circuit_state() == "closed"
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_probe_does_not_wedge_circuit():
+    async def scenario():
+        client = half_open_client()
+        started = asyncio.Event()
+
+        async def slow_generate(prompt_segments, system_instruction, model_name):
+            started.set()
+            await asyncio.sleep(60)
+
+        client.backend.generate = slow_generate
+        probe = asyncio.create_task(client.generate(["hi"], "system"))
+        await started.wait()
+        with pytest.raises(ExternalApiError):
+            await client.generate(["hi"], "system")
+
+        probe.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await probe
+        del client.backend.generate
+        assert await client.generate(["hi"], "system") == "ok"
+
+    asyncio.run(scenario())
+
+
+class FailingBackend(EchoBackend):
+    """매 호출이 일시적 오류(ConnectionError)로 실패하는 백엔드. stream은 첫 청크 뒤에 끊깁니다."""
+
+    async def generate(self, prompt_segments, system_instruction, model_name) -> str:
+        self.calls += 1
+        raise ConnectionError("upstream unavailable")
+
+    async def open_stream(self, prompt_segments, system_instruction, model_name):
+        self.calls += 1
+
+        async def chunks():
+            yield "partial"
+            raise ConnectionError("stream reset")
+
+        return chunks()
+
+
+def failing_client(failure_threshold: int) -> GeminiClient:
+    client = GeminiClient(backend=FailingBackend(), max_concurrency=4, max_queue=4)
+    client._breaker = CircuitBreaker(failure_threshold=failure_threshold, recovery_seconds=60)
+    client._max_retries = 5
+    client._retry_base_delay = 0
+    return client
+
+
+def test_retries_stop_once_the_circuit_opens():
+    client = failing_client(failure_threshold=2)
+
+    with pytest.raises(ExternalApiError):
+        asyncio.run(client.generate(["hi"], "system"))
+    assert client.backend.calls == 2
+    assert client.circuit_state() == "open"
+
+
+def test_stream_errors_after_open_are_recorded_on_the_breaker():
+    async def consume(client: GeminiClient) -> None:
+        with pytest.raises(ExternalApiError):
+            async for _ in client.generate_stream(["hi"], "system"):
+                pass
+
+    client = failing_client(failure_threshold=2)
+    asyncio.run(consume(client))
+    asyncio.run(consume(client))
+    assert client.circuit_state() == "open"
@@ -0,0 +1,178 @@
+import random
+
+import pytest
+
+from app.feature.LLM import semantic_cache as semantic_cache_module
+from app.feature.LLM.semantic_cache import (
+    SemanticCache,
+    _token_hash,
+    build_scope,
+    normalize_tokens,
+    order_sensitive_key,
+    simhash,
+)
+
+MODEL = "gemini-1.5-flash"
+SYSTEM = "system"
+CONTEXT = [f"turn {index}: tell me about the KE081 business class seat, lounge and service" for index in range(20)]
+
+
+def make_cache() -> SemanticCache:
+    return SemanticCache(enabled=True, max_distance=3, max_entries=100, ttl_seconds=60)
+
+
+def distance(first: str, second: str) -> int:
+    return (simhash(normalize_tokens(first)) ^ simhash(normalize_tokens(second))).bit_count()
+
+
+def scope_for(prompt: str) -> int:
+    return build_scope(MODEL, SYSTEM, [], order_key=order_sensitive_key(prompt))
+
+
+def test_paraphrase_with_stopwords_and_flight_format_hits():
+    cache = make_cache()
+    scope = build_scope(MODEL, SYSTEM, [])
+    cache.store(scope, normalize_tokens("What is the baggage allowance on KE 81?"), "answer")
+    assert cache.lookup(scope, normalize_tokens("baggage allowance for ke081 please")) == "answer"
+
+
+@pytest.mark.parametrize(
+    "stored, query",
+    [
+        ("KE081 business seat review", "review business seat on KE 081"),
+        ("KE081 meal options", "meal options on KE 81"),
+        ("Is the wifi fast on KE081", "is the wifi on KE081 fast"),
+    ],
+)
+def test_reordered_rewording_hits(stored, query):
+    assert scope_for(stored) == scope_for(query)
+    cache = make_cache()
+    cache.store(scope_for(stored), normalize_tokens(stored), "answer")
+    assert cache.lookup(scope_for(query), normalize_tokens(query)) == "answer"
+
+
+@pytest.mark.parametrize(
+    "stored, query",
+    [
+        ("Is seat 12A better than 14C?", "Is seat 14C better than 12A?"),
+        ("Is there wifi but not power on KE081", "Is there power but not wifi on KE081"),
+        ("12A가 14C보다 넓나요", "14C가 12A보다 넓나요"),
+    ],
+)
+def test_reversed_comparison_or_negation_is_not_a_hit(stored, query):
+    cache = make_cache()
+    cache.store(scope_for(stored), normalize_tokens(stored), "answer")
+    assert cache.lookup(scope_for(query), normalize_tokens(query)) is None
+
+
+def test_shared_long_context_does_not_make_different_questions_hit():
+    cache = make_cache()
+    scope = build_scope(MODEL, SYSTEM, [], context=CONTEXT)
+    cache.store(scope, normalize_tokens("what about meals"), "meals")
+    assert cache.lookup(scope, normalize_tokens("what about the wifi speed")) is None
+    assert cache.lookup(scope, normalize_tokens("What about meals?")) == "meals"
+
+
+def test_context_is_part_of_the_exact_scope():
+    assert build_scope(MODEL, SYSTEM, [], context=CONTEXT) != build_scope(MODEL, SYSTEM, [])
+    assert build_scope(MODEL, SYSTEM, [], context=CONTEXT) != build_scope(MODEL, SYSTEM, [], context=CONTEXT[1:])
+    assert build_scope(MODEL, SYSTEM, [], context=["a  b"]) == build_scope(MODEL, SYSTEM, [], context=["a b"])
+
+
+def test_single_word_change_is_not_a_hit():
+    assert distance("Is the wifi fast on KE081", "Is the wifi slow on KE081") > 3
+
+
+def naive_simhash(tokens) -> int:
+    hashes = [_token_hash(token) for token in tokens]
+    result = 0
+    for bit in range(64):
+        if sum((value >> bit) & 1 for value in hashes) * 2 > len(hashes):
+            result |= 1 << bit
+    return result
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 4, 7, 8, 16, 33, 100])
+def test_simhash_matches_bitwise_majority(size):
+    rng = random.Random(size)
+    tokens = [f"token{rng.randrange(1000)}" for _ in range(size)]
+    assert simhash(tokens) == naive_simhash(tokens)
+    assert simhash([]) == 0
+
+
+@pytest.mark.parametrize("max_distance", [0, 3, 7])
+def test_bands_cover_all_64_bits(max_distance):
+    bands = SemanticCache._make_bands(max_distance + 1)
+    assert len(bands) == max_distance + 1
+    covered = 0
+    for shift, mask in bands:
+        assert covered & (mask << shift) == 0
+        covered |= mask << shift
+    assert covered == (1 << 64) - 1
+
+
+def flip_bits(fingerprint: int, positions) -> int:
+    for position in positions:
+        fingerprint ^= 1 << position
+    return fingerprint
+
+
+def test_banded_lookup_finds_every_fingerprint_within_distance():
+    rng = random.Random(7)
+    cache = make_cache()
+    for _ in range(200):
+        fingerprint = rng.getrandbits(64)
+        cache.store_fingerprint(1, fingerprint, "answer")
+        for distance in range(cache.max_distance + 1):
+            query = flip_bits(fingerprint, rng.sample(range(64), distance))
+            assert cache.lookup_fingerprint(1, query) == "answer"
+
+
+def test_banded_lookup_misses_beyond_distance_and_across_scopes():
+    cache = make_cache()
+    fingerprint = 0x0123456789ABCDEF
+    cache.store_fingerprint(1, fingerprint, "answer")
+
+    assert cache.lookup_fingerprint(1, flip_bits(fingerprint, range(cache.max_distance + 1))) is None
+    assert cache.lookup_fingerprint(2, fingerprint) is None
+
+
+def test_banded_lookup_prefers_the_closest_entry():
+    cache = make_cache()
+    cache.store_fingerprint(1, flip_bits(0, [1, 2, 3]), "far")
+    cache.store_fingerprint(1, flip_bits(0, [1]), "near")
+    assert cache.lookup_fingerprint(1, 0) == "near"
+
+
+def test_eviction_removes_entries_from_band_index():
+    cache = SemanticCache(enabled=True, max_distance=3, max_entries=2, ttl_seconds=60)
+    for index, fingerprint in enumerate([0, (1 << 64) - 1, 0x5555555555555555]):
+        cache.store_fingerprint(1, fingerprint, str(index))
+
+    assert len(cache) == 2
+    assert cache.lookup_fingerprint(1, 0) is None
+    assert sum(len(bucket) for index in cache._index for bucket in index.values()) == 2 * len(cache._bands)
+
+
+def test_storing_the_same_fingerprint_replaces_the_entry():
+    cache = make_cache()
+    cache.store_fingerprint(1, 42, "old")
+    cache.store_fingerprint(1, 42, "new")
+
+    assert len(cache) == 1
+    assert cache.lookup_fingerprint(1, 42) == "new"
+    assert all(len(bucket) == 1 for index in cache._index for bucket in index.values())
+
+
+def test_expired_entries_are_purged_on_lookup(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(semantic_cache_module.time, "monotonic", lambda: clock[0])
+    cache = make_cache()
+    cache.store_fingerprint(1, 42, "answer")
+    cache.store_fingerprint(2, 7, "other")
+
+    clock[0] += cache.ttl_seconds + 1
+    assert cache.lookup_fingerprint(1, 42) is None
+    assert len(cache) == 1
+    assert all(key[0] == 2 for index in cache._index for key in index)
+    assert cache.stats()["expired"] == 1
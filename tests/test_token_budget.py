@@ -0,0 +1,29 @@
+import pytest
+
+from app.feature.LLM import llm_service
+from app.feature.LLM.llm_schemas import LLMChatRequest
+from app.feature.LLM.token_budget import fit_context_to_budget
+
+
+@pytest.mark.parametrize(
+    "server_budget, requested, expected",
+    [(8000, None, 8000), (8000, 2000, 2000), (8000, 1_000_000, 8000), (0, 2000, 2000), (0, None, 0)],
+)
+def test_request_budget_cannot_exceed_server_budget(monkeypatch, server_budget, requested, expected):
+    monkeypatch.setattr(llm_service, "LLM_PROMPT_TOKEN_BUDGET", server_budget)
+    request = LLMChatRequest(prompt="hi", max_prompt_tokens=requested)
+    assert llm_service._resolve_token_budget(request) == expected
+
+
+def test_older_turns_are_not_kept_after_one_does_not_fit():
+    # 최신부터: "newest!!"(2토큰) -> "x" * 100(25토큰, 예산 초과)에서 멈추므로 "old"는 넣지 않습니다.
+    context = ["old", "x" * 100, "newest!!"]
+    selection = fit_context_to_budget(context, available_tokens=5)
+    assert selection.context == ["newest!!"]
+    assert selection.dropped_count == 2
+
+
+def test_each_priority_keeps_its_newest_contiguous_turns():
+    context = ["pinned", "old", "x" * 100, "new"]
+    selection = fit_context_to_budget(context, available_tokens=5, priorities=[1, 0, 0, 0])
+    assert selection.context == ["pinned", "new"]
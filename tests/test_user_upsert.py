@@ -0,0 +1,132 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from app.feature.auth import auth_service
+from app.feature.auth.auth_schemas import UserInDB
+from app.feature.auth.login_write_behind import LastLoginWriteBehind
+
+NOW = datetime(2026, 5, 1, 12, 0, 0, 123456, tzinfo=timezone.utc)
+
+
+class Minimum:
+    def __init__(self, value):
+        self.value = value
+
+
+class FakeUserRef:
+    """set(merge=True) + Minimum 변환만 흉내 내는 사용자 문서."""
+
+    def __init__(self, document=None):
+        self.document = document
+        self.calls = []
+
+    def set(self, fields, merge=False):
+        self.calls.append("set")
+        document = dict(self.document or {})
+        for key, value in fields.items():
+            if isinstance(value, Minimum):
+                current = document.get(key)
+                value = value.value if current is None else min(current, value.value)
+            document[key] = value
+        self.document = document
+        result = SimpleNamespace(integer_value=document["created_at_us"])
+        return SimpleNamespace(transform_results=[result])
+
+    def get(self):
+        self.calls.append("get")
+        return SimpleNamespace(to_dict=lambda: dict(self.document) if self.document else None)
+
+    def update(self, fields):
+        self.calls.append("update")
+        self.document.update(fields)
+
+
+@pytest.fixture(autouse=True)
+def fake_firestore(monkeypatch):
+    monkeypatch.setattr(auth_service, "firestore", SimpleNamespace(Minimum=Minimum))
+
+
+def profile(**overrides) -> dict:
+    values = dict(uid="u1", email="a@example.com", display_name="A", photo_url="https://p/a.png",
+                  provider_id="google.com")
+    values.update(overrides)
+    return values
+
+
+def stored(**overrides) -> dict:
+    created = NOW - timedelta(days=10)
+    values = dict(profile(), created_at_us=auth_service._to_epoch_us(created), last_login_at="old")
+    values.update(overrides)
+    return values
+
+
+def test_new_user_costs_set_and_get_only():
+    user_ref = FakeUserRef()
+    user = auth_service._upsert_user_sync(user_ref, profile(), NOW)
+
+    assert user_ref.calls == ["set", "get"]
+    assert user.created_at == NOW.isoformat()
+    assert user.last_login_at == NOW.isoformat()
+
+
+def test_returning_user_is_a_single_write():
+    user_ref = FakeUserRef(stored())
+    user = auth_service._upsert_user_sync(user_ref, profile(), NOW)
+
+    assert user_ref.calls == ["set"]
+    assert user.created_at == (NOW - timedelta(days=10)).isoformat()
+
+
+def test_missing_token_fields_do_not_overwrite_stored_profile():
+    user_ref = FakeUserRef(stored())
+    user = auth_service._upsert_user_sync(user_ref, profile(email=None, photo_url=None), NOW)
+
+    assert user_ref.document["email"] == "a@example.com"
+    assert user_ref.document["photo_url"] == "https://p/a.png"
+    assert user.email == "a@example.com"
+    assert user_ref.calls == ["set", "get"]
+
+
+def test_missing_token_fields_are_filled_from_cached_profile():
+    user_ref = FakeUserRef(stored())
+    cached = UserInDB(**profile(), created_at="c", last_login_at="old")
+    user = auth_service._upsert_user_sync(user_ref, profile(email=None), NOW, cached)
+
+    assert user.email == "a@example.com"
+    assert user_ref.calls == ["set"]
+
+
+def test_legacy_document_keeps_original_created_at():
+    legacy_created_at = (NOW - timedelta(days=400)).isoformat()
+    user_ref = FakeUserRef({**profile(), "created_at": legacy_created_at, "last_login_at": "old"})
+    user = auth_service._upsert_user_sync(user_ref, profile(), NOW)
+
+    assert user.created_at == legacy_created_at
+    assert user_ref.document["created_at"] == legacy_created_at
+    assert user_ref.document["created_at_us"] == auth_service._to_epoch_us(NOW - timedelta(days=400))
+
+
+def test_write_behind_commits_merge_sets_through_public_client():
+    operations = []
+
+    class FakeBatch:
+        def set(self, reference, fields, merge=False):
+            operations.append((reference, fields, merge))
+
+        def commit(self):
+            operations.append("commit")
+
+    collection = SimpleNamespace(document=lambda uid: f"users/{uid}")
+    write_behind = LastLoginWriteBehind(collection, client=SimpleNamespace(batch=FakeBatch), enabled=True)
+    cached = UserInDB(**profile(), created_at="c", last_login_at="old")
+
+    async def scenario():
+        assert write_behind.record_login(cached, profile(email=None), "t1") is not None
+        assert write_behind.record_login(cached, profile(display_name="B"), "t2") is None
+        await write_behind.flush()
+
+    asyncio.run(scenario())
+    assert operations == [("users/u1", {"last_login_at": "t1"}, True), "commit"]